@@ -60,6 +60,20 @@ For more information, see docs/README.md
                         help="Chrome debugging port (default: 9222)")
     parser.add_argument("--slow", action="store_true", 
                         help="Enable slow mode with human-like delays (recommended)")
+    parser.add_argument("--download-workers", type=int, default=3, metavar="N",
+                        help="Number of parallel background downloads (default: 3)")
+    parser.add_argument("--capture-network", action="store_true",
+                        help="Read remix lists, video URLs and metadata from the page's API responses")
+    parser.add_argument("--by-url", action="store_true",
+                        help="Collect all remix URLs first, then visit each one directly")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Batch mode: process N URLs at once, one Chrome instance each (default: 1)")
+    parser.add_argument("--fast-load", action="store_true",
+                        help="Headless Chrome that skips images, fonts and media (much faster, less bandwidth)")
+    parser.add_argument("--browser-cache", type=str, default=None, metavar="DIR",
+                        help="HTTP cache directory of --fast-load (default: ~/.cache/sora-scraper/chrome-cache)")
+    parser.add_argument("--content-index", type=str, default=None, metavar="FILE",
+                        help="SQLite index of already scraped posts (default: <output>/.content_index.db)")
     
     args = parser.parse_args()
     
@@ -88,6 +102,19 @@ For more information, see docs/README.md
         sys.argv.extend(['--debug-port', str(args.debug_port)])
     if args.slow:
         sys.argv.append('--slow')
+    sys.argv.extend(['--download-workers', str(args.download_workers)])
+    if args.capture_network:
+        sys.argv.append('--capture-network')
+    if args.by_url:
+        sys.argv.append('--by-url')
+    if args.parallel > 1:
+        sys.argv.extend(['--parallel', str(args.parallel)])
+    if args.content_index:
+        sys.argv.extend(['--content-index', args.content_index])
+    if args.fast_load:
+        sys.argv.append('--fast-load')
+    if args.browser_cache:
+        sys.argv.extend(['--browser-cache', args.browser_cache])
     
     scraper_main()
 
@@ -1,21 +1,145 @@
 #!/usr/bin/env python3
 """
 Browser Manager - Handles Chrome WebDriver setup and configuration
+
+The chromedriver path is resolved once and cached on disk (webdriver-manager is only
+asked again when the cache is a week old, and an offline run falls back to the cached
+or PATH driver), and one chromedriver process serves every browser session of the
+process: setting up a new session, or recovering a lost one, only launches Chrome.
 """
 
+import atexit
+import json
+import pathlib
+import shutil
+import threading
+import time
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Default on-disk HTTP cache of the fast-load profile, shared by every run
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "sora-scraper" / "chrome-cache"
+
+# Requests the fast-load profile never lets through: metadata comes from the DOM (and
+# API responses), and videos are downloaded over HTTP outside the browser, so images,
+# fonts and media segments are only wasted bandwidth. Attributes like <img src> and
+# <video src> are still set, so avatar and video URLs can be read as usual.
+BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "ico",
+    "woff", "woff2", "ttf", "otf",
+    "mp4", "webm", "m4s", "m3u8", "mp3", "m4a",
+]
+# Signed CDN URLs carry a query string, hence the second pattern
+BLOCKED_URL_PATTERNS = [pattern for ext in BLOCKED_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+# Resolved chromedriver path, reused for a week before webdriver-manager is asked again
+DRIVER_CACHE_FILE = DEFAULT_CACHE_DIR.parent / "chromedriver.json"
+DRIVER_CACHE_MAX_AGE = 7 * 24 * 3600
+
+_driver_lock = threading.Lock()
+_driver_path = None
+_shared_service = None
+
+
+def _read_driver_cache():
+    try:
+        with open(DRIVER_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    path = cached.get("path")
+    if not path or not pathlib.Path(path).is_file():
+        return None, None
+    return path, cached.get("resolved_at", 0)
+
+
+def resolve_chromedriver_path(max_age=DRIVER_CACHE_MAX_AGE):
+    """
+    Path of the chromedriver binary, resolved at most once per process
+    
+    Order: fresh on-disk cache, webdriver-manager (may download), stale cache, chromedriver
+    on PATH. None means nothing was found and Selenium Manager is left to find a driver.
+    
+    Returns:
+        str: Path of chromedriver, or None
+    """
+    global _driver_path
+    with _driver_lock:
+        if _driver_path and pathlib.Path(_driver_path).is_file():
+            return _driver_path
+        
+        cached_path, resolved_at = _read_driver_cache()
+        if cached_path and time.time() - resolved_at < max_age:
+            _driver_path = cached_path
+            return _driver_path
+        
+        try:
+            _driver_path = ChromeDriverManager().install()
+            DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(DRIVER_CACHE_FILE, 'w') as f:
+                json.dump({"path": _driver_path, "resolved_at": time.time()}, f)
+            return _driver_path
+        except Exception as e:
+            fallback = cached_path or shutil.which("chromedriver")
+            print(f"⚠️  Could not resolve chromedriver ({e}), using {fallback or 'Selenium Manager'}")
+            _driver_path = fallback
+            return _driver_path
+
+
+class PersistentService(Service):
+    """
+    chromedriver service that survives driver.quit(), so the next session skips starting
+    the driver process. shutdown() really stops it (done at exit).
+    """
+    
+    def start(self):
+        process = getattr(self, "process", None)
+        if process is not None and process.poll() is None and self.is_connectable():
+            return
+        super().start()
+    
+    def stop(self):
+        pass
+    
+    def shutdown(self):
+        if getattr(self, "process", None) is not None:
+            super().stop()
+
+
+def get_shared_service():
+    """The process-wide chromedriver service (started on first use by webdriver.Chrome)"""
+    global _shared_service
+    path = resolve_chromedriver_path()
+    with _driver_lock:
+        if _shared_service is None:
+            _shared_service = PersistentService(path) if path else PersistentService()
+            atexit.register(_shared_service.shutdown)
+        return _shared_service
+
 
 class BrowserManager:
     """Manages Chrome browser setup and lifecycle"""
     
-    def __init__(self, use_existing=False, debug_port=9222):
+    def __init__(self, use_existing=False, debug_port=9222, capture_network=False, fast_load=False,
+                 cache_dir=None):
+        """
+        Args:
+            use_existing: Connect to a Chrome started with --remote-debugging-port
+            debug_port: Remote debugging port of that Chrome
+            capture_network: Record network events in the performance log (read by NetworkCapture)
+            fast_load: Headless Chrome that skips images, fonts and media, with autoplay off,
+                a smaller viewport and an on-disk HTTP cache (new sessions only)
+            cache_dir: HTTP cache directory of the fast-load profile (default: DEFAULT_CACHE_DIR)
+        """
         self.driver = None
         self.use_existing = use_existing
         self.debug_port = debug_port
+        self.capture_network = capture_network
+        self.fast_load = fast_load and not use_existing
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
     
     def setup(self):
         """Setup and return Chrome WebDriver"""
@@ -37,19 +161,63 @@ class BrowserManager:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            if self.fast_load:
+                self._add_fast_load_options(chrome_options)
+            else:
+                chrome_options.add_argument("--window-size=1920,1080")
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.capture_network:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
+        self.driver = webdriver.Chrome(service=get_shared_service(), options=chrome_options)
         
         if not self.use_existing:
             # Hide automation markers
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        if self.fast_load:
+            self._block_resources()
+        
         print("✅ Browser ready!\n")
         return self.driver
     
+    def _add_fast_load_options(self, chrome_options):
+        """Headless, small viewport, no autoplay, no images, shared disk cache"""
+        print("⚡ Fast-load profile: headless, no images/fonts/media")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1280,800")
+        chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument(f"--disk-cache-dir={self.cache_dir}")
+        chrome_options.add_argument("--disk-cache-size=536870912")
+    
+    def _block_resources(self):
+        """Block image, font and media requests at the network level (CDP)"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"⚠️  Could not block resources: {e}")
+    
+    def restart(self):
+        """
+        Quit the current session (if still alive) and start a new one on the same
+        chromedriver process
+        
+        Returns:
+            webdriver.Chrome: The new driver
+        """
+        if self.driver is not None and not self.use_existing:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        return self.setup()
+    
     def close(self):
         """Close the browser"""
         if self.driver and not self.use_existing:
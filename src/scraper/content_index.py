@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Content Index - Remembers which Sora posts and videos were already scraped
+
+A small SQLite database shared by every run (and every URL of a batch), keyed by Sora
+post id, by video URL path (signed query strings stripped) and by file hash. The
+scraper checks it before extracting metadata and before downloading, so overlapping
+remix trees and re-runs don't fetch the same remix twice.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+_COLUMNS = {"page_url", "video_key", "video_path", "metadata_path", "sha256", "size"}
+
+
+class ContentIndex:
+    """SQLite index of scraped posts; safe to use from the download threads"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS content (
+                    post_id TEXT PRIMARY KEY,
+                    page_url TEXT,
+                    video_key TEXT,
+                    video_path TEXT,
+                    metadata_path TEXT,
+                    sha256 TEXT,
+                    size INTEGER,
+                    updated_at TEXT
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_content_video_key ON content(video_key)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_content_sha256 ON content(sha256)"
+            )
+
+    @staticmethod
+    def post_id_from_url(url):
+        """
+        Sora post id of a page URL (https://sora.chatgpt.com/p/s_xxx -> s_xxx)
+
+        Args:
+            url: Page URL
+
+        Returns:
+            str: Post id, or the URL path when it is not a post URL
+        """
+        path = urlparse(url).path.rstrip("/")
+        parts = path.split("/")
+        if len(parts) >= 3 and parts[-2] == "p":
+            return parts[-1]
+        return path or url
+
+    @staticmethod
+    def video_key(video_url):
+        """Stable key of a video URL: host + path, without the signed query string"""
+        parsed = urlparse(video_url)
+        return f"{parsed.netloc}{parsed.path}"
+
+    @staticmethod
+    def file_sha256(path, chunk_size=1024 * 1024):
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _find_one(self, column, value):
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT * FROM content WHERE {column} = ? ORDER BY updated_at LIMIT 1",
+                (value,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find_post(self, post_id):
+        """Entry of an already scraped post, or None"""
+        return self._find_one("post_id", post_id)
+
+    def find_video(self, video_url):
+        """Entry whose video was downloaded from the same URL path (file still on disk), or None"""
+        entry = self._find_one("video_key", self.video_key(video_url))
+        if entry and entry["video_path"] and Path(entry["video_path"]).exists():
+            return entry
+        return None
+
+    def find_hash(self, sha256, exclude_path=None):
+        """Entry of a downloaded file with the same content (still on disk), or None"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT * FROM content WHERE sha256 = ? ORDER BY updated_at", (sha256,)
+            ).fetchall()
+        for row in rows:
+            path = row["video_path"]
+            if path and path != str(exclude_path) and Path(path).exists():
+                return dict(row)
+        return None
+
+    def record(self, post_id, **fields):
+        """
+        Insert or update the entry of a post
+
+        Args:
+            post_id: Sora post id
+            **fields: Any of page_url, video_url, video_path, metadata_path, sha256, size
+        """
+        if "video_url" in fields:
+            video_url = fields.pop("video_url")
+            fields["video_key"] = self.video_key(video_url) if video_url else None
+        unknown = set(fields) - _COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown content index fields: {', '.join(sorted(unknown))}")
+        fields = {key: str(value) if isinstance(value, Path) else value for key, value in fields.items()}
+        fields["updated_at"] = datetime.now().isoformat()
+        columns = ", ".join(fields)
+        placeholders = ", ".join("?" for _ in fields)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in fields)
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"INSERT INTO content (post_id, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(post_id) DO UPDATE SET {updates}",
+                (post_id, *fields.values())
+            )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
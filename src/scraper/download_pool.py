@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Download Pool - Downloads videos in background threads while the browser keeps navigating
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DownloadPool:
+    """
+    Runs video downloads on a small thread pool fed by (url, path, metadata) jobs.
+
+    The browser only has to find the video URL; the download itself happens in the
+    background while navigation continues to the next remix. The number of queued jobs
+    is bounded so navigation never gets far ahead of the downloads (signed video URLs
+    expire).
+    """
+
+    def __init__(self, download_fn, max_workers=3, max_pending=None):
+        """
+        Args:
+            download_fn: Callable(video_url, output_path) doing the actual download; returns
+                False on failure, True or the path the video ended up at on success
+            max_workers: Number of parallel downloads
+            max_pending: Maximum number of queued + running jobs (default: 4 x max_workers)
+        """
+        self.download_fn = download_fn
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download")
+        self.slots = threading.BoundedSemaphore(max_pending or max_workers * 4)
+        self.lock = threading.Lock()
+        self.futures = []
+        self.successful = 0
+        self.failed = 0
+
+    def submit(self, video_url, output_path, metadata, metadata_file=None, on_done=None, download_fn=None):
+        """
+        Queue a download. Blocks while the pool is full.
+
+        When the download succeeds, metadata["downloaded_file"] is set and, if given,
+        metadata_file is rewritten with the updated metadata.
+
+        Args:
+            video_url: URL of the video
+            output_path: Path to save the video
+            metadata: Metadata dict of the remix (updated in place)
+            metadata_file: Path of the JSON file the metadata was saved to
+            on_done: Optional callable(success) run once the job has finished
+            download_fn: Optional download callable for this job (default: the pool's)
+        """
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(
+                self._run_job, video_url, output_path, metadata, metadata_file, on_done,
+                download_fn or self.download_fn
+            )
+        except Exception:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.futures.append(future)
+        return future
+
+    def _run_job(self, video_url, output_path, metadata, metadata_file, on_done, download_fn):
+        success = False
+        try:
+            result = download_fn(video_url, output_path)
+            success = bool(result)
+            if success:
+                metadata["downloaded_file"] = str(output_path if result is True else result)
+                if metadata_file is not None:
+                    with open(metadata_file, 'w', encoding='utf-8') as f:
+                        json.dump(metadata, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"      ❌ Background download failed for {output_path}: {e}")
+            success = False
+        finally:
+            with self.lock:
+                if success:
+                    self.successful += 1
+                else:
+                    self.failed += 1
+            self.slots.release()
+            if on_done is not None:
+                try:
+                    on_done(success)
+                except Exception as e:
+                    print(f"      ⚠️  Download callback failed: {e}")
+        return success
+
+    def pending(self):
+        """Number of jobs not finished yet"""
+        with self.lock:
+            return sum(1 for future in self.futures if not future.done())
+
+    def wait(self):
+        """Block until every submitted download has finished"""
+        with self.lock:
+            futures = list(self.futures)
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Wait for the remaining downloads and stop the worker threads"""
+        self.executor.shutdown(wait=True)
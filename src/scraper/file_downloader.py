@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+File Downloader - Pooled, resumable HTTP downloads
+
+Downloads go to `<name>.part` and are renamed into place once complete, so a file with
+its final name is always whole. An interrupted download is resumed with an HTTP Range
+request, transient errors are retried with exponential backoff, and big files can be
+fetched as several ranged segments in parallel.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class DownloadError(Exception):
+    """Raised when a download fails for good (after retries, or on a non-retryable error)"""
+
+
+class _RetryableError(Exception):
+    pass
+
+
+class _RemoteChangedError(DownloadError):
+    pass
+
+
+class FileDownloader:
+    """
+    Downloads files over a persistent keep-alive `requests.Session`.
+
+    One instance can be shared by several threads (the connection pool is sized for
+    `pool_size` concurrent connections).
+    """
+
+    def __init__(self, session=None, chunk_size=1024 * 1024, max_retries=5, backoff=1.0,
+                 timeout=(10, 60), segment_threshold=64 * 1024 * 1024, max_segments=4,
+                 pool_size=16):
+        """
+        Args:
+            session: requests.Session to use (a new one is created if None)
+            chunk_size: Bytes read and written at a time
+            max_retries: Retries per download (or per segment) after a transient error
+            backoff: First retry delay in seconds, doubled on every retry
+            timeout: (connect, read) timeout in seconds
+            segment_threshold: Files at least this big are downloaded as parallel
+                ranged segments when the server supports it (None to disable)
+            max_segments: Number of parallel segments
+            pool_size: Number of connections kept alive per host
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.segment_threshold = segment_threshold
+        self.max_segments = max_segments
+
+    def download(self, url, output_path, progress=None):
+        """
+        Download url to output_path, resuming a previous partial download if any.
+
+        Args:
+            url: URL of the file
+            output_path: Path to save the file
+            progress: Optional callable(downloaded_bytes, total_bytes or None)
+
+        Returns:
+            int: Size of the downloaded file in bytes
+
+        Raises:
+            DownloadError: If the download could not be completed
+        """
+        output_path = str(output_path)
+        part_path = output_path + ".part"
+        state_path = part_path + ".json"
+
+        state = self._load_state(state_path)
+        size = None
+        try:
+            if state and state.get("segments") and os.path.exists(part_path):
+                size = self._download_segmented(url, part_path, state_path, state, progress)
+            elif not os.path.exists(part_path) and self.segment_threshold:
+                size = self._try_segmented(url, part_path, state_path, progress)
+        except _RemoteChangedError:
+            # The segments on disk belong to an older version of the file.
+            self._remove(part_path)
+            self._remove(state_path)
+        if size is None:
+            size = self._download_single(url, part_path, state_path, progress)
+
+        os.replace(part_path, output_path)
+        self._remove(state_path)
+        return size
+
+    # ------------------------------------------------------------------
+    # Single stream, resumed with Range from the size of the .part file
+    # ------------------------------------------------------------------
+
+    def _download_single(self, url, part_path, state_path, progress):
+        state = self._load_state(state_path) or {}
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._fetch_single(url, part_path, state_path, state, progress)
+            except _RetryableError as e:
+                self._wait_before_retry(attempt, e)
+        raise DownloadError(f"Giving up on {url} after {self.max_retries} retries")
+
+    def _fetch_single(self, url, part_path, state_path, state, progress):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {}
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+            # Only resume if the file did not change in the meantime.
+            validator = state.get("etag") or state.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+
+        response = self._request(url, headers)
+        with response:
+            if response.status_code == 416 and offset > 0:
+                total = self._total_from_content_range(response)
+                if total == offset:
+                    return offset
+                # The partial file is bigger than the resource: start over.
+                self._remove(part_path)
+                raise _RetryableError("partial file does not match the remote file")
+            self._raise_for_status(response)
+
+            if response.status_code == 206:
+                start, total = self._parse_content_range(response)
+                if start != offset:
+                    self._remove(part_path)
+                    raise _RetryableError(f"server resumed at {start} instead of {offset}")
+                mode = "ab"
+            else:
+                # 200: no range support, or the file changed; restart from zero.
+                offset = 0
+                total = self._content_length(response)
+                mode = "wb"
+
+            state.update(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                size=total,
+            )
+            self._save_state(state_path, state)
+
+            downloaded = offset
+            if progress:
+                progress(downloaded, total)
+            try:
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if progress:
+                                progress(downloaded, total)
+            except requests.RequestException as e:
+                raise _RetryableError(e)
+
+        if total is not None and downloaded != total:
+            raise _RetryableError(f"got {downloaded} of {total} bytes")
+        return downloaded
+
+    # ------------------------------------------------------------------
+    # Parallel ranged segments for big files
+    # ------------------------------------------------------------------
+
+    def _try_segmented(self, url, part_path, state_path, progress):
+        """Start a segmented download if the file is big and ranges are supported."""
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        with response:
+            if response.status_code != 200:
+                return None
+            total = self._content_length(response)
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        if not accepts_ranges or total is None or total < self.segment_threshold:
+            return None
+
+        segment_size = -(-total // self.max_segments)
+        state = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": total,
+            # [start, end (inclusive), bytes done]
+            "segments": [
+                [start, min(start + segment_size, total) - 1, 0]
+                for start in range(0, total, segment_size)
+            ],
+        }
+        with open(part_path, "wb") as f:
+            f.truncate(total)
+        self._save_state(state_path, state)
+        return self._download_segmented(url, part_path, state_path, state, progress)
+
+    def _download_segmented(self, url, part_path, state_path, state, progress):
+        segments = state["segments"]
+        total = state["size"]
+        lock = threading.Lock()
+        last_saved = [time.monotonic()]
+
+        def report(force=False):
+            with lock:
+                if progress:
+                    progress(sum(segment[2] for segment in segments), total)
+                now = time.monotonic()
+                if force or now - last_saved[0] >= 1.0:
+                    last_saved[0] = now
+                    self._save_state(state_path, state)
+
+        def fetch_segment(segment):
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self._fetch_segment(url, part_path, state, segment, report)
+                    return
+                except _RetryableError as e:
+                    self._wait_before_retry(attempt, e)
+            raise DownloadError(f"Giving up on {url} after {self.max_retries} retries")
+
+        report()
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [
+                executor.submit(fetch_segment, segment)
+                for segment in segments
+                if segment[0] + segment[2] <= segment[1]
+            ]
+        # All segments have stopped; keep what was downloaded for the next attempt.
+        report(force=True)
+        for future in futures:
+            future.result()
+        return total
+
+    def _fetch_segment(self, url, part_path, state, segment, report):
+        start, end, done = segment
+        headers = {"Range": f"bytes={start + done}-{end}"}
+        validator = state.get("etag") or state.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+
+        response = self._request(url, headers)
+        with response:
+            self._raise_for_status(response)
+            if response.status_code != 206:
+                raise _RemoteChangedError("the remote file changed during a segmented download")
+            try:
+                with open(part_path, "r+b") as f:
+                    f.seek(start + done)
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if not chunk:
+                            continue
+                        chunk = chunk[: end - start + 1 - segment[2]]
+                        f.write(chunk)
+                        # Flushed before being recorded, so the saved state never
+                        # claims bytes that are not on disk.
+                        f.flush()
+                        segment[2] += len(chunk)
+                        report()
+                        if segment[2] > end - start:
+                            break
+            except requests.RequestException as e:
+                raise _RetryableError(e)
+        if segment[2] <= end - start:
+            raise _RetryableError(f"segment {start}-{end} ended early")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _request(self, url, headers):
+        try:
+            return self.session.get(url, headers=headers, stream=True, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise _RetryableError(e)
+
+    def _raise_for_status(self, response):
+        if response.status_code in _RETRYABLE_STATUS:
+            raise _RetryableError(f"HTTP {response.status_code}")
+        if response.status_code >= 400:
+            raise DownloadError(f"HTTP {response.status_code} for {response.url}")
+
+    def _wait_before_retry(self, attempt, error):
+        if attempt >= self.max_retries:
+            return
+        delay = min(self.backoff * 2 ** attempt, 60)
+        print(f"      ⚠️  Download interrupted ({error}), retrying in {delay:.0f}s...")
+        time.sleep(delay)
+
+    def _content_length(self, response):
+        length = response.headers.get("Content-Length")
+        if length is None or "Content-Encoding" in response.headers:
+            return None
+        return int(length)
+
+    def _parse_content_range(self, response):
+        match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+        if match is None:
+            raise _RetryableError("invalid Content-Range")
+        start, _, total = match.groups()
+        return int(start), None if total == "*" else int(total)
+
+    def _total_from_content_range(self, response):
+        match = re.match(r"bytes \*/(\d+)", response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    def _load_state(self, state_path):
+        try:
+            with open(state_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, state_path, state):
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
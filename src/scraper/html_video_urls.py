@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+HTML Video URLs - Fast extraction of video URLs from a saved or live page source
+
+Backup extraction used when nothing was collected while scrolling. It collects <video>
+and <source> srcs, links to video files and every attribute value that mentions a video
+extension (data-* attributes of the feed cards). Several parsers can do the work:
+
+    selectolax  C parser (Lexbor); CSS selectors
+    lxml        C parser (libxml2); XPath for the tags, element walk for the attributes
+    regex       Standard library only; one pass over the tags (scripts, styles and
+                comments skipped)
+    bs4         BeautifulSoup with html.parser (pure Python, slowest)
+
+"auto" picks the first installed of selectolax, lxml and bs4. In every backend, attribute
+values go through the same precompiled extension regex instead of one substring test per
+extension.
+
+Benchmark the backends on snapshots saved by save_html_backup:
+
+    python html_video_urls.py page_backup.html --benchmark
+"""
+
+import argparse
+import html as html_lib
+import re
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.webm', '.mkv', '.avi', '.flv')
+
+BACKENDS = ("selectolax", "lxml", "regex", "bs4")
+AUTO_ORDER = ("selectolax", "lxml", "bs4")
+
+DEFAULT_BASE_URL = "https://sora.chatgpt.com/"
+
+# Any value mentioning a video extension (same test as `ext in value.lower()`)
+_VIDEO_EXT_RE = re.compile("|".join(re.escape(ext) for ext in VIDEO_EXTENSIONS), re.IGNORECASE)
+# Hrefs ending with a video extension
+_VIDEO_HREF_RE = re.compile("(?:" + _VIDEO_EXT_RE.pattern + r")\Z", re.IGNORECASE)
+
+# Multi-valued attributes (BeautifulSoup returns them as lists and never matched them)
+_MULTI_VALUED_ATTRS = frozenset(("class", "rel", "rev", "accept-charset", "headers", "accesskey", "dropzone"))
+
+# regex backend: content that is not markup, start tags, attributes
+_SKIP_RE = re.compile(r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"""<([a-zA-Z][\w:-]*)(\s(?:[^>"']|"[^"]*"|'[^']*')*)?>""")
+_ATTR_RE = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+
+_auto_backend = None
+
+
+def _absolute(base_url, value):
+    # urljoin dominates on big feeds; absolute URLs are kept as they are
+    if value.startswith(('https://', 'http://')):
+        return value
+    return urljoin(base_url, value)
+
+
+def _video_urls(media_srcs, link_hrefs, attr_values, base_url):
+    """
+    Build the URL set from what a backend found
+
+    Args:
+        media_srcs: src of every <video> and <source>
+        link_hrefs: href of every <a>
+        attr_values: Every (single-valued) attribute value
+        base_url: URL relative values are resolved against
+    """
+    # Values repeat (a <video> src is also an attribute value): resolve each one once
+    found = {src for src in media_srcs if src}
+    found.update(href for href in link_hrefs if href and _VIDEO_HREF_RE.search(href))
+    mentioned = {value for value in attr_values if value and _VIDEO_EXT_RE.search(value)}
+
+    urls = {_absolute(base_url, value) for value in found}
+    for value in mentioned - found:
+        url = _absolute(base_url, value)
+        if url.startswith('http'):
+            urls.add(url)
+    return urls
+
+
+def _extract_lxml(html, base_url):
+    from lxml import etree, html as lxml_html
+    if not html.strip():
+        return set()
+    parser = lxml_html.HTMLParser(encoding='utf-8')
+    doc = lxml_html.fromstring(html.encode('utf-8'), parser=parser)
+    return _video_urls(
+        doc.xpath('//video/@src | //source/@src', smart_strings=False),
+        doc.xpath('//a/@href', smart_strings=False),
+        (value for element in doc.iter(etree.Element) for name, value in element.items()
+         if name not in _MULTI_VALUED_ATTRS),
+        base_url
+    )
+
+
+def _extract_selectolax(html, base_url):
+    from selectolax.lexbor import LexborHTMLParser
+    tree = LexborHTMLParser(html)
+    return _video_urls(
+        (node.attributes.get('src') for node in tree.css('video[src], source[src]')),
+        (node.attributes.get('href') for node in tree.css('a[href]')),
+        (value for node in tree.css('*') for name, value in node.attributes.items()
+         if name not in _MULTI_VALUED_ATTRS),
+        base_url
+    )
+
+
+def _extract_regex(html, base_url):
+    media_srcs, link_hrefs, attr_values = [], [], []
+    for match in _TAG_RE.finditer(_SKIP_RE.sub("", html)):
+        tag = match.group(1).lower()
+        attrs = match.group(2) or ""
+        # Only tags that can contribute are split into attributes
+        if tag not in ('video', 'source', 'a') and not _VIDEO_EXT_RE.search(attrs):
+            continue
+        for name, double, single, bare in _ATTR_RE.findall(attrs):
+            name = name.lower()
+            value = double or single or bare
+            if '&' in value:
+                value = html_lib.unescape(value)
+            if name == 'src' and tag in ('video', 'source'):
+                media_srcs.append(value)
+            elif name == 'href' and tag == 'a':
+                link_hrefs.append(value)
+            if name not in _MULTI_VALUED_ATTRS:
+                attr_values.append(value)
+    return _video_urls(media_srcs, link_hrefs, attr_values, base_url)
+
+
+def _extract_bs4(html, base_url):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    return _video_urls(
+        (tag['src'] for tag in soup.find_all(['video', 'source'], src=True)),
+        (link['href'] for link in soup.find_all('a', href=True)),
+        (value for tag in soup.find_all(True) for value in tag.attrs.values() if isinstance(value, str)),
+        base_url
+    )
+
+
+_EXTRACTORS = {
+    "lxml": _extract_lxml,
+    "selectolax": _extract_selectolax,
+    "regex": _extract_regex,
+    "bs4": _extract_bs4,
+}
+
+# Module each backend needs (None = standard library) and the package that provides it
+_MODULES = {
+    "lxml": ("lxml.html", "lxml"),
+    "selectolax": ("selectolax.lexbor", "selectolax"),
+    "regex": (None, None),
+    "bs4": ("bs4", "beautifulsoup4"),
+}
+
+
+def available_backends():
+    """Backends whose parser is installed, in BACKENDS order"""
+    available = []
+    for backend in BACKENDS:
+        module = _MODULES[backend][0]
+        try:
+            if module:
+                __import__(module)
+        except ImportError:
+            continue
+        available.append(backend)
+    return available
+
+
+def resolve_backend(backend="auto"):
+    """
+    Name of the backend to use
+
+    Raises:
+        RuntimeError: If the requested parser is not installed
+    """
+    global _auto_backend
+    if backend == "auto":
+        if _auto_backend is None:
+            available = available_backends()
+            _auto_backend = next((name for name in AUTO_ORDER if name in available), "regex")
+        return _auto_backend
+    if backend not in _EXTRACTORS:
+        raise ValueError(f"Unknown HTML backend: {backend} (choose from auto, {', '.join(BACKENDS)})")
+    if backend not in available_backends():
+        raise RuntimeError(f"HTML backend '{backend}' is not installed: pip install {_MODULES[backend][1]}")
+    return backend
+
+
+def extract_video_urls(html, base_url, backend="auto"):
+    """
+    Extract every video URL from a page source
+
+    Args:
+        html: Page HTML
+        base_url: URL of the page (relative URLs are resolved against it)
+        backend: "auto" or one of BACKENDS
+
+    Returns:
+        set: Absolute video URLs
+    """
+    return _EXTRACTORS[resolve_backend(backend)](html, base_url)
+
+
+def benchmark(snapshots, base_url=DEFAULT_BASE_URL, repeat=5, backends=None):
+    """
+    Time each installed backend on saved page snapshots
+
+    Args:
+        snapshots: HTML files (e.g. page_backup.html from save_html_backup)
+        base_url: URL the snapshots were saved from
+        repeat: Parses per snapshot and backend (the best time is kept)
+        backends: Backends to compare (default: all installed)
+
+    Returns:
+        dict: backend -> {"seconds": best total time over the snapshots, "urls": URL count,
+              "missing": URLs found by bs4 but not this backend, "extra": the reverse}
+    """
+    pages = [Path(snapshot).read_text(encoding='utf-8', errors='replace') for snapshot in snapshots]
+    results = {}
+    found_by = {}
+    for backend in backends or available_backends():
+        extractor = _EXTRACTORS[backend]
+        seconds = 0.0
+        urls = set()
+        for page in pages:
+            best = None
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                found = extractor(page, base_url)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            seconds += best
+            urls |= found
+        found_by[backend] = urls
+        results[backend] = {"seconds": seconds, "urls": len(urls), "missing": None, "extra": None}
+
+    # bs4 was the only extractor before: compare the others against it
+    reference = found_by.get("bs4")
+    if reference is not None:
+        for backend, urls in found_by.items():
+            results[backend]["missing"] = len(reference - urls)
+            results[backend]["extra"] = len(urls - reference)
+    return results
+
+
+def main():
+    """Extract video URLs from saved pages, or benchmark the backends on them"""
+    parser = argparse.ArgumentParser(
+        description="Extract video URLs from saved Sora pages (page_backup.html) or benchmark the HTML backends",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Video URLs of a snapshot saved by save_html_backup
+  python html_video_urls.py page_backup.html
+
+  # Compare the installed parsers on one or more snapshots
+  python html_video_urls.py page_backup.html feed_*.html --benchmark --repeat 10
+        """
+    )
+    parser.add_argument("snapshots", nargs="+", help="Saved HTML pages")
+    parser.add_argument("--base-url", type=str, default=DEFAULT_BASE_URL, help=f"URL the pages were saved from (default: {DEFAULT_BASE_URL})")
+    parser.add_argument("--backend", type=str, default="auto", choices=("auto",) + BACKENDS, help="HTML backend (default: auto)")
+    parser.add_argument("--benchmark", action="store_true", help="Time every installed backend instead of printing URLs")
+    parser.add_argument("--repeat", type=int, default=5, help="Parses per snapshot and backend when benchmarking (default: 5)")
+    args = parser.parse_args()
+
+    for snapshot in args.snapshots:
+        if not Path(snapshot).exists():
+            parser.error(f"Snapshot not found: {snapshot}")
+
+    if args.benchmark:
+        backends = None if args.backend == "auto" else [args.backend]
+        size = sum(Path(snapshot).stat().st_size for snapshot in args.snapshots)
+        print(f"⏱️  {len(args.snapshots)} snapshot(s), {size / 1024:.0f} KiB, best of {args.repeat}")
+        for backend, result in benchmark(args.snapshots, args.base_url, args.repeat, backends).items():
+            line = f"   {backend:<11} {result['seconds'] * 1000:9.1f} ms  {result['urls']:5d} URLs"
+            if result["missing"] is not None:
+                line += f"  (vs bs4: {result['missing']} missing, {result['extra']} extra)"
+            print(line)
+        return
+
+    try:
+        backend = resolve_backend(args.backend)
+    except RuntimeError as e:
+        parser.error(str(e))
+    urls = set()
+    for snapshot in args.snapshots:
+        urls |= extract_video_urls(Path(snapshot).read_text(encoding='utf-8', errors='replace'), args.base_url, backend)
+    for url in sorted(urls):
+        print(url)
+    print(f"📊 {len(urls)} video URL(s) ({backend})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Metadata Sink - Streams page metadata to an append-only JSONL file
+
+Every record is appended (and flushed) as soon as a page is scraped, and again when its
+video download finishes, so an interrupted run loses nothing and other tools can tail
+the stream instead of rescanning the output directories. fsync is batched: every
+fsync_every records or fsync_interval seconds after the first unsynced record, whichever
+comes first (a timer covers the end of a burst, when no further write would trigger it).
+
+The compaction tool keeps the latest record of each page and builds the combined
+all_remixes_metadata.json, a SQLite table or a Parquet file on demand:
+
+    python metadata_sink.py videos/remixes_metadata.jsonl
+    python metadata_sink.py videos/remixes_metadata.jsonl --sqlite remixes.db --parquet remixes.parquet
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+METADATA_STREAM_NAME = "remixes_metadata.jsonl"
+COMBINED_FILE_NAME = "all_remixes_metadata.json"
+
+# Columns of the compacted table (comments are stored as a JSON string)
+TABLE_COLUMNS = [
+    "url", "scraped_at", "title", "description", "creator", "creator_profile_url",
+    "creator_avatar_url", "likes", "remixes", "comment_count", "comments", "video_url",
+    "downloaded_file", "already_scraped",
+]
+
+
+class MetadataSink:
+    """Append-only JSONL writer; safe to use from the download threads"""
+
+    def __init__(self, path, fsync_every=20, fsync_interval=2.0):
+        """
+        Args:
+            path: JSONL file to append to (created if missing)
+            fsync_every: Records written between two fsyncs
+            fsync_interval: Seconds after which pending records are fsynced anyway
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.lock = threading.Lock()
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.sync_timer = None
+
+    def write(self, record):
+        """Append one record (a metadata dict)"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self.lock:
+            self.file.write(line)
+            # Flushed right away so tailing readers see the record; fsynced in batches
+            self.file.flush()
+            self.unsynced += 1
+            if (self.unsynced >= self.fsync_every
+                    or time.monotonic() - self.last_sync >= self.fsync_interval):
+                self._sync()
+            elif self.sync_timer is None:
+                # fsync this record within fsync_interval even if nothing else is written
+                self.sync_timer = threading.Timer(self.fsync_interval, self.flush)
+                self.sync_timer.daemon = True
+                self.sync_timer.start()
+
+    def _sync(self):
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        if self.sync_timer is not None:
+            self.sync_timer.cancel()
+            self.sync_timer = None
+
+    def flush(self):
+        """fsync every pending record"""
+        with self.lock:
+            if self.unsynced and not self.file.closed:
+                self.file.flush()
+                self._sync()
+            elif self.sync_timer is not None:
+                self.sync_timer.cancel()
+                self.sync_timer = None
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.file.close()
+
+
+def iter_records(path, follow=False, poll_interval=1.0):
+    """
+    Read the records of a JSONL stream
+
+    A partial last line (run killed mid-write) is skipped, or waited for when following.
+
+    Args:
+        path: JSONL file
+        follow: Keep waiting for new records like `tail -f` (stops on KeyboardInterrupt)
+        poll_interval: Seconds between two checks for new records when following
+
+    Yields:
+        dict: One metadata record
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ""
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    return
+                time.sleep(poll_interval)
+                continue
+            buffer += line
+            if not buffer.endswith("\n"):
+                continue
+            line, buffer = buffer, ""
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                print(f"⚠️  Skipping malformed record in {path}")
+
+
+def compact(path):
+    """
+    Latest record of each page of a JSONL stream, in the order pages were first seen
+
+    Returns:
+        list: Metadata dicts
+    """
+    records = {}
+    for record in iter_records(path):
+        key = record.get("url") or id(record)
+        records[key] = record
+    return list(records.values())
+
+
+def _table_row(record):
+    row = {column: record.get(column) for column in TABLE_COLUMNS}
+    comments = record.get("comments") or []
+    row["comment_count"] = len(comments)
+    row["comments"] = json.dumps(comments, ensure_ascii=False)
+    row["already_scraped"] = bool(record.get("already_scraped"))
+    return row
+
+
+def write_combined_json(records, output_file, **stats):
+    """Write records as the combined all_remixes_metadata.json (extra stats as top-level keys)"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            "scraped_at": datetime.now().isoformat(),
+            "total_remixes": len(records),
+            **stats,
+            "remixes": records
+        }, f, indent=2, ensure_ascii=False)
+
+
+def write_sqlite(records, output_file, table="remixes"):
+    """Write records as a SQLite table (replaced if it exists)"""
+    conn = sqlite3.connect(str(output_file))
+    try:
+        with conn:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.execute(f"CREATE TABLE {table} ({', '.join(TABLE_COLUMNS)})")
+            conn.executemany(
+                f"INSERT INTO {table} VALUES ({', '.join('?' for _ in TABLE_COLUMNS)})",
+                [tuple(_table_row(record).values()) for record in records]
+            )
+    finally:
+        conn.close()
+
+
+def write_parquet(records, output_file):
+    """Write records as a Parquet file (needs pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet output needs pyarrow: pip install pyarrow")
+    rows = [_table_row(record) for record in records]
+    table = pa.Table.from_pylist(rows) if rows else pa.table({column: [] for column in TABLE_COLUMNS})
+    pq.write_table(table, str(output_file))
+
+
+def main():
+    """Compact a metadata stream"""
+    parser = argparse.ArgumentParser(
+        description="Compact a remixes_metadata.jsonl stream into a combined JSON, SQLite or Parquet file",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Rebuild all_remixes_metadata.json next to the stream (e.g. after an interrupted run)
+  python metadata_sink.py videos/remixes_metadata.jsonl
+
+  # Table outputs for analysis
+  python metadata_sink.py videos/remixes_metadata.jsonl --sqlite remixes.db --parquet remixes.parquet
+
+  # Print new records as they are scraped
+  python metadata_sink.py videos/remixes_metadata.jsonl --follow
+        """
+    )
+    parser.add_argument("stream", help="JSONL metadata stream")
+    parser.add_argument("--json", type=str, default=None, metavar="FILE", help=f"Combined JSON output (default: {COMBINED_FILE_NAME} next to the stream, unless --sqlite/--parquet is given)")
+    parser.add_argument("--sqlite", type=str, default=None, metavar="FILE", help="SQLite output (table 'remixes')")
+    parser.add_argument("--parquet", type=str, default=None, metavar="FILE", help="Parquet output (needs pyarrow)")
+    parser.add_argument("--follow", action="store_true", help="Print records as they are appended instead of compacting")
+    args = parser.parse_args()
+
+    stream = Path(args.stream)
+    if not stream.exists():
+        parser.error(f"Stream not found: {stream}")
+
+    if args.follow:
+        try:
+            for record in iter_records(stream, follow=True):
+                print(json.dumps(record, ensure_ascii=False))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    records = compact(stream)
+    print(f"📄 {len(records)} page(s) in {stream}")
+
+    json_output = args.json
+    if not json_output and not args.sqlite and not args.parquet:
+        json_output = stream.parent / COMBINED_FILE_NAME
+    if json_output:
+        write_combined_json(records, json_output)
+        print(f"💾 Combined JSON: {json_output}")
+    if args.sqlite:
+        write_sqlite(records, args.sqlite)
+        print(f"💾 SQLite table: {args.sqlite}")
+    if args.parquet:
+        try:
+            write_parquet(records, args.parquet)
+        except RuntimeError as e:
+            parser.error(str(e))
+        print(f"💾 Parquet file: {args.parquet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Network Capture - Builds remix lists, video URLs and metadata from Sora's JSON responses
+
+The Sora web app loads posts, remix feeds and comments from its own JSON API. Instead of
+reading all of that back from the DOM (one WebDriver round-trip per button, SVG path or
+attribute), the capture mode listens to the XHR/fetch responses through Chrome's
+performance log and the DevTools protocol, and indexes the posts found in the payloads.
+
+The payload parsing only depends on the JSON, so it can be fed from a recorded HAR file
+(`CapturedFeed.load_har`) as well as from a live browser (`NetworkCapture`).
+"""
+
+import base64
+import json
+import re
+from datetime import datetime
+from urllib.parse import urlparse
+
+POST_ID_RE = re.compile(r"^s_[A-Za-z0-9]+$")
+POST_ID_IN_URL_RE = re.compile(r"/(s_[A-Za-z0-9]+)(?:/|$)")
+VIDEO_EXTENSIONS = (".mp4", ".webm", ".mov")
+
+# Keys under which a post's downloadable video is usually found, best first
+VIDEO_URL_KEYS = ("downloadable_url", "download_url", "source", "url", "src", "path")
+# Keys a post object carries besides its id (used to tell posts from other "s_" ids)
+POST_KEYS = {"attachments", "text", "caption", "like_count", "remix_count", "permalink", "posted_at"}
+PROFILE_KEYS = ("profile", "author", "owner_profile", "user")
+
+
+def _first(obj, *keys):
+    for key in keys:
+        value = obj.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _is_video_url(value):
+    return (
+        isinstance(value, str)
+        and value.startswith("http")
+        and urlparse(value).path.lower().endswith(VIDEO_EXTENSIONS)
+    )
+
+
+def _find_video_url(obj):
+    """First video URL in obj (nested dicts/lists), preferring VIDEO_URL_KEYS order"""
+    if isinstance(obj, list):
+        for item in obj:
+            url = _find_video_url(item)
+            if url:
+                return url
+        return None
+    if not isinstance(obj, dict):
+        return None
+    for key in VIDEO_URL_KEYS:
+        if _is_video_url(obj.get(key)):
+            return obj[key]
+    for key in VIDEO_URL_KEYS + tuple(k for k in obj if k not in VIDEO_URL_KEYS):
+        if isinstance(obj.get(key), (dict, list)):
+            url = _find_video_url(obj[key])
+            if url:
+                return url
+    return None
+
+
+def _parse_profile(profile, base_url):
+    if not isinstance(profile, dict):
+        return {}
+    username = _first(profile, "username", "handle")
+    return {
+        "creator": _first(profile, "display_name", "username", "handle", "name"),
+        "creator_profile_url": f"{base_url}/profile/{username}" if username else None,
+        "creator_avatar_url": _first(profile, "profile_picture_url", "avatar_url", "picture"),
+    }
+
+
+def _is_post(obj):
+    return (
+        isinstance(obj, dict)
+        and isinstance(obj.get("id"), str)
+        and POST_ID_RE.match(obj["id"]) is not None
+        and bool(POST_KEYS & obj.keys())
+    )
+
+
+class CapturedFeed:
+    """Posts, remix lists and comments collected from Sora API payloads"""
+
+    def __init__(self, base_url="https://sora.chatgpt.com"):
+        self.base_url = base_url.rstrip("/")
+        self.posts = {}      # post_id -> post fields
+        self.remixes = {}    # parent post_id -> [remix post_id, ...] in feed order
+        self.comments = {}   # post_id -> [comment dict, ...]
+        self.comments_loaded = set()  # post_ids whose comment list response was read
+
+    def add_payload(self, payload, source_url=""):
+        """
+        Index every post found in a JSON payload
+
+        Args:
+            payload: Decoded JSON response
+            source_url: URL the payload was fetched from (tells remix feeds and comment
+                lists apart from plain post lists)
+
+        Returns:
+            int: Number of posts found
+        """
+        match = POST_ID_IN_URL_RE.search(urlparse(source_url).path)
+        url_post_id = match.group(1) if match else None
+        path = urlparse(source_url).path.lower()
+        remix_parent = url_post_id if url_post_id and "remix" in path else None
+        comments_of = url_post_id if url_post_id and "comment" in path else None
+
+        if comments_of:
+            self.comments_loaded.add(comments_of)
+
+        found = []
+        self._walk(payload, None, found)
+        for post, profile in found:
+            if comments_of and post["id"] != comments_of:
+                self._add_comment(comments_of, post, profile)
+                continue
+            post_id = self._add_post(post, profile)
+            parent = self.posts[post_id].get("parent_post_id") or remix_parent
+            if parent and parent != post_id:
+                remixes = self.remixes.setdefault(parent, [])
+                if post_id not in remixes:
+                    remixes.append(post_id)
+        return len(found)
+
+    def _walk(self, obj, profile, found):
+        if isinstance(obj, list):
+            for item in obj:
+                self._walk(item, profile, found)
+            return
+        if not isinstance(obj, dict):
+            return
+        # Feed items usually come as {"post": {...}, "profile": {...}}
+        own_profile = _first(obj, *PROFILE_KEYS)
+        own_profile = own_profile if isinstance(own_profile, dict) else None
+        if _is_post(obj):
+            found.append((obj, own_profile or profile))
+            child_profile = None
+        else:
+            child_profile = own_profile or profile
+        for key, value in obj.items():
+            if isinstance(value, (dict, list)) and key not in PROFILE_KEYS:
+                self._walk(value, child_profile, found)
+
+    def _add_post(self, post, profile):
+        post_id = post["id"]
+        fields = {
+            "description": _first(post, "text", "caption", "prompt"),
+            "likes": _first(post, "like_count", "likes"),
+            "remixes": _first(post, "remix_count", "remixes"),
+            "comment_count": _first(post, "reply_count", "comment_count"),
+            "video_url": _find_video_url(post.get("attachments")) or _find_video_url(post.get("video")),
+            "parent_post_id": _first(post, "parent_post_id", "remix_target_post_id"),
+            "permalink": post.get("permalink"),
+            "posted_at": post.get("posted_at"),
+        }
+        fields.update(_parse_profile(profile, self.base_url))
+        entry = self.posts.setdefault(post_id, {"post_id": post_id})
+        # Later payloads (e.g. the post page itself) complete what feeds left out
+        entry.update({key: value for key, value in fields.items() if value is not None})
+        return post_id
+
+    def _add_comment(self, post_id, comment, profile):
+        creator = _parse_profile(profile, self.base_url)
+        comment_data = {
+            "username": creator.get("creator"),
+            "user_profile_url": creator.get("creator_profile_url"),
+            "user_avatar_url": creator.get("creator_avatar_url"),
+            "comment_text": _first(comment, "text", "caption"),
+            "likes": _first(comment, "like_count", "likes") or 0,
+        }
+        if not comment_data["comment_text"]:
+            return
+        comments = self.comments.setdefault(post_id, [])
+        if comment_data not in comments:
+            comments.append(comment_data)
+
+    def load_har(self, har_path):
+        """
+        Index the JSON responses of a HAR file (e.g. recorded with Chrome DevTools)
+
+        Returns:
+            int: Number of JSON responses read
+        """
+        with open(har_path, 'r', encoding='utf-8') as f:
+            har = json.load(f)
+        count = 0
+        for entry in har.get("log", {}).get("entries", []):
+            content = entry.get("response", {}).get("content", {})
+            if "json" not in (content.get("mimeType") or "") or not content.get("text"):
+                continue
+            text = content["text"]
+            if content.get("encoding") == "base64":
+                text = base64.b64decode(text).decode("utf-8")
+            try:
+                payload = json.loads(text)
+            except ValueError:
+                continue
+            self.add_payload(payload, entry.get("request", {}).get("url", ""))
+            count += 1
+        return count
+
+    def post_url(self, post_id):
+        """Page URL of a post"""
+        post = self.posts.get(post_id, {})
+        return post.get("permalink") or f"{self.base_url}/p/{post_id}"
+
+    def remixes_of(self, post_id):
+        """Remix post ids of a post, in feed order"""
+        return list(self.remixes.get(post_id, []))
+
+    def has_comments(self, post_id):
+        """
+        Check if a post's comments were captured: its comment list was read, or the post
+        says it has none (comments are only fetched by the post page, never by feeds)
+        """
+        post = self.posts.get(post_id) or {}
+        return post_id in self.comments_loaded or post.get("comment_count") == 0
+
+    def has_post(self, post_id, need_video=False, need_comments=False):
+        """Check if a post was captured (with its video URL / comments if needed)"""
+        post = self.posts.get(post_id)
+        if post is None:
+            return False
+        if need_video and not post.get("video_url"):
+            return False
+        return not need_comments or self.has_comments(post_id)
+
+    def metadata(self, post_id, page_url=None):
+        """
+        Metadata of a captured post, in the same format as MetadataExtractor
+
+        Returns:
+            dict: Metadata dictionary, or None if the post was not captured
+        """
+        post = self.posts.get(post_id)
+        if post is None:
+            return None
+        return {
+            "url": page_url or self.post_url(post_id),
+            "scraped_at": datetime.now().isoformat(),
+            "title": None,
+            "description": post.get("description"),
+            "creator": post.get("creator"),
+            "creator_profile_url": post.get("creator_profile_url"),
+            "creator_avatar_url": post.get("creator_avatar_url"),
+            "likes": post.get("likes") or 0,
+            "remixes": post.get("remixes") or 0,
+            "comments": list(self.comments.get(post_id, [])),
+            "video_url": post.get("video_url"),
+            "downloaded_file": None,
+            "post_id": post_id,
+            "parent_post_id": post.get("parent_post_id"),
+            "posted_at": post.get("posted_at"),
+            "source": "network",
+        }
+
+
+class NetworkCapture:
+    """
+    Reads the XHR/fetch JSON responses of the page from Chrome's performance log.
+
+    The browser must be started with performance logging enabled
+    (BrowserManager(capture_network=True)).
+    """
+
+    def __init__(self, driver, base_url="https://sora.chatgpt.com"):
+        self.driver = driver
+        self.feed = CapturedFeed(base_url)
+        self.pending = {}  # requestId -> response URL, until its body is fully loaded
+        self.enabled = False
+
+    def enable(self):
+        """Turn on network events for the current page target"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.enabled = True
+        except Exception as e:
+            print(f"⚠️  Network capture unavailable, falling back to the DOM: {e}")
+            self.enabled = False
+        return self.enabled
+
+    def poll(self):
+        """
+        Index the JSON responses received since the last poll
+
+        Returns:
+            int: Number of JSON responses read
+        """
+        if not self.enabled:
+            return 0
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            print(f"⚠️  Could not read the performance log, disabling network capture: {e}")
+            self.enabled = False
+            return 0
+
+        count = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                if (params.get("type") in ("XHR", "Fetch")
+                        and "json" in (response.get("mimeType") or "")
+                        and response.get("status") == 200):
+                    self.pending[params.get("requestId")] = response.get("url", "")
+            elif method == "Network.loadingFinished":
+                url = self.pending.pop(params.get("requestId"), None)
+                if url is not None and self._read_body(params["requestId"], url):
+                    count += 1
+            elif method == "Network.loadingFailed":
+                self.pending.pop(params.get("requestId"), None)
+        return count
+
+    def _read_body(self, request_id, url):
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            payload = json.loads(body)
+        except Exception:
+            # Body already evicted from the buffer, or not JSON after all
+            return False
+        self.feed.add_payload(payload, url)
+        return True
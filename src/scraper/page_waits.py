@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Page Waits - Waits for page events instead of sleeping for fixed durations
+
+Every wait polls a condition (URL change, <video> with a src, document loaded and
+network quiet, more buttons than before) and returns as soon as it holds, or gives up
+after a timeout. An optional minimum keeps the human-like pacing of slow mode.
+"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Number of resources the page has requested so far (grows while the network is busy).
+# Chrome stops recording after 250 entries by default, which would make a heavy feed page
+# look quiet too early, so the buffer is enlarged on each new document.
+_RESOURCE_COUNT_JS = """
+if (!window.__soraResourceBuffer) {
+    performance.setResourceTimingBufferSize(100000);
+    window.__soraResourceBuffer = true;
+}
+return performance.getEntriesByType('resource').length;
+"""
+
+# First http(s) src of a <video> (or its <source>), or null
+_VIDEO_SRC_JS = """
+const video = Array.from(document.querySelectorAll('video, video source'))
+    .find(el => (el.getAttribute('src') || '').startsWith('http'));
+return video ? video.getAttribute('src') : null;
+"""
+
+
+class PageWaiter:
+    """Event-driven waits on a WebDriver"""
+
+    def __init__(self, driver, poll_interval=0.1):
+        self.driver = driver
+        self.poll_interval = poll_interval
+
+    def until(self, condition, timeout=10, min_delay=0):
+        """
+        Wait until condition() is truthy
+
+        Args:
+            condition: Callable() polled every poll_interval (exceptions count as False)
+            timeout: Seconds to wait at most
+            min_delay: Seconds to wait at least, even if the condition holds earlier
+
+        Returns:
+            bool: True if the condition held before the timeout
+        """
+        started = time.monotonic()
+
+        def check(_driver):
+            try:
+                return condition()
+            except Exception:
+                return False
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(check)
+            success = True
+        except TimeoutException:
+            success = False
+
+        remaining = min_delay - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+        return success
+
+    def url_change(self, previous_url, timeout=10, min_delay=0):
+        """Wait for the current URL to differ from previous_url"""
+        return self.until(lambda: self.driver.current_url != previous_url, timeout, min_delay)
+
+    def video_src(self):
+        """src of the first <video> (or its <source>) with an http(s) src, or None"""
+        try:
+            return self.driver.execute_script(_VIDEO_SRC_JS)
+        except Exception:
+            return None
+
+    def video_ready(self, timeout=10, min_delay=0, previous_src=None):
+        """
+        Wait for a <video> (or its <source>) with an http(s) src
+
+        Args:
+            previous_src: src of the video of the previous page; a video still showing it
+                does not count (the previous page has not been replaced yet)
+        """
+        def ready():
+            src = self.driver.execute_script(_VIDEO_SRC_JS)
+            return src is not None and src != previous_src
+
+        return self.until(ready, timeout, min_delay)
+
+    def count_change(self, count_fn, previous_count, timeout=10, min_delay=0):
+        """Wait for count_fn() to return something else than previous_count"""
+        return self.until(lambda: count_fn() != previous_count, timeout, min_delay)
+
+    def page_loaded(self, timeout=15, min_delay=0, quiet_time=0.5):
+        """
+        Wait for the document to be loaded and the network to go quiet (no new resource
+        requested for quiet_time seconds)
+        """
+        started = time.monotonic()
+        state = {"count": -1, "since": started}
+
+        def loaded_and_quiet():
+            if self.driver.execute_script("return document.readyState;") != "complete":
+                return False
+            count = self.driver.execute_script(_RESOURCE_COUNT_JS)
+            now = time.monotonic()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return now - state["since"] >= quiet_time
+
+        return self.until(loaded_and_quiet, timeout, min_delay)
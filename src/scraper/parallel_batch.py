@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Parallel Batch - Runs the URLs of a batch file on several browsers at once
+
+Each worker owns one Chrome instance (and one SoraRemixScraper) and pulls the next URL
+from a shared queue, so a slow URL never holds up the others. Progress, the content
+index and the download slots are shared by all workers.
+"""
+
+import queue
+import threading
+import time
+
+
+class ParallelBatchRunner:
+    """Processes (index, url) jobs on N browser workers fed by a shared queue"""
+
+    def __init__(self, make_scraper, process_url, workers=2, start_interval=3.0):
+        """
+        Args:
+            make_scraper: Callable(worker_id) -> SoraRemixScraper (not set up yet)
+            process_url: Callable(scraper, idx, url) -> bool processing one URL
+            workers: Number of browsers running at the same time
+            start_interval: Seconds between two browser launches
+        """
+        self.make_scraper = make_scraper
+        self.process_url = process_url
+        self.workers = max(1, workers)
+        self.start_interval = start_interval
+        self.jobs = queue.Queue()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self.scrapers = []
+
+    def run(self, jobs):
+        """
+        Process every job and return once they are all done
+
+        Args:
+            jobs: List of (idx, url) tuples
+
+        Returns:
+            tuple: (processed_count, failed_count); jobs left over because every
+                browser failed to start count as failed
+        """
+        for job in jobs:
+            self.jobs.put(job)
+
+        workers = min(self.workers, len(jobs))
+        print(f"🧵 Running {len(jobs)} URL(s) on {workers} browser(s)\n")
+        threads = [
+            threading.Thread(target=self._worker, args=(worker_id,), name=f"batch-{worker_id}", daemon=True)
+            for worker_id in range(1, workers + 1)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            # join() with a timeout keeps the main thread responsive to Ctrl+C
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self.stop_event.set()
+            print("\n⚠️  Interrupted, closing browsers...")
+            with self.lock:
+                scrapers = list(self.scrapers)
+            for scraper in scrapers:
+                try:
+                    scraper.close()
+                except Exception:
+                    pass
+            raise
+
+        left_over = self.jobs.qsize()
+        return self.processed, self.failed + left_over
+
+    def _worker(self, worker_id):
+        # Stagger the launches: starting several Chrome instances at once is slow and flaky
+        if self.stop_event.wait((worker_id - 1) * self.start_interval):
+            return
+
+        try:
+            scraper = self.make_scraper(worker_id)
+            scraper.setup()
+        except Exception as e:
+            print(f"❌ [worker {worker_id}] Could not start browser: {e}")
+            return
+        with self.lock:
+            self.scrapers.append(scraper)
+
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    idx, url = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                print(f"🧵 [worker {worker_id}] Taking URL {idx}: {url}")
+                started = time.time()
+                success = self.process_url(scraper, idx, url)
+                with self.lock:
+                    if success:
+                        self.processed += 1
+                    else:
+                        self.failed += 1
+                status = "✅ Done" if success else "❌ Failed"
+                print(f"🧵 [worker {worker_id}] {status} URL {idx} in {time.time() - started:.0f}s")
+        finally:
+            if not self.stop_event.is_set():
+                scraper.close()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Progress Store - Batch progress, remix checkpoints and per-remix state in SQLite
+
+Replaces the .batch_progress.json / .scrape_checkpoint.json / .remix_urls.json files,
+which were re-read and fully rewritten on every update. Each update is now one small
+transaction, lookups are indexed, and the WAL journal lets the parallel batch workers
+share the database.
+
+Query it from the command line to see what failed (or never finished) and re-run
+only those URLs:
+
+    python progress_store.py videos/.scrape_progress.db
+    python progress_store.py videos/.scrape_progress.db --status failed --urls-only > retry.txt
+    python scraper.py --batch retry.txt --output videos
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+URL_STATUSES = ("pending", "running", "completed", "failed")
+# Files of the JSON-based progress tracking this store replaces
+LEGACY_PROGRESS_FILE = ".batch_progress.json"
+LEGACY_CHECKPOINT_FILE = ".scrape_checkpoint.json"
+LEGACY_REMIX_URLS_FILE = ".remix_urls.json"
+REMIX_STATUSES = ("completed", "failed", "skipped")
+
+
+class ProgressStore:
+    """SQLite store of scraping progress; safe to use from several threads and processes"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS urls (
+                    url TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    output_dir TEXT,
+                    last_completed_index INTEGER NOT NULL DEFAULT -1,
+                    remix_urls TEXT,
+                    all_loaded INTEGER NOT NULL DEFAULT 0,
+                    started_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS remixes (
+                    url TEXT NOT NULL,
+                    remix_index INTEGER NOT NULL,
+                    remix_url TEXT,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (url, remix_index)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_urls_status ON urls(status)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_remixes_status ON remixes(status)")
+
+    def _execute(self, sql, params=()):
+        with self.lock, self.conn:
+            self.conn.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+    def _touch_url(self, url):
+        """Make sure url has a row (pending until something happens to it)"""
+        self._execute(
+            "INSERT OR IGNORE INTO urls (url, status, updated_at) VALUES (?, 'pending', ?)",
+            (url, datetime.now().isoformat())
+        )
+
+    # Batch progress
+
+    def add_urls(self, urls):
+        """Register the URLs of a batch as pending (known URLs keep their state)"""
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, status, updated_at) VALUES (?, 'pending', ?)",
+                [(url, now) for url in urls]
+            )
+
+    def start_url(self, url, output_dir=None):
+        """Mark a URL as being scraped (one more attempt)"""
+        now = datetime.now().isoformat()
+        self._touch_url(url)
+        self._execute(
+            "UPDATE urls SET status = 'running', attempts = attempts + 1, output_dir = ?, "
+            "started_at = ?, updated_at = ? WHERE url = ?",
+            (str(output_dir) if output_dir is not None else None, now, now, url)
+        )
+
+    def complete_url(self, url):
+        """Mark a URL as completed; its remix checkpoint is cleared"""
+        self._touch_url(url)
+        self._execute(
+            "UPDATE urls SET status = 'completed', last_error = NULL, last_completed_index = -1, "
+            "updated_at = ? WHERE url = ?",
+            (datetime.now().isoformat(), url)
+        )
+
+    def fail_url(self, url, error):
+        """Mark a URL as failed with the error that stopped it"""
+        self._touch_url(url)
+        self._execute(
+            "UPDATE urls SET status = 'failed', last_error = ?, updated_at = ? WHERE url = ?",
+            (str(error)[:1000], datetime.now().isoformat(), url)
+        )
+
+    def is_completed(self, url):
+        return bool(self._query("SELECT 1 FROM urls WHERE url = ? AND status = 'completed'", (url,)))
+
+    def completed_count(self):
+        return self._query("SELECT COUNT(*) AS n FROM urls WHERE status = 'completed'")[0]["n"]
+
+    # Remix checkpoint (last remix index finished in order, downloads included)
+
+    def last_completed_index(self, url):
+        rows = self._query("SELECT last_completed_index FROM urls WHERE url = ?", (url,))
+        return rows[0]["last_completed_index"] if rows else -1
+
+    def save_checkpoint(self, url, index):
+        self._touch_url(url)
+        self._execute(
+            "UPDATE urls SET last_completed_index = ?, updated_at = ? WHERE url = ?",
+            (index, datetime.now().isoformat(), url)
+        )
+
+    def clear_checkpoint(self, url):
+        self._execute(
+            "UPDATE urls SET last_completed_index = -1, updated_at = ? WHERE url = ?",
+            (datetime.now().isoformat(), url)
+        )
+
+    # Remix URLs collected for a start URL (--by-url)
+
+    def load_remix_urls(self, url):
+        """
+        Returns:
+            tuple: (remix URLs, all_loaded), or (None, False) if none were saved
+        """
+        rows = self._query("SELECT remix_urls, all_loaded FROM urls WHERE url = ?", (url,))
+        if not rows or not rows[0]["remix_urls"]:
+            return None, False
+        return json.loads(rows[0]["remix_urls"]), bool(rows[0]["all_loaded"])
+
+    def save_remix_urls(self, url, remix_urls, all_loaded):
+        self._touch_url(url)
+        self._execute(
+            "UPDATE urls SET remix_urls = ?, all_loaded = ?, updated_at = ? WHERE url = ?",
+            (json.dumps(remix_urls), int(bool(all_loaded)), datetime.now().isoformat(), url)
+        )
+
+    # Per-remix state
+
+    def record_remix(self, url, remix_index, status, remix_url=None, error=None):
+        """
+        Record the outcome of one remix of a start URL
+
+        Args:
+            url: Start URL
+            remix_index: 0-based remix index
+            status: One of REMIX_STATUSES
+            remix_url: Page URL of the remix, if known
+            error: Error message when status is 'failed'
+        """
+        if status not in REMIX_STATUSES:
+            raise ValueError(f"Unknown remix status: {status}")
+        self._execute(
+            "INSERT INTO remixes (url, remix_index, remix_url, status, attempts, last_error, updated_at) "
+            "VALUES (?, ?, ?, ?, 1, ?, ?) "
+            "ON CONFLICT(url, remix_index) DO UPDATE SET "
+            "remix_url = COALESCE(excluded.remix_url, remix_url), status = excluded.status, "
+            "attempts = attempts + 1, last_error = excluded.last_error, updated_at = excluded.updated_at",
+            (url, remix_index, remix_url, status, str(error)[:1000] if error else None,
+             datetime.now().isoformat())
+        )
+
+    # Queries
+
+    def urls(self, status=None):
+        """URL rows, optionally only those with the given status"""
+        if status:
+            return self._query("SELECT * FROM urls WHERE status = ? ORDER BY updated_at", (status,))
+        return self._query("SELECT * FROM urls ORDER BY updated_at")
+
+    def remixes(self, status=None, url=None):
+        """Remix rows, optionally filtered by status and start URL"""
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if url:
+            conditions.append("url = ?")
+            params.append(url)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(f"SELECT * FROM remixes {where} ORDER BY url, remix_index", params)
+
+    def summary(self):
+        """Number of URLs and remixes per status"""
+        return {
+            "urls": {row["status"]: row["n"] for row in self._query(
+                "SELECT status, COUNT(*) AS n FROM urls GROUP BY status")},
+            "remixes": {row["status"]: row["n"] for row in self._query(
+                "SELECT status, COUNT(*) AS n FROM remixes GROUP BY status")},
+        }
+
+    def _read_legacy_file(self, path):
+        """Content of a legacy JSON file (dict), or None if missing or unreadable"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _retire_legacy_file(self, path):
+        """Rename an imported legacy file so it is imported only once"""
+        path = Path(path)
+        try:
+            path.rename(path.with_name(path.name + ".imported"))
+        except FileNotFoundError:
+            pass  # Imported by another worker at the same time
+
+    def import_json_progress(self, progress_file):
+        """
+        Import the completed URLs of a legacy .batch_progress.json file (once)
+
+        Returns:
+            int: Number of URLs imported
+        """
+        data = self._read_legacy_file(progress_file)
+        if data is None:
+            return 0
+        completed = data.get("completed_urls", [])
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, status, updated_at) VALUES (?, 'completed', ?)",
+                [(url, now) for url in completed]
+            )
+        self._retire_legacy_file(progress_file)
+        return len(completed)
+
+    def import_json_checkpoints(self, checkpoint_file):
+        """
+        Import the resume positions of a legacy .scrape_checkpoint.json file (once); a
+        position already further along in the store is kept
+
+        Returns:
+            int: Number of checkpoints imported
+        """
+        data = self._read_legacy_file(checkpoint_file)
+        if data is None:
+            return 0
+        imported = 0
+        for url, checkpoint in data.items():
+            index = checkpoint.get("last_completed_index", -1) if isinstance(checkpoint, dict) else -1
+            if index < 0 or self.is_completed(url) or self.last_completed_index(url) >= index:
+                continue
+            self.save_checkpoint(url, index)
+            imported += 1
+        self._retire_legacy_file(checkpoint_file)
+        return imported
+
+    def import_json_remix_urls(self, remix_urls_file):
+        """
+        Import the remix URL lists of a legacy .remix_urls.json file (once); lists
+        already in the store are kept
+
+        Returns:
+            int: Number of start URLs whose remix URLs were imported
+        """
+        data = self._read_legacy_file(remix_urls_file)
+        if data is None:
+            return 0
+        imported = 0
+        for url, saved in data.items():
+            if not isinstance(saved, dict) or not saved.get("urls"):
+                continue
+            if self.load_remix_urls(url)[0] is not None:
+                continue
+            self.save_remix_urls(url, saved["urls"], saved.get("all_loaded", False))
+            imported += 1
+        self._retire_legacy_file(remix_urls_file)
+        return imported
+
+    def import_legacy_files(self, directory):
+        """
+        Import every legacy JSON progress file found in a directory (once each)
+
+        Returns:
+            dict: Number of completed URLs, checkpoints and remix URL lists imported
+        """
+        directory = Path(directory)
+        return {
+            "completed_urls": self.import_json_progress(directory / LEGACY_PROGRESS_FILE),
+            "checkpoints": self.import_json_checkpoints(directory / LEGACY_CHECKPOINT_FILE),
+            "remix_urls": self.import_json_remix_urls(directory / LEGACY_REMIX_URLS_FILE),
+        }
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def main():
+    """Query the progress database"""
+    parser = argparse.ArgumentParser(
+        description="Show scraping progress and list failed or unfinished items",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Summary of a batch
+  python progress_store.py videos/.scrape_progress.db
+
+  # URLs that failed, with their last error
+  python progress_store.py videos/.scrape_progress.db --status failed
+
+  # Re-run only the failed URLs
+  python progress_store.py videos/.scrape_progress.db --status failed --urls-only > retry.txt
+  python scraper.py --batch retry.txt --output videos
+
+  # Remixes that failed for every URL
+  python progress_store.py videos/.scrape_progress.db --remixes --status failed
+        """
+    )
+    parser.add_argument("db", help="Progress database (<output>/.scrape_progress.db)")
+    parser.add_argument("--status", choices=sorted(set(URL_STATUSES + REMIX_STATUSES)), help="Only list items with this status")
+    parser.add_argument("--remixes", action="store_true", help="List remixes instead of start URLs")
+    parser.add_argument("--url", type=str, default=None, help="With --remixes: only the remixes of this start URL")
+    parser.add_argument("--urls-only", action="store_true", help="Print bare URLs (one per line, usable with --batch)")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        parser.error(f"Progress database not found: {args.db}")
+
+    store = ProgressStore(args.db)
+    try:
+        if args.remixes:
+            rows = store.remixes(status=args.status, url=args.url)
+            for row in rows:
+                if args.urls_only:
+                    if row["remix_url"]:
+                        print(row["remix_url"])
+                    continue
+                error = f"  {row['last_error']}" if row["last_error"] else ""
+                print(f"{row['status']:<10} #{row['remix_index']:<4} {row['remix_url'] or '-'}  "
+                      f"(attempts: {row['attempts']}, {row['updated_at']}){error}")
+        elif args.status:
+            for row in store.urls(status=args.status):
+                if args.urls_only:
+                    print(row["url"])
+                    continue
+                error = f"\n    {row['last_error']}" if row["last_error"] else ""
+                print(f"{row['status']:<10} {row['url']}  (attempts: {row['attempts']}, "
+                      f"remix checkpoint: {row['last_completed_index']}, {row['updated_at']}){error}")
+        else:
+            summary = store.summary()
+            print("📊 URLs:")
+            for status in URL_STATUSES:
+                print(f"   {status:<10} {summary['urls'].get(status, 0)}")
+            print("📊 Remixes:")
+            for status in REMIX_STATUSES:
+                print(f"   {status:<10} {summary['remixes'].get(status, 0)}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Remix Frontier - Persistent crawl queue and visited index for remix trees
+
+Every post found while crawling a remix tree gets one row, keyed by Sora post id, so a
+post reached through several branches (or by a previous run) is only visited once.
+Queued posts are handed out breadth-first: lowest depth first and, within a depth, the
+most popular branch first (likes + remixes of the post, or of its parent until the post
+itself has been visited). The queue lives in SQLite (WAL), so an interrupted crawl
+resumes where it stopped and several browser workers can pull from it at once.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from content_index import ContentIndex
+
+STATUSES = ("queued", "claimed", "done", "failed")
+
+
+class RemixFrontier:
+    """Crawl frontier of a remix tree; safe to use from several worker threads"""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS nodes (
+                    post_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    parent_post_id TEXT,
+                    depth INTEGER NOT NULL,
+                    popularity INTEGER NOT NULL DEFAULT 0,
+                    likes INTEGER,
+                    remixes INTEGER,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    seq INTEGER,
+                    discovered_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_nodes_queue ON nodes(status, depth, popularity)"
+            )
+
+    def _now(self):
+        return datetime.now().isoformat()
+
+    def add(self, url, depth, parent_post_id=None, popularity=0):
+        """
+        Add a post to the frontier unless it is already known (queued, visited or failed)
+
+        Args:
+            url: Page URL of the post
+            depth: Distance from the root post
+            parent_post_id: Post id of the post it was found on
+            popularity: Priority within its depth (higher is visited first)
+
+        Returns:
+            bool: True if the post was new
+        """
+        post_id = ContentIndex.post_id_from_url(url)
+        now = self._now()
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO nodes (post_id, url, parent_post_id, depth, popularity, seq, "
+                "discovered_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM nodes), ?, ?)",
+                (post_id, url, parent_post_id, depth, popularity, now, now)
+            )
+        return cursor.rowcount == 1
+
+    def claim(self, max_depth=None):
+        """
+        Take the next post to visit (marked 'claimed' so no other worker gets it)
+
+        Args:
+            max_depth: Leave deeper posts queued (None = no limit)
+
+        Returns:
+            dict: Node row, or None if nothing is queued within max_depth
+        """
+        depth_filter = "" if max_depth is None else "AND depth <= ?"
+        params = () if max_depth is None else (max_depth,)
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                f"SELECT * FROM nodes WHERE status = 'queued' {depth_filter} "
+                "ORDER BY depth, popularity DESC, seq LIMIT 1",
+                params
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE nodes SET status = 'claimed', attempts = attempts + 1, updated_at = ? "
+                "WHERE post_id = ?",
+                (self._now(), row["post_id"])
+            )
+        return dict(row, status="claimed", attempts=row["attempts"] + 1)
+
+    def complete(self, post_id, likes=None, remixes=None):
+        """Mark a claimed post as visited, with the counts read on its page"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE nodes SET status = 'done', likes = ?, remixes = ?, last_error = NULL, "
+                "updated_at = ? WHERE post_id = ?",
+                (likes, remixes, self._now(), post_id)
+            )
+
+    def fail(self, post_id, error, max_attempts=2):
+        """Put a claimed post back in the queue, or mark it failed after max_attempts"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE nodes SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "last_error = ?, updated_at = ? WHERE post_id = ?",
+                (max_attempts, str(error)[:1000], self._now(), post_id)
+            )
+
+    def release_claimed(self):
+        """
+        Requeue posts claimed by a run that was interrupted (the interrupted visit does not
+        count as an attempt); returns how many
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE nodes SET status = 'queued', attempts = MAX(attempts - 1, 0), updated_at = ? "
+                "WHERE status = 'claimed'",
+                (self._now(),)
+            )
+        return cursor.rowcount
+
+    def counts(self):
+        """Number of posts per status"""
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM nodes GROUP BY status").fetchall()
+        counts = {status: 0 for status in STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def urls(self, statuses=STATUSES):
+        """URLs of the posts with the given statuses, in crawl order"""
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT url FROM nodes WHERE status IN ({', '.join('?' for _ in statuses)}) "
+                "ORDER BY depth, seq",
+                tuple(statuses)
+            ).fetchall()
+        return [row["url"] for row in rows]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
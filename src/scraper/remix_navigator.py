@@ -5,60 +5,131 @@ Remix Navigator - Handles finding and loading remix buttons
 
 import time
 import random
-from selenium.webdriver.common.by import By
+
+from page_waits import PageWaiter
+
+
+# Remix thumbnails are the h-8 w-6 buttons (the "Load more" button has a 1.5px border).
+# The filter runs in the page so the whole list comes back in one WebDriver round-trip.
+_REMIX_BUTTONS_JS = """
+const buttons = Array.from(document.getElementsByTagName('button')).filter(b => {
+    const cls = b.getAttribute('class') || '';
+    return cls.includes('h-8') && cls.includes('w-6') && !cls.includes('border-[1.5px]');
+});
+"""
+
+# "Load more" button: w-4 shrink-0 button with a backdrop-blur div inside
+_LOAD_MORE_BUTTON_JS = """
+return Array.from(document.getElementsByTagName('button')).find(b => {
+    const cls = b.getAttribute('class') || '';
+    return cls.includes('w-4') && cls.includes('shrink-0')
+        && Array.from(b.getElementsByTagName('div'))
+            .some(d => (d.getAttribute('class') || '').includes('backdrop-blur'));
+}) || null;
+"""
+
+# Scroll to the remix button at arguments[0] and click it, all in the page
+_CLICK_REMIX_BUTTON_JS = _REMIX_BUTTONS_JS + """
+const index = arguments[0];
+if (index >= buttons.length) {
+    return {count: buttons.length, clicked: false};
+}
+const button = buttons[index];
+button.scrollIntoView({block: 'center', inline: 'center'});
+button.click();
+return {
+    count: buttons.length,
+    clicked: true,
+    cls: button.getAttribute('class'),
+    html: button.outerHTML.slice(0, 200)
+};
+"""
+
+# Page URL of each remix button when it is (or sits in) a link, else null
+_REMIX_HREFS_JS = _REMIX_BUTTONS_JS + """
+return buttons.map(b => {
+    const link = b.closest('a[href]') || b.querySelector('a[href]');
+    return link ? link.href : null;
+});
+"""
 
 
 class RemixNavigator:
     """Manages remix button detection and loading"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, slow_mode=False):
         self.driver = driver
+        self.slow_mode = slow_mode
+        self.waiter = PageWaiter(driver)
+    
+    def _min_delay(self, min_delay, max_delay):
+        """Random human-like delay kept as a minimum in slow mode (0 otherwise)"""
+        return random.uniform(min_delay, max_delay) if self.slow_mode else 0
     
     def get_remix_buttons(self):
         """Get all remix thumbnail buttons on current page"""
         try:
-            all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            
-            # Filter for remix buttons (h-8 w-6 classes, not the load more button)
-            remix_buttons = []
-            for b in all_buttons:
-                try:
-                    class_attr = b.get_attribute("class") or ""
-                    if ("h-8" in class_attr 
-                        and "w-6" in class_attr 
-                        and "border-[1.5px]" not in class_attr):
-                        remix_buttons.append(b)
-                except:
-                    # Skip stale elements
-                    continue
-            
-            # Debug: Show what we found
-            # Uncomment for very verbose debugging:
-            # print(f"   🔍 DEBUG: Found {len(remix_buttons)} remix buttons out of {len(all_buttons)} total buttons")
-            
-            return remix_buttons
+            return self.driver.execute_script(_REMIX_BUTTONS_JS + "return buttons;") or []
         except:
             return []
     
+    def count_remix_buttons(self):
+        """Count the remix thumbnail buttons on current page (without fetching them)"""
+        try:
+            return self.driver.execute_script(_REMIX_BUTTONS_JS + "return buttons.length;") or 0
+        except:
+            return 0
+    
     def find_load_more_button(self):
         """Find the 'Load more' button"""
-        all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
+        try:
+            return self.driver.execute_script(_LOAD_MORE_BUTTON_JS)
+        except:
+            return None
+    
+    def collect_remix_urls(self, max_count=None, timeout=5.0):
+        """
+        Harvest the page URL of every loaded remix, so remixes can then be visited
+        directly with driver.get
         
-        for button in all_buttons:
+        Links are read in-page; buttons without a link are clicked one after the other
+        (the remix strip stays on the page) and the URL they navigate to is recorded.
+        
+        Args:
+            max_count: Maximum number of remix URLs to collect (None = all loaded)
+            timeout: Seconds to wait for the URL to change after each click
+        
+        Returns:
+            list: Remix page URLs by button index (None where no URL could be found)
+        """
+        try:
+            urls = self.driver.execute_script(_REMIX_HREFS_JS) or []
+        except Exception as e:
+            print(f"⚠️  Could not read remix links: {e}")
+            urls = []
+        if max_count is not None:
+            urls = urls[:max_count]
+        
+        missing = [index for index, url in enumerate(urls) if not url]
+        if missing:
+            print(f"🔗 Collecting {len(missing)} remix URL(s) by clicking through the thumbnails...")
+        for index in missing:
+            previous_url = self.driver.current_url
             try:
-                classes = button.get_attribute("class") or ""
-                # Load more button has w-4 and shrink-0 classes
-                if "w-4" in classes and "shrink-0" in classes:
-                    # Check for backdrop-blur div child
-                    divs = button.find_elements(By.TAG_NAME, "div")
-                    for div in divs:
-                        div_classes = div.get_attribute("class") or ""
-                        if "backdrop-blur" in div_classes:
-                            return button
-            except:
+                result = self.driver.execute_script(_CLICK_REMIX_BUTTON_JS, index)
+            except Exception as e:
+                print(f"   ⚠️  Could not click remix {index}: {e}")
                 continue
+            if not result["clicked"]:
+                break
+            if self.waiter.url_change(previous_url, timeout=timeout):
+                urls[index] = self.driver.current_url
+            else:
+                print(f"   ⚠️  Remix {index} did not navigate anywhere")
         
-        return None
+        found = sum(1 for url in urls if url)
+        print(f"✅ Collected {found}/{len(urls)} remix URLs\n")
+        return urls
     
     def load_all_remixes(self, target_count=None):
         """
@@ -84,8 +155,7 @@ class RemixNavigator:
         
         for attempt in range(max_attempts):
             # Count current remixes
-            remix_buttons = self.get_remix_buttons()
-            current_count = len(remix_buttons)
+            current_count = self.count_remix_buttons()
             
             print(f"[Attempt {attempt + 1}] Currently visible: {current_count} remixes")
             
@@ -109,27 +179,30 @@ class RemixNavigator:
                 )
                 
                 # Random human-like delay
-                delay = random.uniform(1.5, 2.5)
-                time.sleep(delay)
+                delay = self._min_delay(1.5, 2.5)
+                if delay:
+                    time.sleep(delay)
                 
                 # Click
                 load_more_button.click()
                 load_more_clicks += 1
                 
                 # Wait for new content
-                time.sleep(random.uniform(2.0, 3.0))
+                if not self.waiter.count_change(self.count_remix_buttons, current_count, timeout=10,
+                                                min_delay=self._min_delay(2.0, 3.0)):
+                    print("   ⏳ No new remixes appeared after 10s")
                 
             except Exception as e:
                 print(f"⚠️  Could not click 'Load more': {e}\n")
                 break
         
         # Final count
-        final_buttons = self.get_remix_buttons()
+        final_count = self.count_remix_buttons()
         print(f"✅ Finished loading!")
-        print(f"   Total remixes visible: {len(final_buttons)}")
+        print(f"   Total remixes visible: {final_count}")
         print(f"   'Load more' clicks: {load_more_clicks}\n")
         
-        return len(final_buttons)
+        return final_count
     
     def click_remix_button(self, button_index):
         """
@@ -148,39 +221,19 @@ class RemixNavigator:
             current_url_before = self.driver.current_url
             print(f"   🔍 DEBUG: Current URL before click: {current_url_before}")
             
-            # Get fresh buttons
-            buttons = self.get_remix_buttons()
-            print(f"   🔍 DEBUG: Found {len(buttons)} total remix buttons")
+            # Find, scroll to and click the button in a single round-trip
+            result = self.driver.execute_script(_CLICK_REMIX_BUTTON_JS, button_index)
+            print(f"   🔍 DEBUG: Found {result['count']} total remix buttons")
             
-            if button_index >= len(buttons):
-                print(f"   ⚠️  Button index {button_index} out of range (only {len(buttons)} buttons)")
+            if not result["clicked"]:
+                print(f"   ⚠️  Button index {button_index} out of range (only {result['count']} buttons)")
                 return False
             
-            button = buttons[button_index]
-            
-            # Debug: Get button attributes
-            try:
-                button_class = button.get_attribute("class")
-                button_html = button.get_attribute("outerHTML")[:200]  # First 200 chars
-                print(f"   🔍 DEBUG: Button class: {button_class}")
-                print(f"   🔍 DEBUG: Button HTML: {button_html}...")
-            except Exception as e:
-                print(f"   🔍 DEBUG: Could not get button attributes: {e}")
-            
-            # Scroll to button
-            print(f"   🔍 DEBUG: Scrolling to button...")
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
-                button
-            )
-            time.sleep(0.5)
-            
-            # Click
-            print(f"   🔍 DEBUG: Clicking button...")
-            button.click()
+            print(f"   🔍 DEBUG: Button class: {result['cls']}")
+            print(f"   🔍 DEBUG: Button HTML: {result['html']}...")
             
-            # Wait and check URL changed
-            time.sleep(2.0)
+            # Wait for the URL to change
+            self.waiter.url_change(current_url_before, timeout=10, min_delay=self._min_delay(2.0, 2.0))
             current_url_after = self.driver.current_url
             print(f"   🔍 DEBUG: Current URL after click: {current_url_after}")
             
@@ -190,7 +243,9 @@ class RemixNavigator:
             else:
                 print(f"   ✅ DEBUG: Successfully navigated to new URL")
             
-            time.sleep(random.uniform(1.0, 2.0))
+            delay = self._min_delay(1.0, 2.0)
+            if delay:
+                time.sleep(delay)
             
             return True
         
@@ -210,16 +265,4 @@ class RemixNavigator:
         Returns:
             bool: True if page reloaded successfully
         """
-        max_wait = 10
-        wait_start = time.time()
-        
-        while time.time() - wait_start < max_wait:
-            try:
-                buttons = self.get_remix_buttons()
-                if len(buttons) >= min_buttons_needed:
-                    return True
-            except:
-                pass
-            time.sleep(0.5)
-        
-        return False
+        return self.waiter.until(lambda: self.count_remix_buttons() >= min_buttons_needed, timeout=10)
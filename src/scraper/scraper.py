@@ -8,7 +8,7 @@ Clean approach:
 3. For each index:
    - Get fresh buttons
    - Click button[i]
-   - Download video
+   - Queue the video download (runs in background threads)
    - Go back
    - Wait for page reload
    - Continue to next index
@@ -19,32 +19,54 @@ import random
 import json
 import pathlib
 import argparse
-from datetime import datetime
+import threading
 
-from browser_manager import BrowserManager
+from browser_manager import BrowserManager, DEFAULT_CACHE_DIR
 from remix_navigator import RemixNavigator
 from video_downloader import VideoDownloader
 from metadata_extractor import MetadataExtractor
+from download_pool import DownloadPool
+from content_index import ContentIndex
+from network_capture import NetworkCapture
+from parallel_batch import ParallelBatchRunner
+from page_waits import PageWaiter
+from progress_store import ProgressStore
+from metadata_sink import MetadataSink, METADATA_STREAM_NAME, COMBINED_FILE_NAME, compact, write_combined_json
 
 
 class SoraRemixScraper:
     """Main scraper orchestrator"""
     
-    def __init__(self, use_existing_chrome=False, debug_port=9222, output_dir="videos", slow_mode=False):
-        self.browser_mgr = BrowserManager(use_existing_chrome, debug_port)
+    def __init__(self, use_existing_chrome=False, debug_port=9222, output_dir="videos", slow_mode=False,
+                 download_workers=3, content_index_path=None, capture_network=False, visit_by_url=False,
+                 download_slots=None, progress_db_path=None, fast_load=False, browser_cache_dir=None):
+        self.browser_mgr = BrowserManager(use_existing_chrome, debug_port, capture_network, fast_load, browser_cache_dir)
         self.driver = None
+        self.waiter = None
         self.navigator = None
         self.downloader = None
         self.metadata_extractor = None
+        self.metadata_sink = None
+        self.capture_network = capture_network
+        self.capture = None
+        self.visit_by_url = visit_by_url
         self.output_dir = pathlib.Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.slow_mode = slow_mode
         self.use_existing_chrome = use_existing_chrome
         self.debug_port = debug_port
+        self.download_workers = max(1, download_workers)
+        # Optional semaphore capping downloads across several scrapers (parallel batches)
+        self.download_slots = download_slots
         
-        # Progress tracking
-        self.progress_file = self.output_dir / ".batch_progress.json"
-        self.checkpoint_file = self.output_dir / ".scrape_checkpoint.json"
+        # Posts and videos already scraped, shared by every run and every URL of a batch
+        self.content_index = ContentIndex(content_index_path or self.output_dir / ".content_index.db")
+        self.already_scraped = 0
+        
+        # Progress tracking: batch progress, remix checkpoints and per-remix state, keyed
+        # by start URL (shared by every URL of a batch and by parallel workers)
+        self.progress = ProgressStore(progress_db_path or self.output_dir / ".scrape_progress.db")
+        self.import_legacy_progress(self.output_dir)
         
         # Slow mode delays (in seconds)
         if slow_mode:
@@ -69,9 +91,20 @@ class SoraRemixScraper:
     def setup(self):
         """Initialize all components"""
         self.driver = self.browser_mgr.setup()
-        self.navigator = RemixNavigator(self.driver)
+        self.waiter = PageWaiter(self.driver)
+        self.navigator = RemixNavigator(self.driver, slow_mode=self.slow_mode)
         self.downloader = VideoDownloader(self.driver)
         self.metadata_extractor = MetadataExtractor(self.driver)
+        self._setup_capture()
+    
+    def _setup_capture(self):
+        """Start reading the page's API responses (capture mode only)"""
+        self.capture = None
+        if self.capture_network:
+            capture = NetworkCapture(self.driver)
+            if capture.enable():
+                print("📡 Network capture enabled - metadata and remix lists come from API responses")
+                self.capture = capture
     
     def _sleep(self, delay_type):
         """
@@ -88,6 +121,59 @@ class SoraRemixScraper:
             else:
                 time.sleep(delay)
     
+    def _wait(self, delay_type, previous_url=None, previous_video=None, wait_for_video=True):
+        """
+        Wait for the page event matching a delay type instead of a fixed delay:
+        'page_load' waits for the document and network to settle, 'after_click' for the
+        URL to leave previous_url and then for a video other than previous_video,
+        'before_download' for the video. In slow mode the random delay is kept as a
+        minimum so the pacing stays human-like.
+        
+        Args:
+            delay_type: Type of delay ('page_load', 'after_click', 'before_download')
+            previous_url: URL before the click ('after_click')
+            previous_video: Video src before the click ('after_click')
+            wait_for_video: Whether to wait for the video after a click (not needed when
+                only metadata is scraped)
+        """
+        if self.waiter is None:
+            self._sleep(delay_type)
+            return
+        min_delay = random.uniform(*self.delays[delay_type]) if self.slow_mode else 0
+        if delay_type == 'page_load':
+            self.waiter.page_loaded(timeout=15, min_delay=min_delay)
+        elif delay_type == 'after_click':
+            started = time.monotonic()
+            if previous_url is not None:
+                self.waiter.url_change(previous_url, timeout=10)
+            if wait_for_video:
+                self.waiter.video_ready(timeout=10, previous_src=previous_video)
+            remaining = min_delay - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+        elif delay_type == 'before_download':
+            self.waiter.video_ready(timeout=10, min_delay=min_delay)
+        else:
+            self._sleep(delay_type)
+    
+    def import_legacy_progress(self, directory):
+        """
+        Import the JSON progress files older versions wrote in an output directory
+        (completed batch URLs, remix checkpoints, collected remix URLs), so an
+        interrupted run resumes where it stopped
+        """
+        try:
+            imported = self.progress.import_legacy_files(directory)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not import legacy progress files from {directory}: {e}")
+            return
+        if imported["completed_urls"]:
+            print(f"📥 Imported {imported['completed_urls']} completed URL(s) from {pathlib.Path(directory) / '.batch_progress.json'}")
+        if imported["checkpoints"]:
+            print(f"📥 Imported {imported['checkpoints']} remix checkpoint(s) from {pathlib.Path(directory) / '.scrape_checkpoint.json'}")
+        if imported["remix_urls"]:
+            print(f"📥 Imported saved remix URLs of {imported['remix_urls']} URL(s) from {pathlib.Path(directory) / '.remix_urls.json'}")
+    
     def _is_session_error(self, exception):
         """Check if exception is a session/connection error"""
         error_keywords = [
@@ -101,98 +187,45 @@ class SoraRemixScraper:
         error_msg = str(exception).lower()
         return any(keyword in error_msg for keyword in error_keywords)
     
-    def _load_progress(self):
-        """Load batch processing progress from file"""
-        if self.progress_file.exists():
-            try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {"completed_urls": []}
-        return {"completed_urls": []}
-    
-    def _save_progress(self, url):
-        """Save completed URL to progress file"""
+    def _load_remix_urls(self, url, max_remixes=None):
+        """
+        Load the remix URLs collected by a previous run for a start URL
+        
+        Returns:
+            list: Remix URLs, or None if none were saved (or too few for max_remixes)
+        """
         try:
-            progress = self._load_progress()
-            if url not in progress["completed_urls"]:
-                progress["completed_urls"].append(url)
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            remix_urls, all_loaded = self.progress.load_remix_urls(url)
         except Exception as e:
-            print(f"⚠️  Warning: Could not save progress: {e}")
-    
-    def _is_completed(self, url):
-        """Check if URL has already been processed"""
-        progress = self._load_progress()
-        return url in progress["completed_urls"]
+            print(f"⚠️  Warning: Could not load remix URLs: {e}")
+            return None
+        if not remix_urls:
+            return None
+        if all_loaded or (max_remixes and len(remix_urls) >= max_remixes):
+            return remix_urls
+        return None
     
-    def _load_checkpoint(self, url):
-        """Load checkpoint for a specific URL"""
-        if self.checkpoint_file.exists():
-            try:
-                with open(self.checkpoint_file, 'r') as f:
-                    checkpoints = json.load(f)
-                    return checkpoints.get(url, {"last_completed_index": -1})
-            except:
-                return {"last_completed_index": -1}
-        return {"last_completed_index": -1}
-    
-    def _save_checkpoint(self, url, index):
-        """Save checkpoint after processing a remix"""
+    def _save_remix_urls(self, url, remix_urls, all_loaded):
+        """Save the remix URLs collected for a start URL"""
         try:
-            checkpoints = {}
-            if self.checkpoint_file.exists():
-                try:
-                    with open(self.checkpoint_file, 'r') as f:
-                        checkpoints = json.load(f)
-                except:
-                    pass
-            
-            checkpoints[url] = {
-                "last_completed_index": index,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoints, f, indent=2)
-        except Exception as e:
-            print(f"⚠️  Warning: Could not save checkpoint: {e}")
-    
-    def _clear_checkpoint(self, url):
-        """Clear checkpoint for a URL after successful completion"""
-        try:
-            if self.checkpoint_file.exists():
-                with open(self.checkpoint_file, 'r') as f:
-                    checkpoints = json.load(f)
-                
-                if url in checkpoints:
-                    del checkpoints[url]
-                    
-                with open(self.checkpoint_file, 'w') as f:
-                    json.dump(checkpoints, f, indent=2)
+            self.progress.save_remix_urls(url, remix_urls, all_loaded)
         except Exception as e:
-            print(f"⚠️  Warning: Could not clear checkpoint: {e}")
+            print(f"⚠️  Warning: Could not save remix URLs: {e}")
     
     def _recover_session(self):
         """Attempt to recover browser session if lost"""
         try:
             print("🔄 Browser session lost, attempting to reconnect...")
             
-            # Close old session if it exists
-            try:
-                if self.driver:
-                    self.driver.quit()
-            except:
-                pass
-            
-            # Reinitialize browser completely
+            # New browser session on the already running chromedriver (the old
+            # session is quit if it is still alive)
             print("   🔧 Restarting Chrome browser...")
-            self.browser_mgr = BrowserManager(self.use_existing_chrome, self.debug_port)
-            self.driver = self.browser_mgr.setup()
+            self.driver = self.browser_mgr.restart()
+            self.waiter = PageWaiter(self.driver)
             self.navigator = RemixNavigator(self.driver, slow_mode=self.slow_mode)
             self.downloader = VideoDownloader(self.driver)
             self.metadata_extractor = MetadataExtractor(self.driver)
+            self._setup_capture()
             
             print("✅ Browser session recovered")
             return True
@@ -220,8 +253,7 @@ class SoraRemixScraper:
         print(f"Output directory: {self.output_dir}")
         
         # Check for checkpoint
-        checkpoint = self._load_checkpoint(start_url)
-        last_completed = checkpoint["last_completed_index"]
+        last_completed = self.progress.last_completed_index(start_url)
         
         if last_completed >= 0:
             print(f"📍 Found checkpoint: Last completed remix index = {last_completed}")
@@ -235,7 +267,7 @@ class SoraRemixScraper:
                 print(f"🌐 Navigating to start URL...")
                 print(f"🔍 DEBUG: Start URL = {start_url}")
                 self.driver.get(start_url)
-                self._sleep('page_load')
+                self._wait('page_load')
                 
                 # Verify we're on the right page
                 actual_url = self.driver.current_url
@@ -251,12 +283,38 @@ class SoraRemixScraper:
                         continue
                 raise
         
-        # Step 1: Load all remixes
-        total_loaded = self.navigator.load_all_remixes(target_count=max_remixes)
-        
-        if total_loaded == 0:
-            print("❌ No remixes found!")
-            return []
+        # In URL mode, remix URLs collected by a previous run are reused as they are
+        remix_urls = self._load_remix_urls(start_url, max_remixes) if self.visit_by_url else None
+        if remix_urls:
+            print(f"📍 Loaded {len(remix_urls)} saved remix URLs, skipping 'Load more'\n")
+            total_loaded = len(remix_urls)
+        else:
+            # Step 1: Load all remixes
+            total_loaded = self.navigator.load_all_remixes(target_count=max_remixes)
+            
+            if total_loaded == 0:
+                print("❌ No remixes found!")
+                return []
+            
+            # In capture mode the remix feed responses give the remix URLs directly, so each
+            # remix is opened by URL (or not opened at all) instead of clicked in the DOM
+            remix_urls = self._captured_remix_urls()
+            if remix_urls and len(remix_urls) < total_loaded:
+                # Some remix feed pages were not seen in the performance log
+                print(f"⚠️  Only {len(remix_urls)}/{total_loaded} remixes captured from the network, using the page instead")
+                remix_urls = None
+            if remix_urls:
+                print(f"📡 Captured {len(remix_urls)} remixes from the network\n")
+            elif self.visit_by_url:
+                remix_urls = self.navigator.collect_remix_urls(max_count=max_remixes)
+                if self.driver.current_url != actual_url:
+                    # Collecting clicked through the remixes; back to the start page
+                    self.driver.get(start_url)
+                    self._wait('page_load')
+            if remix_urls:
+                all_loaded = max_remixes is None or total_loaded < max_remixes
+                self._save_remix_urls(start_url, remix_urls, all_loaded)
+                total_loaded = len(remix_urls)
         
         # Step 2: Determine how many to process
         remixes_to_process = min(total_loaded, max_remixes) if max_remixes else total_loaded
@@ -267,8 +325,73 @@ class SoraRemixScraper:
         print(f"Will process: {remixes_to_process} remixes\n")
         
         all_metadata = []
-        successful_downloads = 0
+        self.already_scraped = 0
+        
+        # Every record is streamed to disk as it is produced (and again once its video is
+        # downloaded), so an interrupted run keeps the metadata it already scraped
+        self.metadata_sink = MetadataSink(self.output_dir / METADATA_STREAM_NAME)
+        
+        # Videos download in the background while the browser moves on to the next remix
+        download_pool = None
+        if download_videos:
+            download_pool = DownloadPool(self._download_and_index, max_workers=self.download_workers)
         
+        # The checkpoint only moves past a remix once its download has finished too,
+        # so an interrupted run never skips a video that was still downloading.
+        start_index = max(0, last_completed + 1)
+        finished_indexes = set()
+        next_checkpoint_index = [start_index]
+        checkpoint_lock = threading.Lock()
+        
+        def mark_remix_finished(index, status, remix_url=None, error=None):
+            try:
+                self.progress.record_remix(start_url, index, status, remix_url, error)
+            except Exception as e:
+                print(f"⚠️  Warning: Could not record remix {index}: {e}")
+            with checkpoint_lock:
+                finished_indexes.add(index)
+                last_finished = None
+                while next_checkpoint_index[0] in finished_indexes:
+                    last_finished = next_checkpoint_index[0]
+                    next_checkpoint_index[0] += 1
+                if last_finished is not None:
+                    try:
+                        self.progress.save_checkpoint(start_url, last_finished)
+                    except Exception as e:
+                        print(f"⚠️  Warning: Could not save checkpoint: {e}")
+        
+        try:
+            return self._scrape_remix_pages(
+                start_url, remixes_to_process, last_completed, start_index, max_remixes,
+                download_videos, download_pool, mark_remix_finished, all_metadata, remix_urls
+            )
+        finally:
+            if download_pool is not None:
+                download_pool.close()
+            self.metadata_sink.close()
+    
+    def _scrape_remix_pages(self, start_url, remixes_to_process, last_completed, start_index, max_remixes,
+                            download_videos, download_pool, mark_remix_finished, all_metadata,
+                            remix_urls=None):
+        """
+        Visit the start page and every remix, queueing their downloads on download_pool
+        
+        Args:
+            start_url: URL of the page with remixes
+            remixes_to_process: Number of remixes to visit
+            last_completed: Last remix index completed by a previous run (-1 if none)
+            start_index: First remix index to visit
+            max_remixes: Maximum number of remixes to scrape (for reloading after recovery)
+            download_videos: Whether to download videos or just metadata
+            download_pool: DownloadPool running the downloads (None for metadata only)
+            mark_remix_finished: Callable(index, status, remix_url, error) recording a remix
+                and advancing the checkpoint
+            all_metadata: List collecting the metadata of every page
+            remix_urls: Remix page URLs to visit by index (None to click the thumbnails)
+        
+        Returns:
+            list: all_metadata
+        """
         # Step 2.5: First, download the START page (if not already done)
         if last_completed < 0:  # Haven't processed start page yet
             print(f"[0/{remixes_to_process}] Processing START page...")
@@ -276,35 +399,9 @@ class SoraRemixScraper:
             
             try:
                 start_page_url = self.driver.current_url
-                
-                # Extract metadata
-                print(f"   📊 Extracting metadata from start page...")
-                metadata = self.metadata_extractor.extract_metadata(start_page_url)
-                
-                # Download video if requested
-                if download_videos:
-                    print(f"   🎥 Looking for video...")
-                    video_url = self.downloader.extract_video_url()
-                    
-                    if video_url:
-                        print(f"      ✅ Found video URL")
-                        metadata["video_url"] = video_url
-                        
-                        video_filename = f"remix_0000_start.mp4"
-                        video_path = self.output_dir / video_filename
-                        
-                        if self.downloader.download_video(video_url, video_path):
-                            metadata["downloaded_file"] = str(video_path)
-                            successful_downloads += 1
-                    else:
-                        print(f"      ⚠️  No video found")
-                
-                # Save metadata
-                metadata_file = self.output_dir / f"remix_0000_start_metadata.json"
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
-                print(f"   💾 Metadata saved: {metadata_file.name}")
-                
+                metadata = self._scrape_page(
+                    start_page_url, "remix_0000_start", download_videos, download_pool
+                )
                 all_metadata.append(metadata)
                 print()
                 
@@ -316,8 +413,6 @@ class SoraRemixScraper:
             print()
         
         # Step 3: Loop through remixes with checkpoint support
-        start_index = max(0, last_completed + 1)
-        
         if start_index > 0:
             print(f"🔄 Resuming from remix index {start_index}")
             print()
@@ -327,58 +422,51 @@ class SoraRemixScraper:
             print(f"🔍 DEBUG: Current page URL = {self.driver.current_url}")
             
             remix_success = False
+            remix_status, remix_error = "skipped", None
             max_remix_retries = 3
             
             for retry_attempt in range(max_remix_retries):
                 try:
-                    # Click the button at index i
-                    print(f"   🖱️  Clicking remix thumbnail {i}...")
-                    if not self.navigator.click_remix_button(i):
-                        print(f"   ⚠️  Skipping remix {i}")
-                        break
-                    
-                    self._sleep('after_click')
-                    
-                    current_url = self.driver.current_url
-                    print(f"   ✅ Navigated to: {current_url}")
-                    
-                    # Extract metadata
-                    print(f"   📊 Extracting metadata...")
-                    metadata = self.metadata_extractor.extract_metadata(current_url)
-                    
-                    # Download video if requested
-                    if download_videos:
-                        self._sleep('before_download')
-                        print(f"   🎥 Looking for video...")
-                        video_url = self.downloader.extract_video_url()
+                    if remix_urls:
+                        current_url = remix_urls[i]
+                        if not current_url:
+                            print(f"   ⚠️  No URL for remix {i}, skipping")
+                            break
+                        # Already scraped posts and feed payloads holding everything need
+                        # no page load at all
+                        known = self.content_index.find_post(ContentIndex.post_id_from_url(current_url))
+                        if not (known and self._is_already_scraped(known, download_videos)):
+                            if self._is_captured(current_url, download_videos):
+                                print(f"   📡 Using captured data for: {current_url}")
+                            else:
+                                print(f"   🌐 Opening: {current_url}")
+                                self.driver.get(current_url)
+                                self._wait('page_load')
+                    else:
+                        # Click the button at index i
+                        print(f"   🖱️  Clicking remix thumbnail {i}...")
+                        previous_url = self.driver.current_url
+                        previous_video = self.waiter.video_src() if download_videos else None
+                        if not self.navigator.click_remix_button(i):
+                            print(f"   ⚠️  Skipping remix {i}")
+                            break
                         
-                        if video_url:
-                            print(f"      ✅ Found video URL")
-                            metadata["video_url"] = video_url
-                            
-                            # Download
-                            video_filename = f"remix_{i+1:04d}.mp4"
-                            video_path = self.output_dir / video_filename
-                            
-                            if self.downloader.download_video(video_url, video_path):
-                                metadata["downloaded_file"] = str(video_path)
-                                successful_downloads += 1
-                                self._sleep('after_download')
-                        else:
-                            print(f"      ⚠️  No video found")
-                    
-                    # Save individual metadata
-                    metadata_file = self.output_dir / f"remix_{i+1:04d}_metadata.json"
-                    with open(metadata_file, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    print(f"   💾 Metadata saved: {metadata_file.name}")
+                        self._wait('after_click', previous_url, previous_video,
+                                   wait_for_video=download_videos)
+                        
+                        current_url = self.driver.current_url
+                        print(f"   ✅ Navigated to: {current_url}")
                     
+                    metadata = self._scrape_page(
+                        current_url, f"remix_{i+1:04d}", download_videos, download_pool,
+                        on_done=lambda success, index=i, url=current_url: mark_remix_finished(
+                            index, "completed" if success else "failed", url,
+                            None if success else "Video download failed"
+                        ),
+                        pace=True
+                    )
                     all_metadata.append(metadata)
                     
-                    # Save checkpoint after successful processing
-                    self._save_checkpoint(start_url, i)
-                    print(f"   💾 Checkpoint saved (index {i})")
-                    
                     remix_success = True
                     print()
                     break  # Success, exit retry loop
@@ -392,11 +480,16 @@ class SoraRemixScraper:
                         print(f"   🔄 Attempting to recover and continue...")
                         
                         if self._recover_session():
+                            if remix_urls:
+                                # Remixes are visited by URL: nothing to reload
+                                print(f"   🔄 Retrying remix {i}...")
+                                continue
+                            
                             # Navigate back to start URL
                             try:
                                 print(f"   🌐 Navigating back to: {start_url}")
                                 self.driver.get(start_url)
-                                self._sleep('page_load')
+                                self._wait('page_load')
                                 
                                 # Reload remixes
                                 print(f"   🔄 Reloading remixes...")
@@ -414,22 +507,32 @@ class SoraRemixScraper:
                         if len(error_msg) > 200:
                             error_msg = error_msg[:200] + "..."
                         print(f"   ❌ Error after {max_remix_retries} attempts: {error_msg}")
+                        remix_status, remix_error = "failed", error_msg
                         print()
                         break
             
             # Continue to next remix even if this one failed
             if not remix_success:
+                mark_remix_finished(i, remix_status, remix_urls[i] if remix_urls else None, remix_error)
                 continue
         
-        # Save combined metadata
-        combined_file = self.output_dir / "all_remixes_metadata.json"
-        with open(combined_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "scraped_at": datetime.now().isoformat(),
-                "total_remixes": len(all_metadata),
-                "successful_downloads": successful_downloads,
-                "remixes": all_metadata
-            }, f, indent=2, ensure_ascii=False)
+        successful_downloads = 0
+        if download_pool is not None:
+            pending = download_pool.pending()
+            if pending:
+                print(f"⏳ Waiting for {pending} download(s) to finish...")
+            download_pool.wait()
+            successful_downloads = download_pool.successful
+        
+        # Save combined metadata, compacted from the stream (latest record of each page,
+        # pages scraped by earlier interrupted runs included)
+        self.metadata_sink.flush()
+        combined_file = self.output_dir / COMBINED_FILE_NAME
+        write_combined_json(
+            compact(self.metadata_sink.path), combined_file,
+            successful_downloads=successful_downloads,
+            already_scraped=self.already_scraped
+        )
         
         print("="*70)
         print("✅ SCRAPING COMPLETED!")
@@ -437,14 +540,186 @@ class SoraRemixScraper:
         print(f"📊 Statistics:")
         print(f"   Total processed: {len(all_metadata)}")
         print(f"   Successful downloads: {successful_downloads}")
+        print(f"   Already scraped (reused): {self.already_scraped}")
         print(f"   Metadata file: {combined_file}")
+        print(f"   Metadata stream: {self.metadata_sink.path}")
         print()
         
         return all_metadata
     
+    def _scrape_page(self, page_url, file_prefix, download_videos, download_pool, on_done=None, pace=False):
+        """
+        Extract the metadata of the current page and queue its video download,
+        unless the content index shows the post (or its video) was already scraped
+        
+        Args:
+            page_url: URL of the current page
+            file_prefix: Prefix of the output files (e.g. "remix_0001")
+            download_videos: Whether to download videos or just metadata
+            download_pool: DownloadPool running the downloads (None for metadata only)
+            on_done: Optional callable(success) run once the page is finished (download
+                included); success is False when the video download failed
+            pace: Whether to wait the 'before_download' delay before looking for the video
+        
+        Returns:
+            dict: Metadata of the page
+        """
+        post_id = ContentIndex.post_id_from_url(page_url)
+        known = self.content_index.find_post(post_id)
+        if known and self._is_already_scraped(known, download_videos):
+            print(f"   ⏭️  Already scraped ({post_id}), reusing {known['metadata_path']}")
+            try:
+                with open(known["metadata_path"], 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                metadata = {"url": page_url}
+            metadata["already_scraped"] = True
+            self.already_scraped += 1
+            self.metadata_sink.write(metadata)
+            if on_done is not None:
+                on_done(True)
+            return metadata
+        
+        # Extract metadata (from the captured API responses when available)
+        metadata = self._captured_metadata(page_url)
+        if metadata is not None:
+            print(f"   📡 Metadata captured from the network")
+            if not self.capture.feed.has_comments(metadata["post_id"]):
+                # The comment list response was not seen: read the comments on the page
+                metadata["comments"] = self.metadata_extractor.extract_comments()
+        else:
+            print(f"   📊 Extracting metadata...")
+            metadata = self.metadata_extractor.extract_metadata(page_url)
+        
+        # Look for the video if requested
+        video_path = None
+        if download_videos:
+            video_url = metadata.get("video_url")
+            if not video_url:
+                if pace:
+                    self._wait('before_download')
+                print(f"   🎥 Looking for video...")
+                video_url = self.downloader.extract_video_url()
+            
+            if video_url:
+                print(f"      ✅ Found video URL")
+                metadata["video_url"] = video_url
+                
+                existing = self.content_index.find_video(video_url)
+                if existing:
+                    print(f"      ⏭️  Video already downloaded: {existing['video_path']}")
+                    metadata["downloaded_file"] = existing["video_path"]
+                else:
+                    video_path = self.output_dir / f"{file_prefix}.mp4"
+            else:
+                print(f"      ⚠️  No video found")
+        
+        # Save metadata
+        metadata_file = self.output_dir / f"{file_prefix}_metadata.json"
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        print(f"   💾 Metadata saved: {metadata_file.name}")
+        self.metadata_sink.write(metadata)
+        
+        self.content_index.record(
+            post_id,
+            page_url=page_url,
+            metadata_path=metadata_file.resolve(),
+            video_url=metadata.get("video_url"),
+            video_path=metadata.get("downloaded_file")
+        )
+        
+        if video_path is not None:
+            # Navigation continues while the video downloads; the metadata file is
+            # rewritten (and the record streamed again) with downloaded_file once it completes
+            def download_done(success):
+                if success:
+                    self.metadata_sink.write(metadata)
+                if on_done is not None:
+                    on_done(success)
+            
+            download_pool.submit(
+                metadata["video_url"], video_path, metadata, metadata_file,
+                on_done=download_done,
+                download_fn=lambda url, path: self._download_and_index(url, path, post_id)
+            )
+            print(f"      📥 Download queued ({download_pool.pending()} pending)")
+        elif on_done is not None:
+            on_done(True)
+        
+        return metadata
+    
+    def _captured_remix_urls(self):
+        """Remix URLs of the current page from the captured feed, or None"""
+        if self.capture is None:
+            return None
+        self.capture.poll()
+        post_id = ContentIndex.post_id_from_url(self.driver.current_url)
+        remix_ids = self.capture.feed.remixes_of(post_id)
+        return [self.capture.feed.post_url(remix_id) for remix_id in remix_ids] or None
+    
+    def _is_captured(self, page_url, download_videos):
+        """
+        Check if the capture has everything the page would give: metadata, comments and
+        the video URL if needed (then the page does not need to be opened)
+        """
+        if self.capture is None:
+            return False
+        self.capture.poll()
+        post_id = ContentIndex.post_id_from_url(page_url)
+        return self.capture.feed.has_post(post_id, need_video=download_videos, need_comments=True)
+    
+    def _captured_metadata(self, page_url):
+        """Metadata of the page from the captured API responses, or None"""
+        if self.capture is None:
+            return None
+        self.capture.poll()
+        return self.capture.feed.metadata(ContentIndex.post_id_from_url(page_url), page_url)
+    
+    def _is_already_scraped(self, entry, download_videos):
+        """Check if a content index entry has everything this run would produce"""
+        if not entry["metadata_path"] or not pathlib.Path(entry["metadata_path"]).exists():
+            return False
+        if not download_videos:
+            return True
+        return bool(entry["video_path"]) and pathlib.Path(entry["video_path"]).exists()
+    
+    def _download_and_index(self, video_url, output_path, post_id=None):
+        """
+        Download a video (runs in the download threads) and record its hash; a file
+        identical to one already downloaded is removed in favour of the existing one
+        
+        Returns:
+            pathlib.Path: Path of the video, or False if the download failed
+        """
+        if self.download_slots is not None:
+            with self.download_slots:
+                downloaded = self.downloader.download_video(video_url, output_path, show_progress=False)
+        else:
+            downloaded = self.downloader.download_video(video_url, output_path, show_progress=False)
+        if not downloaded:
+            return False
+        
+        output_path = pathlib.Path(output_path).resolve()
+        sha256 = ContentIndex.file_sha256(output_path)
+        duplicate = self.content_index.find_hash(sha256, exclude_path=output_path)
+        if duplicate:
+            print(f"      ♻️  {output_path.name} is identical to {duplicate['video_path']}, keeping one copy")
+            output_path.unlink()
+            output_path = pathlib.Path(duplicate["video_path"])
+        
+        if post_id is not None:
+            self.content_index.record(
+                post_id, video_url=video_url, video_path=output_path,
+                sha256=sha256, size=output_path.stat().st_size
+            )
+        return output_path
+    
     def close(self):
         """Close browser"""
         self.browser_mgr.close()
+        self.content_index.close()
+        self.progress.close()
 
 
 def main():
@@ -466,9 +741,21 @@ Examples:
   # Slow mode (more human-like, avoids detection)
   python scraper.py https://sora.chatgpt.com/p/VIDEO_ID --max 50 --slow --use-existing
   
+  # Read remixes and metadata from the page's API responses instead of the DOM
+  python scraper.py https://sora.chatgpt.com/p/VIDEO_ID --max 50 --capture-network
+  
+  # Collect remix URLs once (saved for resuming), then visit each one directly
+  python scraper.py https://sora.chatgpt.com/p/VIDEO_ID --max 50 --by-url
+  
+  # Fastest metadata run: headless, no images/fonts/media
+  python scraper.py https://sora.chatgpt.com/p/VIDEO_ID --max 100 --metadata-only --fast-load
+  
   # Batch processing from file
   python scraper.py --batch urls.txt --max 50 --slow
   python scraper.py --batch urls.txt --max 100 --use-existing --slow
+  
+  # Batch processing with 4 browsers in parallel
+  python scraper.py --batch urls.txt --max 50 --parallel 4
         """
     )
     
@@ -480,6 +767,13 @@ Examples:
     parser.add_argument("--output", type=str, default="videos", metavar="DIR", help="Output directory")
     parser.add_argument("--debug-port", type=int, default=9222, metavar="PORT", help="Chrome debugging port")
     parser.add_argument("--slow", action="store_true", help="Enable slow mode (longer delays, more human-like)")
+    parser.add_argument("--download-workers", type=int, default=3, metavar="N", help="Number of parallel background downloads (default: 3)")
+    parser.add_argument("--capture-network", action="store_true", help="Read remix lists, video URLs and metadata from the page's API responses (Chrome performance log)")
+    parser.add_argument("--by-url", action="store_true", help="Collect all remix URLs first (saved for resuming), then visit each one directly")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N", help="Batch mode: process N URLs at once, one Chrome instance each (default: 1)")
+    parser.add_argument("--fast-load", action="store_true", help="Headless Chrome that skips images, fonts and media (much faster, less bandwidth)")
+    parser.add_argument("--browser-cache", type=str, default=None, metavar="DIR", help=f"HTTP cache directory of --fast-load (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--content-index", type=str, default=None, metavar="FILE", help="SQLite index of already scraped posts (default: <output>/.content_index.db)")
     
     args = parser.parse_args()
     
@@ -490,6 +784,12 @@ Examples:
     if args.url and args.batch:
         parser.error("Cannot use both URL and --batch. Choose one.")
     
+    if args.parallel > 1 and args.use_existing:
+        parser.error("--parallel opens one new Chrome per worker; it cannot be used with --use-existing")
+    
+    if args.fast_load and args.use_existing:
+        parser.error("--fast-load launches its own headless Chrome; it cannot be used with --use-existing")
+    
     # Determine URLs to process
     urls_to_process = []
     
@@ -518,29 +818,36 @@ Examples:
         # Single URL mode
         urls_to_process = [args.url]
     
+    base_output_dir = pathlib.Path(args.output)
+    total_urls = len(urls_to_process)
+    
+    # Videos of all parallel browsers share the --download-workers download slots
+    download_slots = threading.BoundedSemaphore(args.download_workers) if args.parallel > 1 else None
+    
+    def make_scraper(output_dir, browser_cache_dir=args.browser_cache):
+        return SoraRemixScraper(
+            use_existing_chrome=args.use_existing,
+            debug_port=args.debug_port,
+            output_dir=output_dir,
+            slow_mode=args.slow,
+            download_workers=args.download_workers,
+            content_index_path=args.content_index or base_output_dir / ".content_index.db",
+            capture_network=args.capture_network,
+            visit_by_url=args.by_url,
+            download_slots=download_slots,
+            progress_db_path=base_output_dir / ".scrape_progress.db",
+            fast_load=args.fast_load,
+            browser_cache_dir=browser_cache_dir
+        )
+    
     # Create scraper
-    scraper = SoraRemixScraper(
-        use_existing_chrome=args.use_existing,
-        debug_port=args.debug_port,
-        output_dir=args.output,
-        slow_mode=args.slow
-    )
+    scraper = make_scraper(args.output)
     
     try:
-        # Setup (only once for all URLs)
-        scraper.setup()
-        
-        # Process each URL
-        total_urls = len(urls_to_process)
-        
-        # Store the original output directory for progress tracking
-        base_output_dir = pathlib.Path(args.output)
-        base_progress_file = base_output_dir / ".batch_progress.json"
-        
         # Load progress for batch mode
         if total_urls > 1:
-            progress = scraper._load_progress()
-            completed_count = len(progress["completed_urls"])
+            scraper.progress.add_urls(urls_to_process)
+            completed_count = scraper.progress.completed_count()
             if completed_count > 0:
                 print(f"📊 Found {completed_count} already completed URL(s)")
                 print(f"🔄 Will skip completed URLs and resume where left off\n")
@@ -548,93 +855,44 @@ Examples:
         skipped_count = 0
         failed_count = 0
         
-        for idx, url in enumerate(urls_to_process, 1):
-            # Check if already completed (for batch mode)
-            if total_urls > 1 and scraper._is_completed(url):
-                skipped_count += 1
-                print(f"\n⏭️  Skipping URL {idx}/{total_urls} (already completed)")
-                print(f"URL: {url}")
-                continue
+        if args.parallel > 1 and total_urls > 1:
+            # Parallel mode: one browser per worker, URLs taken from a shared queue
+            jobs = []
+            for idx, url in enumerate(urls_to_process, 1):
+                if scraper.progress.is_completed(url):
+                    skipped_count += 1
+                    print(f"⏭️  Skipping URL {idx}/{total_urls} (already completed)")
+                else:
+                    jobs.append((idx, url))
             
-            if total_urls > 1:
-                print("\n" + "="*70)
-                print(f"🎯 PROCESSING URL {idx}/{total_urls}")
-                print("="*70)
-                print(f"URL: {url}")
-                print()
+            if jobs:
+                runner = ParallelBatchRunner(
+                    # Chrome's disk cache can't be shared by running instances: one per worker
+                    lambda worker_id: make_scraper(
+                        base_output_dir, pathlib.Path(args.browser_cache or DEFAULT_CACHE_DIR) / f"worker-{worker_id}"
+                    ),
+                    lambda worker_scraper, idx, url: process_batch_url(
+                        worker_scraper, idx, url, total_urls, base_output_dir, args
+                    ),
+                    workers=args.parallel
+                )
+                processed_count, failed_count = runner.run(jobs)
+        else:
+            # Setup (only once for all URLs)
+            scraper.setup()
             
-            try:
-                # Create subdirectory for this URL (for batch mode)
-                if total_urls > 1:
-                    url_output_dir = base_output_dir / f"url-{idx}"
-                    url_output_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Update scraper's output directory for this URL
-                    scraper.output_dir = url_output_dir
-                    # Keep checkpoint file in the URL-specific folder
-                    scraper.checkpoint_file = url_output_dir / ".scrape_checkpoint.json"
-                    # But keep progress file at the base level for tracking all URLs
-                    scraper.progress_file = base_progress_file
-                    
-                    print(f"📁 Output directory: {url_output_dir}")
-                    print()
-                
-                # Run scraper on this URL with retry logic
-                max_url_retries = 2
-                url_success = False
-                
-                for url_attempt in range(max_url_retries):
-                    try:
-                        scraper.scrape_remixes(
-                            start_url=url,
-                            max_remixes=args.max,
-                            download_videos=not args.metadata_only
-                        )
-                        url_success = True
-                        break
-                    
-                    except Exception as scrape_error:
-                        # Check if it's a session error
-                        if "invalid session id" in str(scrape_error).lower() and url_attempt < max_url_retries - 1:
-                            print(f"\n⚠️  Session error, attempting recovery...")
-                            if scraper._recover_session():
-                                print(f"🔄 Retrying URL {idx}/{total_urls}...")
-                                time.sleep(2)
-                                continue
-                        # Re-raise if not recoverable or last attempt
-                        raise
+            for idx, url in enumerate(urls_to_process, 1):
+                # Check if already completed (for batch mode)
+                if total_urls > 1 and scraper.progress.is_completed(url):
+                    skipped_count += 1
+                    print(f"\n⏭️  Skipping URL {idx}/{total_urls} (already completed)")
+                    print(f"URL: {url}")
+                    continue
                 
-                if url_success:
+                if process_batch_url(scraper, idx, url, total_urls, base_output_dir, args):
                     processed_count += 1
-                    
-                    # Save progress (mark URL as completed)
-                    if total_urls > 1:
-                        scraper._save_progress(url)
-                    
-                    if total_urls > 1:
-                        print(f"\n✅ Completed URL {idx}/{total_urls}")
-                        
-                        # Add delay between URLs if in slow mode and not the last URL
-                        if args.slow and idx < total_urls:
-                            wait_time = random.uniform(5.0, 8.0)
-                            print(f"⏳ Waiting {wait_time:.1f}s before next URL...")
-                            time.sleep(wait_time)
-            
-            except Exception as e:
-                failed_count += 1
-                error_msg = str(e)
-                
-                # Shorten error message if it's too long
-                if len(error_msg) > 200:
-                    error_msg = error_msg[:200] + "..."
-                
-                print(f"\n❌ Error processing URL {idx}/{total_urls}: {error_msg}")
-                print("⚠️  Continuing to next URL...")
-                import traceback
-                traceback.print_exc()
-                
-                # Continue to next URL even if this one failed
-                continue
+                else:
+                    failed_count += 1
         
         if total_urls > 1:
             print("\n" + "="*70)
@@ -649,6 +907,7 @@ Examples:
             if failed_count > 0:
                 print("💡 Tip: Failed URLs were NOT marked as completed.")
                 print("   Run the same command again to retry only the failed ones.")
+                print(f"   List them with: python progress_store.py {base_output_dir / '.scrape_progress.db'} --status failed")
                 print()
     
     except KeyboardInterrupt:
@@ -663,5 +922,101 @@ Examples:
         scraper.close()
 
 
+def process_batch_url(scraper, idx, url, total_urls, base_output_dir, args):
+    """
+    Scrape one URL of the command line (or of a batch file) with retry logic
+    
+    Args:
+        scraper: SoraRemixScraper to use (already set up)
+        idx: 1-based position of the URL in the batch
+        url: Start URL
+        total_urls: Number of URLs in the batch
+        base_output_dir: Output directory given on the command line
+        args: Parsed command line arguments
+    
+    Returns:
+        bool: True if the URL was processed successfully
+    """
+    if total_urls > 1:
+        print("\n" + "="*70)
+        print(f"🎯 PROCESSING URL {idx}/{total_urls}")
+        print("="*70)
+        print(f"URL: {url}")
+        print()
+    
+    try:
+        # Create subdirectory for this URL (for batch mode)
+        if total_urls > 1:
+            url_output_dir = base_output_dir / f"url-{idx}"
+            url_output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Update scraper's output directory for this URL (progress stays in the
+            # base-level database, keyed by URL)
+            scraper.output_dir = url_output_dir
+            # Older versions kept this URL's checkpoint files in its own directory
+            scraper.import_legacy_progress(url_output_dir)
+            
+            print(f"📁 Output directory: {url_output_dir}")
+            print()
+        
+        scraper.progress.start_url(url, scraper.output_dir)
+        
+        # Run scraper on this URL with retry logic
+        max_url_retries = 2
+        
+        for url_attempt in range(max_url_retries):
+            try:
+                scraper.scrape_remixes(
+                    start_url=url,
+                    max_remixes=args.max,
+                    download_videos=not args.metadata_only
+                )
+                break
+            
+            except Exception as scrape_error:
+                # Check if it's a session error
+                if "invalid session id" in str(scrape_error).lower() and url_attempt < max_url_retries - 1:
+                    print(f"\n⚠️  Session error, attempting recovery...")
+                    if scraper._recover_session():
+                        print(f"🔄 Retrying URL {idx}/{total_urls}...")
+                        time.sleep(2)
+                        continue
+                # Re-raise if not recoverable or last attempt
+                raise
+        
+        # Save progress (mark URL as completed)
+        scraper.progress.complete_url(url)
+        
+        if total_urls > 1:
+            print(f"\n✅ Completed URL {idx}/{total_urls}")
+            
+            # Add delay between URLs if in slow mode and not the last URL
+            if args.slow and idx < total_urls:
+                wait_time = random.uniform(5.0, 8.0)
+                print(f"⏳ Waiting {wait_time:.1f}s before next URL...")
+                time.sleep(wait_time)
+        
+        return True
+    
+    except Exception as e:
+        error_msg = str(e)
+        
+        # Shorten error message if it's too long
+        if len(error_msg) > 200:
+            error_msg = error_msg[:200] + "..."
+        
+        print(f"\n❌ Error processing URL {idx}/{total_urls}: {error_msg}")
+        try:
+            scraper.progress.fail_url(url, error_msg)
+        except Exception as store_error:
+            print(f"⚠️  Warning: Could not save progress: {store_error}")
+        print("⚠️  Continuing to next URL...")
+        import traceback
+        traceback.print_exc()
+        
+        # Continue to next URL even if this one failed
+        return False
+
+
 if __name__ == "__main__":
     main()
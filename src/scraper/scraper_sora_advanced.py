@@ -4,38 +4,112 @@ import pathlib
 import argparse
 import json
 import hashlib
+import threading
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+from file_downloader import FileDownloader
+from html_video_urls import BACKENDS as HTML_BACKENDS, VIDEO_EXTENSIONS, extract_video_urls, resolve_backend
+from page_waits import PageWaiter
+from browser_manager import get_shared_service
+from content_index import ContentIndex
+from metadata_extractor import MetadataExtractor
+from remix_frontier import RemixFrontier
+from remix_navigator import RemixNavigator
 
 # Configuration par défaut
 DEST_DIR = pathlib.Path("videos")
 DEST_DIR.mkdir(exist_ok=True)
 
-# Extensions vidéo supportées
-VIDEO_EXTENSIONS = ('.mp4', '.mov', '.webm', '.mkv', '.avi', '.flv')
-
 # Configuration Selenium
 HEADLESS = False  # False = voir le navigateur, True = mode invisible
 
+# Observateur injecté dans la page : chaque <video>/<source> et lien de post (/p/) qui
+# apparaît dans le DOM est ajouté à un Set côté JS, avant que le virtual scrolling ne le
+# retire. Python ne fait ensuite qu'un appel par scroll pour vider les nouveautés.
+_FEED_OBSERVER_JS = """
+if (window.__soraFeed) window.__soraFeed.observer.disconnect();
+const feed = {videos: new Set(), posts: new Set(), newVideos: [], newPosts: [],
+              arrivals: 0, lastArrival: Date.now()};
+const collect = el => {
+    if (el.nodeType !== 1) return;
+    const found = el.matches('video, source, a[href*="/p/"]') ? [el] : [];
+    found.push(...el.querySelectorAll('video, source, a[href*="/p/"]'));
+    for (const node of found) {
+        if (node.tagName === 'A') {
+            const href = node.href.split(/[?#]/)[0];
+            if (!feed.posts.has(href)) { feed.posts.add(href); feed.newPosts.push(href); feed.arrivals++; feed.lastArrival = Date.now(); }
+        } else {
+            const src = node.src;
+            if (src && !feed.videos.has(src)) { feed.videos.add(src); feed.newVideos.push(src); feed.arrivals++; feed.lastArrival = Date.now(); }
+        }
+    }
+};
+feed.observer = new MutationObserver(mutations => {
+    for (const mutation of mutations) {
+        if (mutation.type === 'attributes') collect(mutation.target);
+        else mutation.addedNodes.forEach(collect);
+    }
+});
+feed.observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['src', 'href']});
+collect(document.body);
+window.__soraFeed = feed;
+"""
+
+# Vide les URLs vues depuis le dernier appel (et arrête l'observateur si arguments[0])
+_DRAIN_FEED_JS = """
+const feed = window.__soraFeed;
+if (!feed) return null;
+const drained = {videos: feed.newVideos, posts: feed.newPosts};
+feed.newVideos = [];
+feed.newPosts = [];
+if (arguments[0]) { feed.observer.disconnect(); delete window.__soraFeed; }
+return drained;
+"""
+
+# Scrolle en bas puis attend (script asynchrone, un seul aller-retour) que du nouveau
+# contenu arrive et que le lot se stabilise, ou le timeout ; renvoie les nouveautés
+_SCROLL_AND_DRAIN_JS = """
+const done = arguments[arguments.length - 1];
+const [timeoutMs, settleMs] = arguments;
+const feed = window.__soraFeed;
+if (!feed) { done(null); return; }
+const before = feed.arrivals;
+const started = Date.now();
+window.scrollTo(0, document.body.scrollHeight);
+const check = () => {
+    const now = Date.now();
+    const arrived = feed.arrivals > before;
+    if ((arrived && now - feed.lastArrival >= settleMs) || now - started >= timeoutMs) {
+        const drained = {videos: feed.newVideos, posts: feed.newPosts, arrived: arrived};
+        feed.newVideos = [];
+        feed.newPosts = [];
+        done(drained);
+    } else {
+        setTimeout(check, 100);
+    }
+};
+setTimeout(check, 100);
+"""
+
 
 class SoraScraper:
     """Classe principale pour scraper Sora avec différents modes."""
     
-    def __init__(self, headless=False, use_existing_chrome=False, debug_port=9222):
+    def __init__(self, headless=False, use_existing_chrome=False, debug_port=9222, html_backend="auto"):
         self.driver = None
         self.headless = headless
         self.use_existing_chrome = use_existing_chrome
         self.debug_port = debug_port
+        # Parseur HTML de extract_all_video_urls ("auto", "selectolax", "lxml", "regex", "bs4")
+        self.html_backend = html_backend
+        # Session keep-alive partagée, fichiers .part, reprise par Range et retries
+        self.file_downloader = FileDownloader()
+        # Liens de posts (/p/...) vus pendant le dernier scroll_and_load
+        self.post_urls = set()
         
     def create_driver(self):
         """
@@ -58,9 +132,8 @@ class SoraScraper:
             chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{self.debug_port}")
             
             try:
-                # Pas besoin de ChromeDriverManager pour une session existante
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                # chromedriver résolu une seule fois (cache disque) et partagé entre sessions
+                self.driver = webdriver.Chrome(service=get_shared_service(), options=chrome_options)
                 print("✅ Connecté à Chrome existant!\n")
                 return self.driver
             except Exception as e:
@@ -88,9 +161,8 @@ class SoraScraper:
             # User agent
             chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             
-            # Créer le service et le driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Créer le driver (chromedriver partagé, chemin mis en cache)
+            self.driver = webdriver.Chrome(service=get_shared_service(), options=chrome_options)
             
             # Masquer l'automatisation
             self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
@@ -101,6 +173,13 @@ class SoraScraper:
             print("✅ Navigateur prêt\n")
             return self.driver
     
+    def _wait_for_page(self, timeout=15):
+        """
+        Attend que la page soit chargée et que le réseau soit au repos, au lieu d'un
+        délai fixe (rend la main dès que la page est prête).
+        """
+        return PageWaiter(self.driver).page_loaded(timeout=timeout)
+    
     def wait_for_login(self):
         """Attend que l'utilisateur se connecte si nécessaire."""
         current_url = self.driver.current_url.lower()
@@ -126,92 +205,86 @@ class SoraScraper:
         
         IMPORTANT: Collecte les URLs PENDANT le scroll pour contourner le virtual scrolling.
         Sora utilise un système de virtualisation React qui ne garde que ~6 vidéos dans le DOM.
+        Un MutationObserver injecté enregistre chaque vidéo et lien de post dès son ajout au
+        DOM ; chaque scroll est un seul appel qui attend l'arrivée du nouveau contenu (au plus
+        `delay` secondes) et rapporte les URLs vues entre-temps.
+        Les liens de posts collectés sont disponibles dans self.post_urls.
         
         Args:
             num_scrolls (int): Nombre de scrolls à effectuer
-            delay (float): Délai entre chaque scroll en secondes
+            delay (float): Attente maximale de nouveau contenu après chaque scroll, en secondes
             all_mode (bool): Si True, continue jusqu'à la fin réelle du contenu
             
         Returns:
             set: Ensemble d'URLs de vidéos collectées pendant le scroll
         """
         if all_mode:
-            print(f"📜 Scrolling en mode ALL (jusqu'à la fin du contenu, délai: {delay}s)...")
+            print(f"📜 Scrolling en mode ALL (jusqu'à la fin du contenu, attente max: {delay}s)...")
             max_no_change = 5  # Plus tolérant en mode ALL
         else:
-            print(f"📜 Scrolling de la page (max {num_scrolls} fois, délai: {delay}s)...")
+            print(f"📜 Scrolling de la page (max {num_scrolls} fois, attente max: {delay}s)...")
             max_no_change = 3  # Normal
         
         print("   🎯 Collection des URLs pendant le scroll (contournement du virtual scrolling)...")
         
         collected_urls = set()
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        self.post_urls = set()
+        
+        def add(drained):
+            if drained:
+                collected_urls.update(drained.get("videos") or [])
+                self.post_urls.update(drained.get("posts") or [])
+        
+        # Installer l'observateur (collecte aussi ce qui est déjà dans le DOM)
+        self.driver.execute_script(_FEED_OBSERVER_JS)
+        timeout_ms = int(delay * 1000)
+        self.driver.set_script_timeout(delay + 10)
         no_change_count = 0  # Compteur pour détecter la fin
         scroll_count = 0
         
-        while True:
-            scroll_count += 1
-            
-            # COLLECTER les URLs AVANT de scroller (vidéos dans le viewport actuel)
-            try:
-                video_elements = self.driver.find_elements(By.TAG_NAME, "video")
-                for video in video_elements:
-                    try:
-                        src = video.get_attribute("src")
-                        if src and src not in collected_urls:
-                            collected_urls.add(src)
-                    except:
-                        pass
-            except:
-                pass
-            
-            # Vérifier si on a atteint la limite (sauf en mode ALL)
-            if not all_mode and scroll_count > num_scrolls:
-                print(f"   ℹ️  Limite de {num_scrolls} scrolls atteinte")
-                break
-            
-            # Scroller jusqu'en bas
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(delay)
-            
-            # Vérifier si la hauteur a changé (nouveau contenu chargé)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if new_height == last_height:
-                no_change_count += 1
-                print(f"   ⚠️ Pas de nouveau contenu (tentative {no_change_count}/{max_no_change}) - {len(collected_urls)} URLs collectées")
+        try:
+            while True:
+                scroll_count += 1
                 
-                # Si N scrolls consécutifs sans changement, on arrête
-                if no_change_count >= max_no_change:
-                    print(f"   ✅ Fin du contenu atteinte après {scroll_count} scrolls")
+                # Vérifier si on a atteint la limite (sauf en mode ALL)
+                if not all_mode and scroll_count > num_scrolls:
+                    print(f"   ℹ️  Limite de {num_scrolls} scrolls atteinte")
                     break
-            else:
-                no_change_count = 0  # Réinitialiser si du contenu est chargé
-                last_height = new_height
-                if all_mode:
-                    print(f"   Scroll {scroll_count} effectué - Nouveau contenu chargé - {len(collected_urls)} URLs")
+                
+                # Scroller jusqu'en bas et attendre l'arrivée du contenu (un seul appel)
+                drained = self.driver.execute_async_script(_SCROLL_AND_DRAIN_JS, timeout_ms, 300)
+                if drained is None:
+                    # Navigation pendant le scroll : l'observateur a disparu, on le réinstalle
+                    self.driver.execute_script(_FEED_OBSERVER_JS)
+                add(drained)
+                
+                if not drained or not drained.get("arrived"):
+                    no_change_count += 1
+                    print(f"   ⚠️ Pas de nouveau contenu (tentative {no_change_count}/{max_no_change}) - {len(collected_urls)} URLs collectées")
+                    
+                    # Si N scrolls consécutifs sans changement, on arrête
+                    if no_change_count >= max_no_change:
+                        print(f"   ✅ Fin du contenu atteinte après {scroll_count} scrolls")
+                        break
                 else:
-                    print(f"   Scroll {scroll_count}/{num_scrolls} effectué - Nouveau contenu chargé - {len(collected_urls)} URLs")
-            
-            # Sécurité : limite absolue même en mode ALL
-            if scroll_count >= 500:
-                print(f"   ⚠️ Limite de sécurité atteinte (500 scrolls)")
-                break
-        
-        # DERNIÈRE collecte après le dernier scroll
-        try:
-            video_elements = self.driver.find_elements(By.TAG_NAME, "video")
-            for video in video_elements:
-                try:
-                    src = video.get_attribute("src")
-                    if src and src not in collected_urls:
-                        collected_urls.add(src)
-                except:
-                    pass
-        except:
-            pass
+                    no_change_count = 0  # Réinitialiser si du contenu est chargé
+                    if all_mode:
+                        print(f"   Scroll {scroll_count} effectué - Nouveau contenu chargé - {len(collected_urls)} URLs")
+                    else:
+                        print(f"   Scroll {scroll_count}/{num_scrolls} effectué - Nouveau contenu chargé - {len(collected_urls)} URLs")
+                
+                # Sécurité : limite absolue même en mode ALL
+                if scroll_count >= 500:
+                    print(f"   ⚠️ Limite de sécurité atteinte (500 scrolls)")
+                    break
+        finally:
+            # DERNIÈRE collecte et arrêt de l'observateur
+            try:
+                add(self.driver.execute_script(_DRAIN_FEED_JS, True))
+            except Exception:
+                pass
         
-        print(f"✅ Scrolling terminé - {len(collected_urls)} URLs collectées au total\n")
+        print(f"✅ Scrolling terminé - {len(collected_urls)} URLs collectées au total ({len(self.post_urls)} liens de posts)\n")
         return collected_urls
     
     def extract_video_elements(self, max_videos=None):
@@ -311,6 +384,9 @@ class SoraScraper:
         """
         Extrait toutes les URLs de vidéos depuis le HTML (méthode de backup).
         
+        Le parseur est choisi par self.html_backend (voir html_video_urls : selectolax ou
+        lxml si installés, sinon BeautifulSoup).
+        
         Args:
             html (str): Le contenu HTML
             base_url (str): L'URL de base
@@ -318,36 +394,7 @@ class SoraScraper:
         Returns:
             set: Ensemble d'URLs de vidéos
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        video_urls = set()
-        
-        # Balises <video>
-        for video_tag in soup.find_all('video', src=True):
-            url = urljoin(base_url, video_tag['src'])
-            video_urls.add(url)
-        
-        # Balises <source>
-        for source_tag in soup.find_all('source', src=True):
-            url = urljoin(base_url, source_tag['src'])
-            video_urls.add(url)
-        
-        # Liens vers vidéos
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if any(href.lower().endswith(ext) for ext in VIDEO_EXTENSIONS):
-                url = urljoin(base_url, href)
-                video_urls.add(url)
-        
-        # Attributs data-*
-        all_tags = soup.find_all(True)
-        for tag in all_tags:
-            for attr, value in tag.attrs.items():
-                if isinstance(value, str) and any(ext in value.lower() for ext in VIDEO_EXTENSIONS):
-                    url = urljoin(base_url, value)
-                    if url.startswith('http'):
-                        video_urls.add(url)
-        
-        return video_urls
+        return extract_video_urls(html, base_url, self.html_backend)
     
     def scrape_homepage(self, num_videos=10, scroll_delay=2, all_mode=False):
         """
@@ -380,7 +427,7 @@ class SoraScraper:
         # Charger la page
         print(f"🌐 Chargement de la page...")
         self.driver.get(url)
-        time.sleep(5)  # Attente initiale
+        self._wait_for_page()  # Attente initiale
         
         # Vérifier si connexion nécessaire
         self.wait_for_login()
@@ -411,7 +458,7 @@ class SoraScraper:
         
         # Backup: parser le HTML (au cas où)
         if not video_urls:
-            print("⚠️ Aucune URL trouvée, tentative avec BeautifulSoup...")
+            print("⚠️ Aucune URL trouvée, extraction depuis le HTML de la page...")
             html = self.driver.page_source
             video_urls = self.extract_all_video_urls(html, url)
         
@@ -447,7 +494,7 @@ class SoraScraper:
         # Charger la page du profil
         print(f"🌐 Chargement du profil...")
         self.driver.get(profile_url)
-        time.sleep(5)  # Attente initiale
+        self._wait_for_page()  # Attente initiale
         
         # Vérifier l'URL actuelle après chargement
         current_url = self.driver.current_url
@@ -477,7 +524,7 @@ class SoraScraper:
                 
                 # Essayer de naviguer à nouveau
                 self.driver.get(profile_url)
-                time.sleep(5)
+                self._wait_for_page()
                 
                 current_url = self.driver.current_url
                 page_type = self._detect_page_type()
@@ -503,7 +550,7 @@ class SoraScraper:
         
         # Attendre que la page se stabilise
         print("\n⏳ Attente du chargement complet de la page...")
-        time.sleep(3)
+        self._wait_for_page(timeout=10)
         
         # Calculer le nombre de scrolls
         if all_mode:
@@ -531,392 +578,201 @@ class SoraScraper:
         
         # Backup: parser le HTML (au cas où)
         if not video_urls:
-            print("⚠️ Aucune URL trouvée, tentative avec BeautifulSoup...")
+            print("⚠️ Aucune URL trouvée, extraction depuis le HTML de la page...")
             html = self.driver.page_source
             # Utiliser l'URL actuelle du navigateur, pas celle demandée
             video_urls = self.extract_all_video_urls(html, self.driver.current_url)
         
         return video_urls
     
-    def scrape_remix_chain(self, video_url, max_depth=None, scroll_delay=2):
+    def scrape_remix_chain(self, video_url, max_depth=None, scroll_delay=2, max_fanout=None,
+                           max_videos=None, workers=1, frontier_path=None):
         """
-        Scrape all remixes starting from a single video, following the remix chain.
-        This allows scraping unlimited videos by following remix links.
+        Parcourt l'arbre des remixes en largeur (BFS) à partir d'une vidéo.
+        
+        Les posts découverts sont stockés dans une frontière SQLite persistante, indexée par
+        id de post : chaque post n'est visité qu'une fois même s'il apparaît dans plusieurs
+        branches, les branches les plus populaires (likes + remixes) passent en premier à
+        profondeur égale, et un crawl interrompu reprend là où il s'était arrêté.
         
         Args:
-            video_url (str): Starting video URL (e.g., https://sora.chatgpt.com/video/abc123)
-            max_depth (int): Maximum depth to follow (None = unlimited)
-            scroll_delay (float): Delay between actions
+            video_url (str): URL de la vidéo de départ (ex: https://sora.chatgpt.com/p/s_abc123)
+            max_depth (int): Profondeur maximale à visiter (None = illimitée)
+            scroll_delay (float): Conservé pour compatibilité (les attentes sont événementielles)
+            max_fanout (int): Nombre maximal de remixes suivis par vidéo (None = tous)
+            max_videos (int): Nombre maximal de vidéos visitées (None = illimité)
+            workers (int): Nombre de navigateurs qui puisent dans la frontière en parallèle
+            frontier_path (str): Fichier SQLite de la frontière (défaut: dans DEST_DIR, un par vidéo de départ)
             
         Returns:
-            set: Set of video URLs found in the remix chain
+            set: Set of video URLs found in the remix tree
         """
         print("="*60)
-        print("🎨 MODE REMIX: Suivi de la chaîne de remixes")
+        print("🎨 MODE REMIX: Parcours de l'arbre des remixes (BFS)")
         print("="*60)
         print(f"📍 Vidéo de départ: {video_url}")
         print(f"🔄 Profondeur max: {'Illimitée' if max_depth is None else max_depth}")
+        print(f"🌿 Remixes par vidéo: {'Tous' if max_fanout is None else max_fanout}")
+        print(f"🎬 Vidéos max: {'Illimité' if max_videos is None else max_videos}")
         print("="*60)
         print()
         
+        if workers > 1 and self.use_existing_chrome:
+            print("⚠️  --workers ouvre un Chrome par worker: incompatible avec une session existante, 1 seul worker utilisé")
+            workers = 1
+        
+        root_id = ContentIndex.post_id_from_url(video_url)
+        frontier = RemixFrontier(frontier_path or DEST_DIR / f".remix_frontier_{root_id}.db")
+        print(f"🗂️  Frontière: {frontier.db_path}")
+        
+        released = frontier.release_claimed()
+        if released:
+            print(f"🔄 {released} vidéo(s) d'un crawl interrompu remises dans la file")
+        frontier.add(video_url, 0)
+        counts = frontier.counts()
+        if counts["done"]:
+            print(f"📍 Reprise: {counts['done']} vidéo(s) déjà visitée(s), {counts['queued']} en attente")
+        
         # Create the driver if it doesn't exist
         if not self.driver:
             self.create_driver()
         
-        all_video_urls = set()
-        processed_urls = set()  # To avoid processing same video twice
-        queue = [(video_url, 0)]  # (url, depth)
+        state = {"lock": threading.Lock(), "in_flight": 0, "visited": 0}
+        crawl_args = (frontier, state, max_depth, max_fanout, max_videos)
+        helpers = []
+        threads = []
+        try:
+            for worker_id in range(2, workers + 1):
+                helper = SoraScraper(headless=self.headless)
+                helpers.append(helper)
+                thread = threading.Thread(
+                    target=helper._crawl_worker_with_driver, args=crawl_args,
+                    name=f"remix-crawl-{worker_id}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+            self._crawl_worker(*crawl_args)
+            for thread in threads:
+                thread.join()
+        finally:
+            for helper in helpers:
+                helper.close()
+        
+        counts = frontier.counts()
+        found = frontier.urls(("done", "queued", "claimed"))
+        frontier.close()
+        if max_videos is not None:
+            found = found[:max_videos]
+        
+        print(f"\n{'='*60}")
+        print(f"✅ Arbre de remixes terminé!")
+        print(f"📊 Total de vidéos trouvées: {len(found)}")
+        print(f"🔄 Vidéos analysées: {counts['done']} (dont {state['visited']} pendant ce run)")
+        if counts["queued"]:
+            print(f"⏸️  En attente (limites atteintes): {counts['queued']}")
+        if counts["failed"]:
+            print(f"❌ Échecs: {counts['failed']}")
+        print(f"{'='*60}\n")
+        
+        return set(found)
+    
+    def _crawl_worker_with_driver(self, *crawl_args):
+        """Worker supplémentaire: ouvre son propre Chrome puis puise dans la frontière."""
+        try:
+            self.create_driver()
+        except Exception as e:
+            print(f"❌ Impossible de démarrer un navigateur supplémentaire: {e}")
+            return
+        self._crawl_worker(*crawl_args)
+    
+    def _crawl_worker(self, frontier, state, max_depth, max_fanout, max_videos):
+        """
+        Visite les vidéos de la frontière jusqu'à ce qu'elle soit vide (ou max_videos atteint).
+        
+        Une frontière vide alors que d'autres workers visitent encore une vidéo n'est pas
+        la fin du crawl: ils peuvent y ajouter des remixes, on attend donc un peu.
+        """
+        navigator = RemixNavigator(self.driver)
+        metadata_extractor = MetadataExtractor(self.driver)
         
-        while queue:
-            current_url, depth = queue.pop(0)
-            
-            # Check depth limit
-            if max_depth is not None and depth > max_depth:
-                print(f"⚠️  Profondeur maximale atteinte ({max_depth})")
-                continue
-            
-            # Skip if already processed
-            if current_url in processed_urls:
+        while True:
+            with state["lock"]:
+                if max_videos is not None and state["visited"] + state["in_flight"] >= max_videos:
+                    return
+                node = frontier.claim(max_depth)
+                if node is None and state["in_flight"] == 0:
+                    return
+                if node is not None:
+                    state["in_flight"] += 1
+            if node is None:
+                time.sleep(0.5)
                 continue
             
-            processed_urls.add(current_url)
-            
-            print(f"\n{'  ' * depth}[Profondeur {depth}] 🎬 Analyse: {current_url}")
-            
+            indent = '  ' * node["depth"]
+            print(f"\n{indent}[Profondeur {node['depth']}] 🎬 Analyse: {node['url']}")
             try:
-                # Navigate to the video page
-                self.driver.get(current_url)
-                time.sleep(scroll_delay + 1)  # Extra time for page load
-                
-                # Add current video URL
-                all_video_urls.add(current_url)
-                
-                # Wait for page to load completely
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                likes, remixes, remix_urls = self._visit_remix_node(
+                    navigator, metadata_extractor, node["url"], max_fanout
                 )
                 
-                # Check for login prompts and close them
-                try:
-                    # Look for and close any modals/overlays
-                    close_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR,
-                        "button[aria-label*='Close'], button[aria-label*='close']"
-                    )
-                    for btn in close_buttons[:1]:  # Close first modal only
-                        try:
-                            if btn.is_displayed():
-                                btn.click()
-                                time.sleep(1)
-                                print(f"{'  ' * depth}   ℹ️  Fermé une popup")
-                        except:
-                            pass
-                except:
-                    pass
-                
-                # Wait for dynamic content to load
-                time.sleep(3)
-                
-                # Scroll down to ensure remix section is loaded
-                try:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-                    time.sleep(1)
-                except:
-                    pass
-                
-                # Look for remix links/buttons
-                remix_urls = self._find_remix_links(max_load_more_clicks=10)
+                # Les remixes d'une vidéo populaire passent en premier à profondeur égale
+                added = sum(
+                    frontier.add(remix_url, node["depth"] + 1, node["post_id"], likes + remixes)
+                    for remix_url in remix_urls
+                )
+                frontier.complete(node["post_id"], likes, remixes)
+                with state["lock"]:
+                    state["visited"] += 1
                 
                 if remix_urls:
-                    print(f"{'  ' * depth}   ✅ Trouvé {len(remix_urls)} remix(s)")
-                    
-                    # Add remix URLs to queue
-                    for remix_url in remix_urls:
-                        if remix_url and remix_url not in processed_urls:
-                            queue.append((remix_url, depth + 1))
-                            all_video_urls.add(remix_url)
+                    print(f"{indent}   ✅ Trouvé {len(remix_urls)} remix(s), {added} nouveau(x)")
                 else:
-                    print(f"{'  ' * depth}   ℹ️  Aucun remix trouvé (fin de chaîne)")
-                
+                    print(f"{indent}   ℹ️  Aucun remix trouvé (fin de chaîne)")
+            
             except Exception as e:
-                print(f"{'  ' * depth}   ❌ Erreur: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-        
-        print(f"\n{'='*60}")
-        print(f"✅ Chaîne de remixes terminée!")
-        print(f"📊 Total de vidéos trouvées: {len(all_video_urls)}")
-        print(f"🔄 Vidéos analysées: {len(processed_urls)}")
-        print(f"{'='*60}\n")
-        
-        return all_video_urls
+                print(f"{indent}   ❌ Erreur: {e}")
+                frontier.fail(node["post_id"], e)
+            
+            finally:
+                with state["lock"]:
+                    state["in_flight"] -= 1
     
-    def _find_remix_links(self, max_load_more_clicks=10):
+    def _visit_remix_node(self, navigator, metadata_extractor, video_url, max_fanout=None):
         """
-        Find remix links on a video page by clicking remix thumbnails.
-        
-        Uses exact CSS selectors from the Sora page structure:
-        - Remix container: div.flex.w-full.flex-col.gap-2.pt-2 > div
-        - Remix buttons: button.h-8.w-6.shrink-0.overflow-hidden.rounded-md > img
-        - Load more button: button.relative.h-[21px].w-4.shrink-0 > div
+        Ouvre une vidéo, lit ses compteurs et récupère les URLs de ses remixes.
         
-        Args:
-            max_load_more_clicks (int): Maximum number of times to click "Load more"
-            
         Returns:
-            list: List of remix video URLs
+            tuple: (likes, remixes, liste des URLs de remixes)
         """
-        
-        remix_urls = []
-        seen_urls = set()
-        
-        print("      🔍 Recherche des remixes dans la section dédiée...")
-        
-        # Store the original URL BEFORE any operations
-        store_url = self.driver.current_url
-        print(f"      📍 URL d'origine: {store_url}")
-        
-        # Scroll down to ensure remix section is visible
+        self.driver.get(video_url)
+        self._wait_for_page()
+        self._close_popup()
+        
+        metadata = metadata_extractor.extract_metadata(video_url)
+        likes = metadata.get("likes") or 0
+        remixes = metadata.get("remixes") or 0
+        
+        # Charger les remixes ("Load more") jusqu'à max_fanout, puis lire leurs URLs
+        loaded = navigator.load_all_remixes(target_count=max_fanout)
+        if not loaded:
+            return likes, remixes, []
+        remix_urls = navigator.collect_remix_urls(max_count=max_fanout)
+        return likes, remixes, [url for url in remix_urls if url]
+    
+    def _close_popup(self):
+        """Ferme la première popup/modale ouverte (login, etc.) si il y en a une."""
         try:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(2)
-        except:
+            close_buttons = self.driver.find_elements(
+                By.CSS_SELECTOR,
+                "button[aria-label*='Close'], button[aria-label*='close']"
+            )
+            for btn in close_buttons[:1]:
+                if btn.is_displayed():
+                    btn.click()
+                    PageWaiter(self.driver).until(lambda: not btn.is_displayed(), timeout=2)
+                    print("   ℹ️  Fermé une popup")
+        except Exception:
             pass
-        
-        # Track which index we're at (strictly forward navigation)
-        current_index = 0
-        load_more_clicks = 0
-        navigation_error_count = 0
-        
-        # Main loop: process remixes one by one, strictly forward
-        while load_more_clicks <= max_load_more_clicks:
-            try:
-                # Close any login popups
-                try:
-                    close_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR,
-                        "button[aria-label*='Close'], button[aria-label*='close']"
-                    )
-                    for btn in close_buttons[:1]:
-                        try:
-                            if btn.is_displayed():
-                                btn.click()
-                                time.sleep(0.5)
-                                print("      ⚠️  Fermé une popup")
-                                break
-                        except:
-                            pass
-                except:
-                    pass
-                
-                # Make sure we're on the original page
-                current = self.driver.current_url
-                
-                # Check for unexpected navigation (login, auth, etc.)
-                if "login" in current.lower() or "auth" in current.lower() or "signin" in current.lower():
-                    print(f"      ⚠️  Navigation vers une page inattendue: {current}")
-                    navigation_error_count += 1
-                    self.driver.get(store_url)
-                    time.sleep(2)
-                    if navigation_error_count > 3:
-                        print(f"      ❌ Trop d'erreurs de navigation, abandon")
-                        break
-                    continue
-                
-                if "/p/" in current and current != store_url:
-                    print(f"      🔙 Retour à la page d'origine...")
-                    self.driver.get(store_url)
-                    time.sleep(2)
-                
-                # RE-FETCH all buttons (fresh elements, no stale references)
-                try:
-                    all_small_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                    
-                    remix_buttons = []
-                    load_more_button = None
-                    
-                    for button in all_small_buttons:
-                        try:
-                            classes = button.get_attribute("class") or ""
-                            aria_label = button.get_attribute("aria-label") or ""
-                            
-                            # Skip buttons that are clearly not remix buttons
-                            skip_keywords = ["close", "login", "sign", "share", "like", "follow", "menu"]
-                            if any(kw in aria_label.lower() for kw in skip_keywords):
-                                continue
-                            if any(kw in classes.lower() for kw in ["modal", "dialog", "nav"]):
-                                continue
-                            
-                            # Check if it's a remix button (h-8 w-6 with image)
-                            if "h-8" in classes and "w-6" in classes and "shrink-0" in classes:
-                                imgs = button.find_elements(By.TAG_NAME, "img")
-                                if imgs and button.is_displayed() and button.is_enabled():
-                                    remix_buttons.append(button)
-                            
-                            # Check if it's the load more button
-                            elif "h-[21px]" in classes or ("w-4" in classes and "h-" in classes and len(classes) < 200):
-                                divs = button.find_elements(By.TAG_NAME, "div")
-                                if divs and not load_more_button and button.is_displayed():
-                                    load_more_button = button
-                        except:
-                            continue
-                    
-                    total_buttons = len(remix_buttons)
-                    
-                    # Check if we need to load more
-                    if current_index >= total_buttons:
-                        if load_more_clicks < max_load_more_clicks:
-                            if load_more_button:
-                                print(f"      🔄 Index {current_index} >= {total_buttons} boutons, tentative load more ({load_more_clicks + 1}/{max_load_more_clicks})...")
-                                
-                                # Re-find load more button (avoid stale)
-                                time.sleep(1)
-                                all_buttons_refresh = self.driver.find_elements(By.TAG_NAME, "button")
-                                load_more_refresh = None
-                                
-                                for btn in all_buttons_refresh:
-                                    try:
-                                        classes = btn.get_attribute("class") or ""
-                                        if "h-[21px]" in classes or ("w-4" in classes and "h-" in classes and len(classes) < 200):
-                                            divs = btn.find_elements(By.TAG_NAME, "div")
-                                            if divs:
-                                                load_more_refresh = btn
-                                                break
-                                    except:
-                                        continue
-                                
-                                if load_more_refresh:
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'end'});", load_more_refresh)
-                                    time.sleep(0.5)
-                                    self.driver.execute_script("arguments[0].click();", load_more_refresh)
-                                    time.sleep(3)
-                                    load_more_clicks += 1
-                                    print(f"      ✅ 'Load more' cliqué ({load_more_clicks}/{max_load_more_clicks})")
-                                    
-                                    # Scroll back to remix section
-                                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-                                    time.sleep(1)
-                                    continue  # Re-fetch buttons
-                            else:
-                                print(f"      ℹ️  Plus de 'Load more', arrêt")
-                                break
-                        else:
-                            print(f"      ✅ Maximum load more atteint ({max_load_more_clicks})")
-                            break
-                    
-                    # Process button at current_index
-                    if current_index < len(remix_buttons):
-                        button = remix_buttons[current_index]
-                        
-                        # Safety check
-                        if navigation_error_count > 3:
-                            print(f"      ⚠️  Trop d'erreurs de navigation, arrêt")
-                            break
-                        
-                        try:
-                            # Safety check: ensure we're still on the correct page
-                            if self.driver.current_url != store_url:
-                                print(f"         ⚠️  Page changée avant le clic, retour à l'origine")
-                                self.driver.get(store_url)
-                                time.sleep(2)
-                                continue
-                            
-                            # Scroll button into view
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", button)
-                            time.sleep(0.5)
-                            
-                            # Click with JavaScript
-                            self.driver.execute_script("arguments[0].click();", button)
-                            time.sleep(2.5)
-                            
-                            # Get new URL
-                            new_url = self.driver.current_url
-                            
-                            # Validate this is a proper video page
-                            is_valid_remix = (
-                                new_url != store_url and 
-                                "/p/" in new_url and 
-                                new_url not in seen_urls and
-                                "login" not in new_url.lower() and
-                                "auth" not in new_url.lower() and
-                                "signin" not in new_url.lower()
-                            )
-                            
-                            if is_valid_remix:
-                                seen_urls.add(new_url)
-                                remix_urls.append(new_url)
-                                print(f"         ✓ Remix {current_index + 1} trouvé: {new_url.split('/')[-1][:30]}... (Total: {len(remix_urls)})")
-                                
-                                # Go back to original page
-                                self.driver.back()
-                                time.sleep(2.5)
-                                
-                                # Re-scroll to remix section
-                                try:
-                                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-                                    time.sleep(0.5)
-                                except:
-                                    pass
-                            else:
-                                # Invalid URL, go back if needed
-                                if new_url != store_url:
-                                    if "login" in new_url.lower() or "auth" in new_url.lower():
-                                        print(f"         ⚠️  Navigation inattendue vers: {new_url}")
-                                        navigation_error_count += 1
-                                    self.driver.back()
-                                    time.sleep(1)
-                                    
-                        except Exception as e:
-                            print(f"         ⚠️  Erreur clic remix {current_index + 1}: {str(e)[:50]}")
-                            # Try to recover
-                            try:
-                                if self.driver.current_url != store_url:
-                                    self.driver.back()
-                                    time.sleep(1)
-                            except:
-                                try:
-                                    self.driver.get(store_url)
-                                    time.sleep(2)
-                                except:
-                                    pass
-                        
-                        # Move to next index (strictly forward!)
-                        current_index += 1
-                    else:
-                        print(f"      ⚠️  Index {current_index} hors limites ({total_buttons} boutons)")
-                        break
-                    
-                except Exception as e:
-                    print(f"      ⚠️  Erreur lors de la recherche: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    break
-                    
-            except Exception as e:
-                print(f"      ⚠️ Erreur lors de la recherche: {e}")
-                import traceback
-                traceback.print_exc()
-                break
-        
-        # Fallback: Look for any /p/ links in the page
-        if not remix_urls:
-            print("      🔄 Méthode de fallback: recherche de liens vidéo...")
-            try:
-                all_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/p/']")
-                for link in all_links[:10]:  # Limit to first 10
-                    try:
-                        href = link.get_attribute("href")
-                        if href and href not in seen_urls and href != self.driver.current_url:
-                            seen_urls.add(href)
-                            remix_urls.append(href)
-                    except:
-                        pass
-            except:
-                pass
-        
-        print(f"      ✅ Total: {len(remix_urls)} remixes trouvés")
-        return remix_urls
     
     def extract_video_metadata(self, video_url):
         """
@@ -1373,7 +1229,7 @@ class SoraScraper:
             try:
                 # Navigate to the video page
                 self.driver.get(page_url)
-                time.sleep(3)  # Wait for page to load
+                PageWaiter(self.driver).video_ready(timeout=10)  # Wait for the video element
                 
                 # Find the actual video element and get its source URL
                 video_file_url = None
@@ -1459,20 +1315,7 @@ class SoraScraper:
                     
                     print(f"   📥 Téléchargement de la vidéo...")
                     try:
-                        response = requests.get(video_file_url, stream=True, timeout=60)
-                        response.raise_for_status()
-                        
-                        total_size = int(response.headers.get('content-length', 0))
-                        
-                        with open(video_path, 'wb') as f:
-                            if total_size == 0:
-                                f.write(response.content)
-                            else:
-                                with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"      ") as pbar:
-                                    for chunk in response.iter_content(chunk_size=8192):
-                                        if chunk:
-                                            f.write(chunk)
-                                            pbar.update(len(chunk))
+                        self._download_with_progress(video_file_url, video_path, desc="      ")
                         
                         metadata["local_video_file"] = str(video_path)
                         file_size = video_path.stat().st_size
@@ -1606,38 +1449,46 @@ class SoraScraper:
             print(f"📥 Téléchargement: {filename}")
             print(f"   URL: {url[:70]}...")
             
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            # Obtenir la taille du fichier
-            total_size = int(response.headers.get('content-length', 0))
-            
-            # Télécharger avec barre de progression
-            with open(filepath, 'wb') as f:
-                if total_size == 0:
-                    # Pas de taille connue
-                    f.write(response.content)
-                else:
-                    # Avec barre de progression
-                    with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"   ") as pbar:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                pbar.update(len(chunk))
+            self._download_with_progress(url, filepath, desc="   ")
             
             print(f"✅ Téléchargé: {filename} ({self._format_size(filepath.stat().st_size)})")
             return True
             
         except Exception as e:
+            # Le fichier final n'existe jamais à moitié : le .part est gardé pour reprendre
             print(f"❌ Échec du téléchargement: {e}")
-            # Supprimer le fichier partiel
-            try:
-                if filepath.exists():
-                    filepath.unlink()
-            except:
-                pass
             return False
     
+    def _download_with_progress(self, url, filepath, desc):
+        """
+        Télécharge un fichier avec barre de progression.
+        
+        Le téléchargement passe par un fichier .part renommé à la fin, reprend un
+        .part existant (requête Range) et réessaie en cas d'erreur réseau.
+        
+        Args:
+            url (str): URL du fichier à télécharger
+            filepath (pathlib.Path): Chemin de destination
+            desc (str): Préfixe de la barre de progression
+            
+        Returns:
+            int: Taille du fichier en bytes
+        """
+        pbar = None
+        
+        def progress(downloaded, total):
+            nonlocal pbar
+            if pbar is None:
+                pbar = tqdm(total=total, initial=downloaded, unit='B', unit_scale=True, desc=desc)
+            else:
+                pbar.update(downloaded - pbar.n)
+        
+        try:
+            return self.file_downloader.download(url, filepath, progress=progress)
+        finally:
+            if pbar is not None:
+                pbar.close()
+    
     def _get_extension_from_url(self, url):
         """Extrait l'extension depuis une URL."""
         for ext in VIDEO_EXTENSIONS:
@@ -1696,6 +1547,10 @@ Exemples d'utilisation:
   # Suivre les remixes avec profondeur limitée (max 5 niveaux)
   python scraper_sora_advanced.py --mode remix --video-url "https://sora.chatgpt.com/video/abc123" --max-depth 5
   
+  # Arbre large: 20 remixes max par vidéo, 200 vidéos max, 3 navigateurs en parallèle
+  # (relancer la même commande reprend le crawl là où il s'était arrêté)
+  python scraper_sora_advanced.py --mode remix --video-url "https://sora.chatgpt.com/p/s_abc123" --max-fanout 20 --max-videos 200 --workers 3
+  
   # Suivre les remixes et extraire les métadonnées (sans télécharger)
   python scraper_sora_advanced.py --mode remix --video-url "https://sora.chatgpt.com/video/abc123" --metadata-mode
   
@@ -1756,6 +1611,31 @@ Exemples d'utilisation:
         help='Profondeur maximale de la chaîne de remixes (défaut: illimité)'
     )
     
+    parser.add_argument(
+        '--max-fanout',
+        type=int,
+        help='Mode remix: nombre maximal de remixes suivis par vidéo (défaut: tous)'
+    )
+    
+    parser.add_argument(
+        '--max-videos',
+        type=int,
+        help='Mode remix: nombre maximal de vidéos visitées (défaut: illimité)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Mode remix: nombre de navigateurs qui parcourent l\'arbre en parallèle (défaut: 1)'
+    )
+    
+    parser.add_argument(
+        '--frontier',
+        type=str,
+        help='Mode remix: fichier SQLite de la frontière du crawl (défaut: <output-dir>/.remix_frontier_<id>.db)'
+    )
+    
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -1801,6 +1681,14 @@ Exemples d'utilisation:
         help='Sauvegarder chaque vidéo dans un JSON séparé au lieu d\'un seul fichier'
     )
     
+    parser.add_argument(
+        '--html-parser',
+        type=str,
+        default='auto',
+        choices=('auto',) + HTML_BACKENDS,
+        help='Parseur HTML pour l\'extraction de backup des URLs (défaut: auto = selectolax ou lxml si installé, sinon BeautifulSoup)'
+    )
+    
     args = parser.parse_args()
     
     # Validation
@@ -1813,6 +1701,11 @@ Exemples d'utilisation:
     if args.all and args.num_videos != 10:
         parser.error("Ne spécifiez pas --num-videos avec --all")
     
+    try:
+        resolve_backend(args.html_parser)
+    except RuntimeError as e:
+        parser.error(str(e))
+    
     # Appliquer le mode slow
     if args.slow:
         original_delay = args.delay
@@ -1845,7 +1738,8 @@ Exemples d'utilisation:
         scraper = SoraScraper(
             headless=args.headless,
             use_existing_chrome=args.use_existing_chrome,
-            debug_port=args.debug_port
+            debug_port=args.debug_port,
+            html_backend=args.html_parser
         )
         
         # Exécuter le mode approprié avec paramètres
@@ -1872,7 +1766,11 @@ Exemples d'utilisation:
             video_urls = scraper.scrape_remix_chain(
                 video_url=args.video_url,
                 max_depth=args.max_depth,
-                scroll_delay=args.delay
+                scroll_delay=args.delay,
+                max_fanout=args.max_fanout,
+                max_videos=args.max_videos,
+                workers=args.workers,
+                frontier_path=args.frontier or dest_dir / f".remix_frontier_{ContentIndex.post_id_from_url(args.video_url)}.db"
             )
         
         # Sauvegarder le HTML
@@ -3,15 +3,19 @@
 Video Downloader - Handles video extraction and downloading
 """
 
-import requests
 from selenium.webdriver.common.by import By
 
+from file_downloader import FileDownloader
+
 
 class VideoDownloader:
     """Manages video URL extraction and downloading"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, session=None):
         self.driver = driver
+        # Shared keep-alive connection pool (also used by background download threads)
+        self.file_downloader = FileDownloader(session=session)
+        self.session = self.file_downloader.session
     
     def extract_video_url(self):
         """Extract video URL from current page"""
@@ -34,37 +38,41 @@ class VideoDownloader:
         
         return None
     
-    def download_video(self, video_url, output_path):
+    def download_video(self, video_url, output_path, show_progress=True):
         """
         Download video from URL
         
         Args:
             video_url: URL of the video
             output_path: Path to save the video
+            show_progress: Print a progress line while downloading (disable for
+                background downloads, where lines of parallel jobs would interleave)
         
         Returns:
             bool: True if successful, False otherwise
         """
+        last_percent = [-1]
+        
+        def progress(downloaded, total):
+            # Print whole percents only, not one line per chunk
+            if not show_progress or not total:
+                return
+            percent = int(downloaded * 100 / total)
+            if percent != last_percent[0]:
+                last_percent[0] = percent
+                print(f"      Progress: {percent}%", end='\r')
+        
         try:
-            print(f"      📥 Downloading video...")
-            response = requests.get(video_url, stream=True, timeout=60)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            
-            with open(output_path, 'wb') as f:
-                if total_size == 0:
-                    f.write(response.content)
-                else:
-                    downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            percent = (downloaded / total_size) * 100
-                            print(f"      Progress: {percent:.1f}%", end='\r')
+            if show_progress:
+                print(f"      📥 Downloading video...")
+            # Written to <name>.part and renamed once complete; a partial file left by
+            # an earlier failure is resumed
+            size = self.file_downloader.download(video_url, output_path, progress=progress)
             
-            print(f"\n      ✅ Video saved ({total_size / 1024 / 1024:.1f} MB)")
+            if show_progress:
+                print(f"\n      ✅ Video saved ({size / 1024 / 1024:.1f} MB)")
+            else:
+                print(f"      ✅ Video saved: {output_path} ({size / 1024 / 1024:.1f} MB)")
             return True
         
         except Exception as e:
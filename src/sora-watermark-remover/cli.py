@@ -46,6 +46,12 @@ Examples:
         default="*.mp4",
         help="🔍 File pattern to match (default: *.mp4)",
     )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        default=False,
+        help="Don't keep segment checkpoints (an interrupted video restarts from frame zero).",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -247,8 +253,22 @@ def main():
                                 last_progress[0] = prog
 
                         # Process the video (quiet=True suppresses internal tqdm bars if enabled)
+                        # Completed segments survive a crash; rerunning resumes from them.
+                        # Keyed on the full relative path: clip.mov and clip.mp4 (or
+                        # a/clip.mp4 and b/clip.mp4) must not share a checkpoint.
+                        checkpoint_dir = None
+                        if not args.no_checkpoint:
+                            checkpoint_dir = (
+                                self.output_folder
+                                / ".checkpoints"
+                                / input_path.relative_to(self.input_folder)
+                            )
                         self.sora_wm.run(
-                            input_path, output_path, progress_callback, quiet=args.quiet
+                            input_path,
+                            output_path,
+                            progress_callback,
+                            quiet=args.quiet,
+                            checkpoint_dir=checkpoint_dir,
                         )
 
                         # Ensure video progress reaches 100%
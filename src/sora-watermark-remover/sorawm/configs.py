@@ -50,3 +50,28 @@ FRONTUI_DIST_DIR_ASSETS = FRONTUI_DIST_DIR / "assets"
 FRONTUI_DIST_DIR_ASSETS.mkdir(exist_ok=True, parents=True)
 
 FRONTUI_DIST_DIR_INDEX_HTML = FRONTUI_DIST_DIR / "index.html"
+
+# Uploads are streamed to disk in chunks of this size instead of being read into memory.
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MAX_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024  # 2GB
+
+# Live task progress is served from memory; it is written to SQLite at most this often.
+PROGRESS_PERSIST_INTERVAL = 5.0  # seconds
+
+# Retention of files in WORKING_DIR and rows in the tasks table.
+RETENTION_INTERVAL = 10 * 60  # seconds between two retention passes
+OUTPUT_TTL = 3 * 24 * 3600  # outputs not downloaded for this long are deleted
+TASK_RECORD_TTL = 30 * 24 * 3600  # finished/failed task rows older than this are deleted
+ORPHAN_GRACE_PERIOD = 3600  # files not referenced by any task are kept this long
+WORKING_DIR_QUOTA = 50 * 1024 * 1024 * 1024  # 50GB, least recently used outputs go first
+
+# Task scheduling: "fifo", "sjf" (shortest estimated job first) or "deadline".
+# Higher priority always goes first; tasks waiting longer than the max wait go first of all.
+SCHEDULING_POLICY = "sjf"
+SCHEDULER_MAX_WAIT = 30 * 60  # seconds
+
+# Running tasks persist their bbox track and cleaned segments here, so a task interrupted
+# by a crash or restart resumes from its last completed segment.
+TASK_CHECKPOINT_DIR = WORKING_DIR / "checkpoints"
+CHECKPOINT_SEGMENT_FRAMES = 300  # segment length for the frame-by-frame (lama) cleaner
+MAX_TASK_RECOVERIES = 3  # a task interrupted more often than this is marked as failed
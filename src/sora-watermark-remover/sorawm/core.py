@@ -6,6 +6,7 @@ from loguru import logger
 from tqdm import tqdm
 
 import ffmpeg
+from sorawm.configs import CHECKPOINT_SEGMENT_FRAMES
 from sorawm.schemas import CleanerType
 from sorawm.utils.imputation_utils import (
     find_2d_data_bkps,
@@ -13,6 +14,7 @@ from sorawm.utils.imputation_utils import (
     get_interval_average_bbox,
     refine_bkps_by_chunk_size,
 )
+from sorawm.utils.checkpoint_utils import SegmentCheckpoint
 from sorawm.utils.video_utils import VideoLoader, merge_frames_with_overlap
 from sorawm.watermark_cleaner import WaterMarkCleaner
 from sorawm.watermark_detector import SoraWaterMarkDetector
@@ -20,6 +22,23 @@ from sorawm.watermark_detector import SoraWaterMarkDetector
 VIDEO_EXTENSIONS = [".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".webm"]
 
 
+def _close_encoder(process):
+    """Finish an ffmpeg encoder; raises if it did not exit cleanly."""
+    process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg encoder exited with code {process.returncode}")
+
+
+def _kill_encoder(process):
+    """Stop an ffmpeg encoder that will not be finished (its output is incomplete)."""
+    try:
+        process.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass
+    process.kill()
+    process.wait()
+
+
 class SoraWM:
     def __init__(self, cleaner_type: CleanerType = CleanerType.LAMA):
         self.detector = SoraWaterMarkDetector()
@@ -80,7 +99,15 @@ class SoraWM:
         output_video_path: Path,
         progress_callback: Callable[[int], None] | None = None,
         quiet: bool = False,
+        checkpoint_dir: Path | None = None,
     ):
+        """
+        Remove the watermark of `input_video_path` into `output_video_path`.
+
+        With a `checkpoint_dir`, the bbox track and every cleaned segment are persisted
+        there as they complete, and a later call with the same directory resumes from
+        the last completed segment. The directory is removed once the output is written.
+        """
         input_video_loader = VideoLoader(input_video_path)
         output_video_path.parent.mkdir(parents=True, exist_ok=True)
         width = input_video_loader.width
@@ -102,28 +129,241 @@ class SoraWM:
         else:
             output_options["crf"] = "18"
 
-        process_out = (
-            ffmpeg.input(
-                "pipe:",
-                format="rawvideo",
-                pix_fmt="bgr24",
-                s=f"{width}x{height}",
-                r=fps,
+        def open_encoder(path: Path):
+            return (
+                ffmpeg.input(
+                    "pipe:",
+                    format="rawvideo",
+                    pix_fmt="bgr24",
+                    s=f"{width}x{height}",
+                    r=fps,
+                )
+                .output(str(path), **output_options)
+                .overwrite_output()
+                .global_args("-loglevel", "error")
+                .run_async(pipe_stdin=True)
             )
-            .output(str(temp_output_path), **output_options)
-            .overwrite_output()
-            .global_args("-loglevel", "error")
-            .run_async(pipe_stdin=True)
+
+        checkpoint = None
+        if checkpoint_dir is not None:
+            checkpoint = SegmentCheckpoint(
+                checkpoint_dir,
+                input_video_path,
+                self.cleaner_type,
+                fps,
+                CHECKPOINT_SEGMENT_FRAMES,
+            )
+
+        if not quiet:
+            logger.debug(
+                f"total frames: {total_frames}, fps: {fps}, width: {width}, height: {height}"
+            )
+        saved_bboxes = checkpoint.load_bboxes() if checkpoint else None
+        if saved_bboxes is not None:
+            frame_bboxes, bkps_full = saved_bboxes
+            logger.info(f"Resuming from checkpoint {checkpoint_dir}")
+            if progress_callback:
+                progress_callback(50)
+        else:
+            frame_bboxes, bkps_full = self.detect_watermarks(
+                input_video_loader, progress_callback, quiet
+            )
+            if checkpoint:
+                checkpoint.save_bboxes(frame_bboxes, bkps_full)
+
+        if self.cleaner_type == CleanerType.E2FGVI_HQ:
+            # The original bkps' sep maybe too large to excel the chunk_size, so we need to refine it based on the VRAM.
+            def compute_segments():
+                return refine_bkps_by_chunk_size(bkps_full, self.cleaner.chunk_size)
+
+        elif checkpoint:
+            # Lama cleans frame by frame, fixed size segments only bound the lost work.
+            def compute_segments():
+                return list(range(0, total_frames, CHECKPOINT_SEGMENT_FRAMES)) + [
+                    total_frames
+                ]
+
+        else:
+
+            def compute_segments():
+                return [0, total_frames]
+
+        # Completed segments are only valid for the boundaries they were encoded with.
+        segments = (
+            checkpoint.segments(compute_segments) if checkpoint else compute_segments()
         )
+        num_segments = len(segments) - 1
+
+        # Without a checkpoint everything goes through a single encoder; with one, each
+        # segment is encoded to its own file and they are joined at the end.
+        process_out = open_encoder(temp_output_path) if checkpoint is None else None
+        # The encoder being written to; killed (and its partial file removed) if
+        # anything escapes, e.g. a TaskCancelledError raised by progress_callback.
+        active_encoder = process_out
+        partial_path = None if checkpoint else temp_output_path
+        try:
+            input_video_loader = VideoLoader(input_video_path)
+            frame_counter = 0
+            all_cleaned_frames = None
+            for segment_idx in tqdm(
+                range(num_segments),
+                desc="Segment",
+                position=0,
+                leave=True,
+                disable=quiet or num_segments == 1,
+            ):
+                seg_start = segments[segment_idx]
+                seg_end = segments[segment_idx + 1]
+                if checkpoint and checkpoint.is_segment_done(segment_idx):
+                    frame_counter += seg_end - seg_start
+                    continue
+                if checkpoint:
+                    partial_path = checkpoint.partial_segment_path(segment_idx)
+                    active_encoder = open_encoder(partial_path)
+                segment_out = active_encoder
+
+                if self.cleaner_type == CleanerType.LAMA:
+                    ## 1. Lama Cleaner Strategy.
+                    for idx, frame in enumerate(
+                        tqdm(
+                            input_video_loader.iter_frames(seg_start, seg_end),
+                            total=seg_end - seg_start,
+                            desc="Remove watermarks",
+                            disable=quiet,
+                        ),
+                        start=seg_start,
+                    ):
+                        bbox = frame_bboxes[idx]["bbox"]
+                        if bbox is not None:
+                            x1, y1, x2, y2 = bbox
+                            mask = np.zeros((height, width), dtype=np.uint8)
+                            mask[y1:y2, x1:x2] = 255
+                            cleaned_frame = self.cleaner.clean(frame, mask)
+                        else:
+                            cleaned_frame = frame
+                        segment_out.stdin.write(cleaned_frame.tobytes())
+                        frame_counter += 1
+
+                        # 50% - 95%
+                        if progress_callback and idx % 10 == 0:
+                            progress = 50 + int((idx / total_frames) * 45)
+                            progress_callback(progress)
 
+                elif self.cleaner_type == CleanerType.E2FGVI_HQ:
+                    ## 2. E2FGVI_HQ Cleaner Strategy with overlap blending.
+                    overlap_ratio = self.cleaner.config.overlap_ratio
+                    seg_length = seg_end - seg_start
+                    # Calculate overlap size based on segment length
+                    segment_overlap = max(1, int(overlap_ratio * seg_length))
+                    # Extend segment boundaries to create overlap (except first/last)
+                    start = seg_start
+                    end = seg_end
+
+                    # Add overlap at the start (except for first segment)
+                    if segment_idx > 0:
+                        start = max(
+                            seg_start - segment_overlap, segments[segment_idx - 1]
+                        )
+
+                    # Add overlap at the end (except for last segment)
+                    if segment_idx < num_segments - 1:
+                        end = min(seg_end + segment_overlap, segments[segment_idx + 2])
+
+                    if not quiet:
+                        logger.debug(
+                            f"Segment {segment_idx}: "
+                            f"original=[{seg_start}, {seg_end}), "
+                            f"with_overlap=[{start}, {end}), overlap={segment_overlap}"
+                        )
+
+                    frames = np.array(input_video_loader.get_slice(start, end))
+                    # Convert BGR to RGB for E2FGVI_HQ cleaner (expects RGB format)
+                    frames = frames[:, :, :, ::-1].copy()
+
+                    masks = np.zeros((len(frames), height, width), dtype=np.uint8)
+                    for idx in range(start, end):
+                        bbox = frame_bboxes[idx]["bbox"]
+                        if bbox is not None:
+                            x1, y1, x2, y2 = bbox
+                            # offset
+                            idx_offset = idx - start
+                            masks[idx_offset][y1:y2, x1:x2] = 255
+                    cleaned_frames = self.cleaner.clean(frames, masks)
+
+                    # Merge with overlap blending support. The frames blended into are
+                    # already written, so a resumed run can start from an empty buffer.
+                    all_cleaned_frames = merge_frames_with_overlap(
+                        result_frames=all_cleaned_frames,
+                        chunk_frames=cleaned_frames,
+                        start_idx=start,
+                        overlap_size=segment_overlap,
+                        is_first_chunk=(segment_idx == 0),
+                    )
+
+                    # Determine which frames to write from this segment
+                    # Write the core segment (seg_start to seg_end), skip overlaps for subsequent processing
+                    write_start = seg_start
+                    write_end = seg_end
+
+                    for write_idx in range(write_start, write_end):
+                        if (
+                            write_idx < len(all_cleaned_frames)
+                            and all_cleaned_frames[write_idx] is not None
+                        ):
+                            cleaned_frame = all_cleaned_frames[write_idx]
+                            # Convert RGB back to BGR for FFmpeg output (expects bgr24)
+                            cleaned_frame_bgr = cleaned_frame[:, :, ::-1]
+                            segment_out.stdin.write(
+                                cleaned_frame_bgr.astype(np.uint8).tobytes()
+                            )
+                            frame_counter += 1
+                            # 50% - 95%
+                            if progress_callback and frame_counter % 10 == 0:
+                                progress = 50 + int((frame_counter / total_frames) * 45)
+                                progress_callback(progress)
+
+                if checkpoint:
+                    _close_encoder(segment_out)
+                    active_encoder = partial_path = None
+                    checkpoint.commit_segment(segment_idx)
+
+            if checkpoint:
+                checkpoint.concat_segments(num_segments, temp_output_path)
+            else:
+                _close_encoder(process_out)
+                active_encoder = None
+        finally:
+            if active_encoder is not None:
+                _kill_encoder(active_encoder)
+                if partial_path is not None:
+                    partial_path.unlink(missing_ok=True)
+
+        # 95% - 99%
+        if progress_callback:
+            progress_callback(95)
+
+        self.merge_audio_track(input_video_path, temp_output_path, output_video_path)
+        if checkpoint:
+            checkpoint.clear()
+
+        if progress_callback:
+            progress_callback(99)
+
+    def detect_watermarks(
+        self,
+        input_video_loader: VideoLoader,
+        progress_callback: Callable[[int], None] | None = None,
+        quiet: bool = False,
+    ) -> tuple[dict[int, dict], list[int]]:
+        """
+        Detect the watermark bbox of every frame and fill the missed ones.
+        Returns (frame_bboxes, bkps_full).
+        """
+        total_frames = input_video_loader.total_frames
         frame_bboxes = {}
         detect_missed = []
         bbox_centers = []
         bboxes = []
-        if not quiet:
-            logger.debug(
-                f"total frames: {total_frames}, fps: {fps}, width: {width}, height: {height}"
-            )
         for idx, frame in enumerate(
             tqdm(
                 input_video_loader,
@@ -196,127 +436,7 @@ class SoraWM:
             del bbox_centers
             del detect_missed
 
-        if self.cleaner_type == CleanerType.LAMA:
-            ## 1. Lama Cleaner Strategy.
-            input_video_loader = VideoLoader(input_video_path)
-            for idx, frame in enumerate(
-                tqdm(
-                    input_video_loader,
-                    total=total_frames,
-                    desc="Remove watermarks",
-                    disable=quiet,
-                )
-            ):
-                bbox = frame_bboxes[idx]["bbox"]
-                if bbox is not None:
-                    x1, y1, x2, y2 = bbox
-                    mask = np.zeros((height, width), dtype=np.uint8)
-                    mask[y1:y2, x1:x2] = 255
-                    cleaned_frame = self.cleaner.clean(frame, mask)
-                else:
-                    cleaned_frame = frame
-                process_out.stdin.write(cleaned_frame.tobytes())
-
-                # 50% - 95%
-                if progress_callback and idx % 10 == 0:
-                    progress = 50 + int((idx / total_frames) * 45)
-                    progress_callback(progress)
-        elif self.cleaner_type == CleanerType.E2FGVI_HQ:
-            ## 2. E2FGVI_HQ Cleaner Strategy with overlap blending.
-            input_video_loader = VideoLoader(input_video_path)
-            frame_counter = 0
-            overlap_ratio = self.cleaner.config.overlap_ratio
-            all_cleaned_frames = None
-            # The original bkps' sep maybe too large to excel the chunk_size, so we need to refine it based on the VRAM.
-            bkps_full = refine_bkps_by_chunk_size(bkps_full, self.cleaner.chunk_size)
-            # Create overlapping segments for smooth transitions
-            num_segments = len(bkps_full) - 1
-            for segment_idx in tqdm(
-                range(num_segments),
-                desc="Segment",
-                position=0,
-                leave=True,
-                disable=quiet,
-            ):
-                seg_start = bkps_full[segment_idx]
-                seg_end = bkps_full[segment_idx + 1]
-                seg_length = seg_end - seg_start
-                # Calculate overlap size based on segment length
-                segment_overlap = max(1, int(overlap_ratio * seg_length))
-                # Extend segment boundaries to create overlap (except for first/last)
-                start = seg_start
-                end = seg_end
-
-                # Add overlap at the start (except for first segment)
-                if segment_idx > 0:
-                    start = max(seg_start - segment_overlap, bkps_full[segment_idx - 1])
-
-                # Add overlap at the end (except for last segment)
-                if segment_idx < num_segments - 1:
-                    end = min(seg_end + segment_overlap, bkps_full[segment_idx + 2])
-
-                if not quiet:
-                    logger.debug(
-                        f"Segment {segment_idx}: original=[{seg_start}, {seg_end}), "
-                        f"with_overlap=[{start}, {end}), overlap={segment_overlap}"
-                    )
-
-                frames = np.array(input_video_loader.get_slice(start, end))
-                # Convert BGR to RGB for E2FGVI_HQ cleaner (expects RGB format)
-                frames = frames[:, :, :, ::-1].copy()
-
-                masks = np.zeros((len(frames), height, width), dtype=np.uint8)
-                for idx in range(start, end):
-                    bbox = frame_bboxes[idx]["bbox"]
-                    if bbox is not None:
-                        x1, y1, x2, y2 = bbox
-                        # offset
-                        idx_offset = idx - start
-                        masks[idx_offset][y1:y2, x1:x2] = 255
-                cleaned_frames = self.cleaner.clean(frames, masks)
-
-                # Merge with overlap blending support
-                all_cleaned_frames = merge_frames_with_overlap(
-                    result_frames=all_cleaned_frames,
-                    chunk_frames=cleaned_frames,
-                    start_idx=start,
-                    overlap_size=segment_overlap,
-                    is_first_chunk=(segment_idx == 0),
-                )
-
-                # Determine which frames to write from this segment
-                # Write the core segment (seg_start to seg_end), skip overlaps for subsequent processing
-                write_start = seg_start
-                write_end = seg_end
-
-                for write_idx in range(write_start, write_end):
-                    if (
-                        write_idx < len(all_cleaned_frames)
-                        and all_cleaned_frames[write_idx] is not None
-                    ):
-                        cleaned_frame = all_cleaned_frames[write_idx]
-                        # Convert RGB back to BGR for FFmpeg output (expects bgr24 format)
-                        cleaned_frame_bgr = cleaned_frame[:, :, ::-1]
-                        process_out.stdin.write(
-                            cleaned_frame_bgr.astype(np.uint8).tobytes()
-                        )
-                        frame_counter += 1
-                        # 50% - 95%
-                        if progress_callback and frame_counter % 10 == 0:
-                            progress = 50 + int((frame_counter / total_frames) * 45)
-                            progress_callback(progress)
-
-        process_out.stdin.close()
-        process_out.wait()
-
-        # 95% - 99%
-        if progress_callback:
-            progress_callback(95)
-
-        self.merge_audio_track(input_video_path, temp_output_path, output_video_path)
-
-        if progress_callback:
-            progress_callback(99)
+        return frame_bboxes, bkps_full
 
     def merge_audio_track(
         self, input_video_path: Path, temp_output_path: Path, output_video_path: Path
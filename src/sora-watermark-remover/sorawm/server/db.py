@@ -1,5 +1,7 @@
 from contextlib import asynccontextmanager
 
+from loguru import logger
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -18,9 +20,34 @@ async_session_maker = async_sessionmaker(
 )
 
 
+def _add_missing_columns_and_indexes(sync_conn):
+    """
+    create_all only creates missing tables, so databases created by older versions
+    would lack newly added columns and indexes. Add them in place (SQLite can only
+    ADD COLUMN, so new columns must be nullable or have a server default).
+    """
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            ddl = f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'
+            if column.server_default is not None:
+                ddl += f" DEFAULT {column.server_default.arg}"
+            sync_conn.exec_driver_sql(ddl)
+            logger.info(f"Added column {table.name}.{column.name}")
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns_and_indexes)
 
 
 @asynccontextmanager
@@ -0,0 +1,166 @@
+import os
+import re
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import quote
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(Response):
+    """
+    Sends bytes [start, end] of a file. Uses the ASGI zero-copy send extension when the
+    server offers it, and large chunked reads otherwise.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: dict[str, str],
+        media_type: str,
+        send_header_only: bool = False,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.length = end - start + 1
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.send_header_only = send_header_only
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self.send_header_only or self.length <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.path, "rb") as f:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": f.fileno(),
+                        "offset": self.start,
+                        "count": self.length,
+                        "more_body": False,
+                    }
+                )
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as f:
+            await f.seek(self.start)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining > 0:
+            # The file shrank while it was being sent; close the body anyway.
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _parse_range(range_header: str, file_size: int) -> tuple[int, int] | None:
+    """
+    Parse a single `bytes=` range. Returns (start, end) inclusive, or None when the
+    range cannot be satisfied. Raises ValueError when the header is not a single range.
+    """
+    match = _RANGE_RE.match(range_header.strip())
+    if match is None:
+        raise ValueError(range_header)
+    first, last = match.groups()
+    if not first and not last:
+        raise ValueError(range_header)
+    if not first:
+        # Suffix range: the last N bytes.
+        suffix = int(last)
+        if suffix == 0:
+            return None
+        return max(file_size - suffix, 0), file_size - 1
+    start = int(first)
+    end = int(last) if last else file_size - 1
+    if start >= file_size or end < start:
+        return None
+    return start, min(end, file_size - 1)
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    etag: str,
+    filename: str,
+    media_type: str = "video/mp4",
+) -> Response:
+    """
+    Serve a file with ETag/If-None-Match revalidation and single byte-range requests
+    (If-Range aware), so interrupted downloads and seeking don't restart from byte zero.
+    """
+    stat_result = os.stat(path)
+    file_size = stat_result.st_size
+    etag = f'"{etag}"'
+    headers = {
+        "accept-ranges": "bytes",
+        "etag": etag,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "content-disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    send_header_only = request.method == "HEAD"
+    start, end, status_code = 0, file_size - 1, 200
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header is not None and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = _parse_range(range_header, file_size)
+        except ValueError:
+            # Multiple or malformed ranges: ignore the header and send the whole file.
+            byte_range = (start, end)
+        else:
+            if byte_range is None:
+                headers["content-range"] = f"bytes */{file_size}"
+                return Response(status_code=416, headers=headers)
+            status_code = 206
+            headers["content-range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{file_size}"
+        start, end = byte_range
+
+    headers["content-length"] = str(end - start + 1)
+    return RangeFileResponse(
+        path,
+        start=start,
+        end=end,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        send_header_only=send_header_only,
+    )
@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from loguru import logger
 
 from sorawm.server.db import init_db
+from sorawm.server.retention import retention_manager
 from sorawm.server.worker import worker
 
 
@@ -18,6 +19,7 @@ async def lifespan(app: FastAPI):
     await worker.initialize()
 
     _ = asyncio.create_task(worker.run())
+    _ = asyncio.create_task(retention_manager.run())
 
     logger.info("Application started successfully")
 
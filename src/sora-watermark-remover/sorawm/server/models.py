@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Float, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sorawm.server.db import Base
@@ -12,11 +12,30 @@ class Task(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     video_path: Mapped[str] = mapped_column(String, nullable=False)
     output_path: Mapped[str] = mapped_column(String, nullable=True)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="PROCESSING")
+    status: Mapped[str] = mapped_column(
+        String, nullable=False, default="PROCESSING", index=True
+    )
     percentage: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     download_url: Mapped[str] = mapped_column(String, nullable=True)
     cleaner_type: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    # sha256 of the uploaded video, used to reuse the output of identical submissions.
+    content_hash: Mapped[str] = mapped_column(String, nullable=True, index=True)
+    # sha256 of the output video, served as the download ETag.
+    output_hash: Mapped[str] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, index=True
+    )
+    # Scheduling: higher priority first, then by policy (estimated cost or deadline).
+    priority: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    estimated_cost: Mapped[float] = mapped_column(Float, nullable=True)
+    deadline: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    # Number of times the task was interrupted while processing (crash or restart).
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now
     )
@@ -0,0 +1,231 @@
+import asyncio
+import shutil
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from loguru import logger
+from sqlalchemy import delete, select, update
+
+from sorawm.configs import (
+    ORPHAN_GRACE_PERIOD,
+    OUTPUT_TTL,
+    RETENTION_INTERVAL,
+    TASK_RECORD_TTL,
+    WORKING_DIR_QUOTA,
+)
+from sorawm.server.db import engine, get_session
+from sorawm.server.models import Task
+from sorawm.server.schemas import Status
+from sorawm.server.worker import WMRemoveTaskWorker, worker
+
+ACTIVE_STATUSES = (Status.UPLOADING, Status.QUEUED, Status.PROCESSING)
+TERMINAL_STATUSES = (
+    Status.FINISHED,
+    Status.ERROR,
+    Status.EXPIRED,
+    Status.CANCELLED,
+)
+
+
+class RetentionManager:
+    """
+    Periodically frees disk space and trims the tasks table:
+
+    1. outputs not downloaded for `output_ttl` seconds are deleted,
+    2. while outputs exceed `quota` bytes, the least recently used ones are deleted,
+    3. uploads, outputs and checkpoints no task refers to anymore are deleted,
+    4. finished/failed/cancelled task rows older than `record_ttl` are deleted and the
+       DB vacuumed.
+
+    Tasks whose output was deleted are marked EXPIRED. A deduplicated output is shared
+    by several tasks, so it is kept as long as any of them has used it recently.
+    """
+
+    def __init__(
+        self,
+        worker: WMRemoveTaskWorker,
+        interval: float = RETENTION_INTERVAL,
+        output_ttl: float = OUTPUT_TTL,
+        record_ttl: float = TASK_RECORD_TTL,
+        orphan_grace_period: float = ORPHAN_GRACE_PERIOD,
+        quota: int | None = WORKING_DIR_QUOTA,
+    ):
+        self.worker = worker
+        self.interval = interval
+        self.output_ttl = output_ttl
+        self.record_ttl = record_ttl
+        self.orphan_grace_period = orphan_grace_period
+        self.quota = quota
+
+    async def run(self):
+        logger.info("Retention manager started")
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Retention pass failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self):
+        await self._flush_access_times()
+        await self._evict_outputs()
+        await self._delete_orphaned_files()
+        await self._delete_old_records()
+
+    async def _flush_access_times(self):
+        if not self.worker.pending_access_times:
+            return
+        access_times, self.worker.pending_access_times = (
+            self.worker.pending_access_times,
+            {},
+        )
+        async with get_session() as session:
+            for task_id, accessed_at in access_times.items():
+                await session.execute(
+                    update(Task)
+                    .where(Task.id == task_id)
+                    .values(last_accessed_at=accessed_at)
+                )
+
+    async def _evict_outputs(self):
+        async with get_session() as session:
+            stmt = select(
+                Task.id, Task.output_path, Task.last_accessed_at, Task.updated_at
+            ).where(Task.status == Status.FINISHED, Task.output_path.is_not(None))
+            rows = (await session.execute(stmt)).all()
+
+        task_ids_by_output: dict[str, list[str]] = defaultdict(list)
+        last_used: dict[str, datetime] = {}
+        for task_id, output_path, last_accessed_at, updated_at in rows:
+            task_ids_by_output[output_path].append(task_id)
+            used_at = max(filter(None, (last_accessed_at, updated_at)))
+            last_used[output_path] = max(used_at, last_used.get(output_path, used_at))
+
+        # Least recently used first.
+        outputs = sorted(last_used, key=last_used.__getitem__)
+        expire_before = datetime.now() - timedelta(seconds=self.output_ttl)
+        to_evict = [path for path in outputs if last_used[path] < expire_before]
+
+        if self.quota:
+            sizes = await asyncio.to_thread(self._output_sizes, outputs)
+            total_size = sum(sizes.values())
+            total_size -= sum(sizes.get(path, 0) for path in to_evict)
+            for path in outputs:
+                if total_size <= self.quota:
+                    break
+                if path not in to_evict:
+                    to_evict.append(path)
+                    total_size -= sizes.get(path, 0)
+
+        if not to_evict:
+            return
+
+        # Expire by output path, before the files go: a dedupe submission may have
+        # attached one of these outputs to a new task since the rows above were read.
+        async with get_session() as session:
+            result = await session.execute(
+                update(Task)
+                .where(Task.status == Status.FINISHED, Task.output_path.in_(to_evict))
+                .values(status=Status.EXPIRED, output_path=None, download_url=None)
+                .returning(Task.id)
+            )
+            evicted_task_ids = list(result.scalars())
+        await asyncio.to_thread(self._unlink_outputs, to_evict)
+        for task_id in evicted_task_ids:
+            self.worker.on_status_change(task_id)
+        logger.info(
+            f"Evicted {len(to_evict)} output(s) used by {len(evicted_task_ids)} task(s)"
+        )
+
+    @staticmethod
+    def _output_sizes(outputs: list[str]) -> dict[str, int]:
+        sizes = {}
+        for path in outputs:
+            try:
+                sizes[path] = Path(path).stat().st_size
+            except FileNotFoundError:
+                continue
+        return sizes
+
+    @staticmethod
+    def _unlink_outputs(outputs: list[str]):
+        for path in outputs:
+            Path(path).unlink(missing_ok=True)
+
+    async def _delete_orphaned_files(self):
+        async with get_session() as session:
+            result = await session.execute(
+                select(Task.id, Task.status, Task.video_path, Task.output_path)
+            )
+            rows = result.all()
+
+        active_task_ids = {
+            task_id for task_id, status, _, _ in rows if status in ACTIVE_STATUSES
+        }
+        referenced = {
+            video_path for _, status, video_path, _ in rows if status in ACTIVE_STATUSES
+        }
+        referenced.update(output_path for _, _, _, output_path in rows if output_path)
+
+        # The directory walk stats and deletes many files: keep it off the event loop.
+        deleted = await asyncio.to_thread(
+            self._sweep_orphans, referenced, active_task_ids
+        )
+        if deleted:
+            logger.info(f"Deleted {deleted} orphaned file(s)")
+
+    def _sweep_orphans(self, referenced: set[str], active_task_ids: set[str]) -> int:
+        candidates = [
+            p for p in self.worker.upload_dir.iterdir() if p.is_file()
+        ] + [p for p in self.worker.output_dir.iterdir() if p.is_file()]
+        now = time.time()
+        deleted = 0
+        for path in candidates:
+            if str(path) in referenced:
+                continue
+            # Outputs of running tasks are written before the task refers to them.
+            if any(task_id in path.name for task_id in active_task_ids):
+                continue
+            try:
+                if now - path.stat().st_mtime < self.orphan_grace_period:
+                    continue
+                path.unlink()
+                deleted += 1
+            except FileNotFoundError:
+                continue
+
+        # Checkpoints are directories named after their task.
+        for path in self.worker.checkpoint_dir.iterdir():
+            if not path.is_dir() or path.name in active_task_ids:
+                continue
+            try:
+                if now - path.stat().st_mtime < self.orphan_grace_period:
+                    continue
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            deleted += 1
+        return deleted
+
+    async def _delete_old_records(self):
+        expire_before = datetime.now() - timedelta(seconds=self.record_ttl)
+        async with get_session() as session:
+            result = await session.execute(
+                delete(Task).where(
+                    Task.status.in_(TERMINAL_STATUSES), Task.updated_at < expire_before
+                )
+            )
+            deleted = result.rowcount
+        if not deleted:
+            return
+        self.worker.invalidate_status_counts()
+        # Give the freed pages back to the file system.
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.exec_driver_sql("VACUUM")
+        logger.info(f"Deleted {deleted} old task record(s) and compacted the database")
+
+
+retention_manager = RetentionManager(worker)
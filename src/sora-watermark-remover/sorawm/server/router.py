@@ -1,48 +1,119 @@
+import hashlib
+from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
 
 import aiofiles
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from loguru import logger
 
-from sorawm.server.schemas import QueueStatusResponse, WMRemoveResults
+from sorawm.configs import MAX_UPLOAD_SIZE, UPLOAD_CHUNK_SIZE
+from sorawm.server.file_response import file_response
+from sorawm.server.schemas import QueueStatusResponse, Status, WMRemoveResults
 from sorawm.schemas import CleanerType
 from sorawm.server.worker import worker
 
 router = APIRouter()
 
 
-async def process_upload_and_queue(
-    task_id: str, video_content: bytes, video_path: Path
-):
+class UploadTooLargeError(Exception):
+    pass
+
+
+async def stream_upload_to_disk(
+    video: UploadFile, video_path: Path, max_size: int = MAX_UPLOAD_SIZE
+) -> tuple[int, str]:
+    """
+    Copy the upload to disk chunk by chunk, hashing it on the fly.
+    Returns (size in bytes, sha256 hexdigest). The partial file is removed on failure.
+    """
+    sha256 = hashlib.sha256()
+    size = 0
     try:
         async with aiofiles.open(video_path, "wb") as f:
-            await f.write(video_content)
-        await worker.queue_task(task_id, video_path)
-    except Exception as e:
-        await worker.mark_task_error(task_id, str(e))
+            while chunk := await video.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(
+                        f"Upload exceeds the maximum size of {max_size} bytes"
+                    )
+                sha256.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        video_path.unlink(missing_ok=True)
+        raise
+    return size, sha256.hexdigest()
 
 
 @router.get("/get_queue_status")
-async def get_queue_status() -> QueueStatusResponse:
-    return await worker.get_queue_status()
+async def get_queue_status(
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=50, ge=1, le=500),
+    status: Status | None = Query(default=None),
+) -> QueueStatusResponse:
+    return await worker.get_queue_status(page=page, page_size=page_size, status=status)
 
 
 @router.post("/submit_remove_task")
 async def submit_remove_task(
-    background_tasks: BackgroundTasks,
     video: UploadFile = File(...),
     cleaner_type: CleanerType = Query(default=CleanerType.LAMA),
+    priority: int = Query(default=0, ge=-10, le=10),
+    deadline: datetime | None = Query(default=None),
 ):
-    task_id = await worker.create_task(cleaner_type)
-    content = await video.read()
-    upload_filename = f"{uuid4()}_{video.filename}"
+    if deadline is not None and deadline.tzinfo is not None:
+        # The DateTime column is naive and read back as local time after a restart
+        deadline = deadline.astimezone().replace(tzinfo=None)
+    task_id = await worker.create_task(cleaner_type, priority, deadline)
+    # The UploadFile is closed once the response is sent, so it has to be consumed here.
+    upload_filename = f"{uuid4()}_{Path(video.filename or 'video.mp4').name}"
     video_path = worker.upload_dir / upload_filename
-    background_tasks.add_task(process_upload_and_queue, task_id, content, video_path)
+    try:
+        size, sha256 = await stream_upload_to_disk(video, video_path)
+    except UploadTooLargeError as e:
+        await worker.mark_task_error(task_id, str(e))
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        await worker.mark_task_error(task_id, str(e))
+        raise HTTPException(status_code=500, detail="Failed to save upload.")
+    finally:
+        await video.close()
+
+    logger.info(f"Task {task_id} upload saved: {size} bytes, sha256={sha256}")
+
+    existing_output = await worker.find_finished_output(sha256, cleaner_type)
+    if existing_output is not None:
+        output_path, output_hash = existing_output
+        download_url = await worker.finish_with_existing_output(
+            task_id, sha256, output_path, output_hash
+        )
+        # None: the output was evicted meanwhile, process the upload after all.
+        if download_url is not None:
+            video_path.unlink(missing_ok=True)
+            return {
+                "task_id": task_id,
+                "message": "Task already processed.",
+                "download_url": download_url,
+            }
+
+    await worker.queue_task(task_id, video_path, content_hash=sha256)
 
     return {"task_id": task_id, "message": "Task submitted."}
 
 
+@router.post("/cancel_task")
+async def cancel_task(remove_task_id: str):
+    status = await worker.cancel_task(remove_task_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if status not in (Status.QUEUED, Status.PROCESSING):
+        raise HTTPException(
+            status_code=409, detail=f"Task cannot be cancelled in status {status}"
+        )
+    return {"task_id": remove_task_id, "status": status}
+
+
 @router.get("/get_results")
 async def get_results(remove_task_id: str) -> WMRemoveResults:
     result = await worker.get_task_status(remove_task_id)
@@ -52,19 +123,49 @@ async def get_results(remove_task_id: str) -> WMRemoveResults:
     return result
 
 
-@router.get("/download/{task_id}")
-async def download_video(task_id: str):
-    result = await worker.get_task_status(task_id)
-    if result is None:
+@router.get("/get_results_bulk")
+async def get_results_bulk(
+    task_ids: list[str] = Query(..., max_length=200),
+) -> dict[str, WMRemoveResults]:
+    return await worker.get_tasks_status(task_ids)
+
+
+@router.get("/stream_results")
+async def stream_results(remove_task_id: str) -> StreamingResponse:
+    """
+    Server-sent events with the task status: a `status` event on every change, until
+    the task reaches a terminal status (FINISHED, ERROR, CANCELLED or EXPIRED).
+    """
+    if await worker.get_task_status(remove_task_id) is None:
         raise HTTPException(status_code=404, detail="Task does not exist.")
-    if result.status != "FINISHED":
-        raise HTTPException(
-            status_code=400, detail=f"Task not finish yet: {result.status}"
-        )
-    output_path = await worker.get_output_path(task_id)
+
+    async def event_stream():
+        async for result in worker.stream_task_status(remove_task_id):
+            if result is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: status\ndata: {result.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.api_route("/download/{task_id}", methods=["GET", "HEAD"])
+async def download_video(task_id: str, request: Request):
+    target = await worker.get_download_target(task_id)
+    if target is None:
+        raise HTTPException(status_code=404, detail="Task does not exist.")
+    status, output_path, output_hash = target
+    if status != Status.FINISHED:
+        raise HTTPException(status_code=400, detail=f"Task not finish yet: {status}")
     if output_path is None or not output_path.exists():
         raise HTTPException(status_code=404, detail="Output file does not exits")
 
-    return FileResponse(
-        path=output_path, filename=output_path.name, media_type="video/mp4"
-    )
+    # Outputs finished before output hashes were recorded fall back to the task id,
+    # which is just as stable since a task's output never changes.
+    etag = output_hash or task_id
+    worker.record_download(task_id)
+    return file_response(request, output_path, etag=etag, filename=output_path.name)
@@ -10,6 +10,9 @@ class Status(StrEnum):
     PROCESSING = "PROCESSING"
     FINISHED = "FINISHED"
     ERROR = "ERROR"
+    # Finished, but the output has been removed by the retention policy.
+    EXPIRED = "EXPIRED"
+    CANCELLED = "CANCELLED"
 
 
 class WMRemoveResults(BaseModel):
@@ -38,3 +41,6 @@ class QueueStatusResponse(BaseModel):
     waiting_queue: List[QueueTaskInfo] = Field(
         default_factory=list, description="排队中的任务列表"
     )
+    total: int = Field(0, description="符合筛选条件的任务总数 (不含当前任务)")
+    page: int = Field(1, description="当前页码")
+    page_size: int = Field(50, description="每页任务数量")
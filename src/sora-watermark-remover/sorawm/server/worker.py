@@ -1,17 +1,32 @@
 import asyncio
-from asyncio import Queue
+import shutil
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import AsyncIterator
 from uuid import uuid4
 
 from loguru import logger
-from sqlalchemy import select
-
-from sorawm.configs import WORKING_DIR
+from sqlalchemy import func, select, update
+
+from sorawm.configs import (
+    MAX_TASK_RECOVERIES,
+    PROGRESS_PERSIST_INTERVAL,
+    SCHEDULER_MAX_WAIT,
+    SCHEDULING_POLICY,
+    TASK_CHECKPOINT_DIR,
+    WORKING_DIR,
+)
 from sorawm.schemas import CleanerType
 from sorawm.core import SoraWM
 from sorawm.server.db import get_session
 from sorawm.server.models import Task
+from sorawm.server.scheduler import (
+    ScheduledTask,
+    SchedulingPolicy,
+    TaskScheduler,
+    estimate_task_cost,
+)
 from sorawm.server.schemas import (
     Status,
     WMRemoveResults,
@@ -19,16 +34,36 @@ from sorawm.server.schemas import (
     QueueTaskInfo,
     QueueSummary,
 )
+from sorawm.utils.checkpoint_utils import file_sha256
+
+
+class TaskCancelledError(Exception):
+    pass
 
 
 class WMRemoveTaskWorker:
     def __init__(self) -> None:
-        self.queue = Queue()
+        self.queue = TaskScheduler(
+            SchedulingPolicy(SCHEDULING_POLICY), max_wait=SCHEDULER_MAX_WAIT
+        )
+        # Running tasks whose cancellation was requested; checked by the progress callback.
+        self._cancel_requested: set[str] = set()
         self.sora_wm = None
         self.current_task_id: str | None = None
+        # Live progress of running tasks, written by the processing thread and read by
+        # get_task_status. SQLite only receives throttled snapshots of it.
+        self.live_progress: dict[str, int] = {}
+        # Task counts per status, recomputed lazily after a status transition.
+        self._status_counts: dict[str, int] | None = None
+        # Set (and dropped) whenever the task changes, to wake up its stream subscribers.
+        self._task_events: dict[str, asyncio.Event] = {}
+        # Download times not yet written to tasks.last_accessed_at (see RetentionManager).
+        self.pending_access_times: dict[str, datetime] = {}
         self.output_dir = WORKING_DIR
         self.upload_dir = WORKING_DIR / "uploads"
         self.upload_dir.mkdir(exist_ok=True, parents=True)
+        self.checkpoint_dir = TASK_CHECKPOINT_DIR
+        self.checkpoint_dir.mkdir(exist_ok=True, parents=True)
 
     async def initialize(self):
         logger.info("Initializing SoraWM models...")
@@ -36,6 +71,26 @@ class WMRemoveTaskWorker:
         logger.info("SoraWM models initialized")
 
         async with get_session() as session:
+            # Tasks still PROCESSING were interrupted by a crash or restart; they resume
+            # from their checkpoint unless they keep getting interrupted.
+            result = await session.execute(
+                select(Task).where(Task.status == Status.PROCESSING)
+            )
+            for task in result.scalars().all():
+                task.attempts += 1
+                if task.attempts > MAX_TASK_RECOVERIES:
+                    logger.warning(
+                        f"Task {task.id} was interrupted {task.attempts} times, giving up"
+                    )
+                    task.status = Status.ERROR
+                    task.percentage = 0
+                    shutil.rmtree(self.checkpoint_dir / task.id, ignore_errors=True)
+                else:
+                    logger.info(f"Recovering interrupted task {task.id}")
+                    task.status = Status.QUEUED
+            await session.flush()
+            self.invalidate_status_counts()
+
             stmt = (
                 select(Task)
                 .where(Task.status == Status.QUEUED)
@@ -44,12 +99,28 @@ class WMRemoveTaskWorker:
             result = await session.execute(stmt)
             pending_tasks = result.scalars().all()
 
+            now = datetime.now()
             for task in pending_tasks:
                 logger.info(f"Recovering pending task {task.id}")
                 # Put them back in case of the memory queue.
-                self.queue.put_nowait((task.id, Path(task.video_path)))
+                waited = (now - task.created_at).total_seconds()
+                self.queue.put(
+                    ScheduledTask(
+                        task_id=task.id,
+                        video_path=Path(task.video_path),
+                        priority=task.priority,
+                        estimated_cost=task.estimated_cost,
+                        deadline=task.deadline,
+                        enqueued_at=time.monotonic() - max(waited, 0),
+                    )
+                )
 
-    async def create_task(self, cleaner_type: CleanerType) -> str:
+    async def create_task(
+        self,
+        cleaner_type: CleanerType,
+        priority: int = 0,
+        deadline: datetime | None = None,
+    ) -> str:
         task_uuid = str(uuid4())
         async with get_session() as session:
             task = Task(
@@ -58,8 +129,11 @@ class WMRemoveTaskWorker:
                 cleaner_type=cleaner_type.value,
                 status=Status.UPLOADING,
                 percentage=0,
+                priority=priority,
+                deadline=deadline,
             )
             session.add(task)
+        self.on_status_change(task_uuid)
         logger.info(f"Task {task_uuid} created with UPLOADING status")
         return task_uuid
 
@@ -72,17 +146,122 @@ class WMRemoveTaskWorker:
     #         task.status = status
     #         session.commit()
 
-    async def queue_task(self, task_id: str, video_path: Path):
+    async def queue_task(
+        self, task_id: str, video_path: Path, content_hash: str | None = None
+    ):
         async with get_session() as session:
             result = await session.execute(select(Task).where(Task.id == task_id))
             task = result.scalar_one()
+            cleaner_type = CleanerType(task.cleaner_type)
+            try:
+                estimated_cost = await asyncio.to_thread(
+                    estimate_task_cost, video_path, cleaner_type
+                )
+            except Exception as e:
+                # Unreadable videos fail fast in the worker, so they may as well go first.
+                logger.warning(f"Could not estimate the cost of task {task_id}: {e}")
+                estimated_cost = None
             task.video_path = str(video_path)
+            task.content_hash = content_hash
+            task.estimated_cost = estimated_cost
             task.status = Status.QUEUED
             task.percentage = 0
+            scheduled_task = ScheduledTask(
+                task_id=task_id,
+                video_path=video_path,
+                priority=task.priority,
+                estimated_cost=estimated_cost,
+                deadline=task.deadline,
+            )
+        self.on_status_change(task_id)
 
-        self.queue.put_nowait((task_id, video_path))
+        self.queue.put(scheduled_task)
         logger.info(f"Task {task_id} queued for processing: {video_path}")
 
+    async def cancel_task(self, task_id: str) -> Status | None:
+        """
+        Cancel a queued or running task. Returns the status the task had, or None if it
+        does not exist. A running task stops at its next progress report.
+        """
+        async with get_session() as session:
+            result = await session.execute(select(Task).where(Task.id == task_id))
+            task = result.scalar_one_or_none()
+            if task is None:
+                return None
+            status = Status(task.status)
+            if status == Status.QUEUED:
+                self.queue.remove(task_id)
+                task.status = Status.CANCELLED
+            elif status == Status.PROCESSING:
+                self._cancel_requested.add(task_id)
+        if status == Status.QUEUED:
+            self.on_status_change(task_id)
+            logger.info(f"Task {task_id} cancelled")
+        elif status == Status.PROCESSING:
+            logger.info(f"Cancellation requested for running task {task_id}")
+        return status
+
+    async def find_finished_output(
+        self, content_hash: str, cleaner_type: CleanerType
+    ) -> tuple[Path, str | None] | None:
+        """
+        Return (output_path, output_hash) of an already finished task for the same video
+        content and cleaner, if its file is still on disk. The encoder settings are derived
+        from the input video only, so (content_hash, cleaner_type) identifies the result.
+        """
+        async with get_session() as session:
+            stmt = (
+                select(Task.output_path, Task.output_hash)
+                .where(
+                    Task.content_hash == content_hash,
+                    Task.cleaner_type == cleaner_type.value,
+                    Task.status == Status.FINISHED,
+                    Task.output_path.is_not(None),
+                )
+                .order_by(Task.updated_at.desc())
+            )
+            result = await session.execute(stmt)
+            for output_path, output_hash in result.all():
+                if Path(output_path).exists():
+                    return Path(output_path), output_hash
+        return None
+
+    async def finish_with_existing_output(
+        self,
+        task_id: str,
+        content_hash: str,
+        output_path: Path,
+        output_hash: str | None = None,
+    ) -> str | None:
+        """
+        Finish a task with the output found by `find_finished_output`. Returns None,
+        leaving the task untouched, if the retention manager expired that output in the
+        meantime (the task must then be processed).
+        """
+        download_url = f"/download/{task_id}"
+        async with get_session() as session:
+            still_finished = await session.scalar(
+                select(func.count())
+                .select_from(Task)
+                .where(
+                    Task.output_path == str(output_path),
+                    Task.status == Status.FINISHED,
+                )
+            )
+            if not still_finished:
+                return None
+            result = await session.execute(select(Task).where(Task.id == task_id))
+            task = result.scalar_one()
+            task.content_hash = content_hash
+            task.status = Status.FINISHED
+            task.percentage = 100
+            task.output_path = str(output_path)
+            task.output_hash = output_hash
+            task.download_url = download_url
+        self.on_status_change(task_id)
+        logger.info(f"Task {task_id} reused existing output: {output_path}")
+        return download_url
+
     async def mark_task_error(self, task_id: str, error_msg: str):
         async with get_session() as session:
             result = await session.execute(select(Task).where(Task.id == task_id))
@@ -90,12 +269,14 @@ class WMRemoveTaskWorker:
             if task:
                 task.status = Status.ERROR
                 task.percentage = 0
+        self.on_status_change(task_id)
         logger.error(f"Task {task_id} marked as ERROR: {error_msg}")
 
     async def run(self):
         logger.info("Worker started, waiting for tasks...")
         while True:
-            task_uuid, video_path = await self.queue.get()
+            scheduled_task = await self.queue.get()
+            task_uuid, video_path = scheduled_task.task_id, scheduled_task.video_path
             self.current_task_id = task_uuid
 
             # await
@@ -118,17 +299,38 @@ class WMRemoveTaskWorker:
                     if cleaner_type != self.sora_wm.cleaner_type:
                         self.sora_wm = SoraWM(cleaner_type=cleaner_type)
                         logger.info(f"Switched cleaner type to {cleaner_type}")
+                self.on_status_change(task_uuid)
 
                 loop = asyncio.get_event_loop()
+                self.live_progress[task_uuid] = 10
+                last_persisted_at = time.monotonic()
+                pending_write = None
 
                 def progress_callback(percentage: int):
-                    asyncio.run_coroutine_threadsafe(
+                    nonlocal last_persisted_at, pending_write
+                    if task_uuid in self._cancel_requested:
+                        raise TaskCancelledError(task_uuid)
+                    self.live_progress[task_uuid] = percentage
+                    loop.call_soon_threadsafe(self._notify_task_update, task_uuid)
+                    now = time.monotonic()
+                    if now - last_persisted_at < PROGRESS_PERSIST_INTERVAL:
+                        return
+                    # Never stack writes up behind a slow one.
+                    if pending_write is not None and not pending_write.done():
+                        return
+                    last_persisted_at = now
+                    pending_write = asyncio.run_coroutine_threadsafe(
                         self._update_progress(task_uuid, percentage), loop
                     )
 
                 await asyncio.to_thread(
-                    self.sora_wm.run, video_path, output_path, progress_callback
+                    self.sora_wm.run,
+                    video_path,
+                    output_path,
+                    progress_callback,
+                    checkpoint_dir=self.checkpoint_dir / task_uuid,
                 )
+                output_hash = await asyncio.to_thread(file_sha256, output_path)
 
                 async with get_session() as session:
                     result = await session.execute(
@@ -138,12 +340,25 @@ class WMRemoveTaskWorker:
                     task.status = Status.FINISHED
                     task.percentage = 100
                     task.output_path = str(output_path)
+                    task.output_hash = output_hash
                     task.download_url = f"/download/{task_uuid}"
+                self.on_status_change(task_uuid)
 
                 logger.info(
                     f"Task {task_uuid} completed successfully, output: {output_path}"
                 )
 
+            except TaskCancelledError:
+                logger.info(f"Task {task_uuid} cancelled while processing")
+                async with get_session() as session:
+                    await session.execute(
+                        update(Task)
+                        .where(Task.id == task_uuid)
+                        .values(status=Status.CANCELLED, percentage=0)
+                    )
+                self.on_status_change(task_uuid)
+                await self._discard_checkpoint(task_uuid)
+
             except Exception as e:
                 logger.error(f"Error processing task {task_uuid}: {e}")
                 async with get_session() as session:
@@ -153,23 +368,37 @@ class WMRemoveTaskWorker:
                     task = result.scalar_one()
                     task.status = Status.ERROR
                     task.percentage = 0
+                self.on_status_change(task_uuid)
+                await self._discard_checkpoint(task_uuid)
 
             finally:
+                # The final status has been persisted above, so the DB is authoritative again.
+                self.live_progress.pop(task_uuid, None)
+                self._cancel_requested.discard(task_uuid)
                 self.current_task_id = None
-                self.queue.task_done()
+
+    async def _discard_checkpoint(self, task_id: str):
+        # Only a crash or restart resumes a task; failed and cancelled ones start over.
+        await asyncio.to_thread(
+            shutil.rmtree, self.checkpoint_dir / task_id, ignore_errors=True
+        )
 
     async def _update_progress(self, task_id: str, percentage: int):
         try:
             async with get_session() as session:
-                result = await session.execute(select(Task).where(Task.id == task_id))
-                task = result.scalar_one_or_none()
-                if task:
-                    task.percentage = percentage
-                    logger.debug(f"Task {task_id} progress updated to {percentage}%")
+                await session.execute(
+                    update(Task)
+                    .where(Task.id == task_id, Task.status == Status.PROCESSING)
+                    .values(percentage=percentage)
+                )
+            logger.debug(f"Task {task_id} progress persisted at {percentage}%")
         except Exception as e:
             logger.error(f"Error updating progress for task {task_id}: {e}")
 
     async def get_task_status(self, task_id: str) -> WMRemoveResults | None:
+        percentage = self.live_progress.get(task_id)
+        if percentage is not None:
+            return WMRemoveResults(percentage=percentage, status=Status.PROCESSING)
         async with get_session() as session:
             result = await session.execute(select(Task).where(Task.id == task_id))
             task = result.scalar_one_or_none()
@@ -181,6 +410,23 @@ class WMRemoveTaskWorker:
                 download_url=task.download_url,
             )
 
+    async def get_download_target(
+        self, task_id: str
+    ) -> tuple[Status, Path | None, str | None] | None:
+        """(status, output_path, output_hash) of a task in a single query."""
+        async with get_session() as session:
+            stmt = select(Task.status, Task.output_path, Task.output_hash).where(
+                Task.id == task_id
+            )
+            row = (await session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        status, output_path, output_hash = row
+        return Status(status), Path(output_path) if output_path else None, output_hash
+
+    def record_download(self, task_id: str):
+        self.pending_access_times[task_id] = datetime.now()
+
     async def get_output_path(self, task_id: str) -> Path | None:
         async with get_session() as session:
             result = await session.execute(select(Task).where(Task.id == task_id))
@@ -189,40 +435,130 @@ class WMRemoveTaskWorker:
                 return None
             return Path(task.output_path)
 
-    async def get_queue_status(self) -> QueueStatusResponse:
+    def _notify_task_update(self, task_id: str):
+        event = self._task_events.pop(task_id, None)
+        if event is not None:
+            event.set()
+
+    def invalidate_status_counts(self):
+        self._status_counts = None
+
+    def on_status_change(self, task_id: str):
+        self.invalidate_status_counts()
+        self._notify_task_update(task_id)
+
+    async def get_tasks_status(
+        self, task_ids: list[str]
+    ) -> dict[str, WMRemoveResults]:
+        """
+        Status of many tasks with a single query; running tasks are answered from memory.
+        Unknown task ids are left out of the result.
+        """
+        results = {
+            task_id: WMRemoveResults(
+                percentage=self.live_progress[task_id], status=Status.PROCESSING
+            )
+            for task_id in task_ids
+            if task_id in self.live_progress
+        }
+        remaining = [task_id for task_id in task_ids if task_id not in results]
+        if remaining:
+            async with get_session() as session:
+                stmt = select(
+                    Task.id, Task.percentage, Task.status, Task.download_url
+                ).where(Task.id.in_(remaining))
+                result = await session.execute(stmt)
+                for task_id, percentage, status, download_url in result.all():
+                    results[task_id] = WMRemoveResults(
+                        percentage=percentage,
+                        status=Status(status),
+                        download_url=download_url,
+                    )
+        return results
+
+    async def stream_task_status(
+        self, task_id: str, heartbeat: float = 15.0
+    ) -> AsyncIterator[WMRemoveResults | None]:
+        """
+        Yield the task status every time it changes, until it leaves the active statuses
+        (UPLOADING, QUEUED, PROCESSING), i.e. it is FINISHED, ERROR, CANCELLED or
+        EXPIRED. None is yielded after `heartbeat` seconds without change so callers can
+        keep the connection alive. Nothing is yielded for an unknown task.
+        """
+        last_result = None
+        while True:
+            # Register before reading the state so no update can slip in between.
+            event = self._task_events.setdefault(task_id, asyncio.Event())
+            result = await self.get_task_status(task_id)
+            if result is None:
+                return
+            if result != last_result:
+                yield result
+                last_result = result
+            if result.status not in (
+                Status.UPLOADING,
+                Status.QUEUED,
+                Status.PROCESSING,
+            ):
+                return
+            try:
+                await asyncio.wait_for(event.wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def _get_status_counts(self) -> dict[str, int]:
+        if self._status_counts is None:
+            async with get_session() as session:
+                stmt = select(Task.status, func.count()).group_by(Task.status)
+                result = await session.execute(stmt)
+                self._status_counts = {status: count for status, count in result.all()}
+        return self._status_counts
+
+    async def get_queue_status(
+        self, page: int = 1, page_size: int = 50, status: Status | None = None
+    ) -> QueueStatusResponse:
         """
         获取队列状态，返回 Pydantic 模型
+        任务列表按创建时间倒序分页，可按状态筛选；统计数据来自缓存的状态计数
         """
         # 1. 获取内存中的实时状态快照
         current_running = self.current_task_id
-
-        waiting_list_schemas = []
+        status_counts = await self._get_status_counts()
+
+        stmt = select(Task)
+        if status is not None:
+            stmt = stmt.where(Task.status == status)
+        if current_running is not None:
+            stmt = stmt.where(Task.id != current_running)
+        stmt = (
+            stmt.order_by(Task.created_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
 
         async with get_session() as session:
-            stmt = select(Task).order_by(Task.created_at.desc()).limit(limit=-1)
-
             result = await session.execute(stmt)
-            all_recent_tasks = result.scalars().all()
-
-            for task in all_recent_tasks:
-                if task.id == current_running:
-                    continue
-
-                waiting_list_schemas.append(
-                    QueueTaskInfo(
-                        id=task.id,
-                        status=task.status.value
-                        if hasattr(task.status, "value")
-                        else str(task.status),
-                        percentage=task.percentage,
-                        video_path=str(task.video_path),
-                        created_at=task.created_at,
-                    )
-                )
+            page_tasks = result.scalars().all()
 
-        real_queue_length = len(
-            [t for t in waiting_list_schemas if t.status == "QUEUED"]
-        )
+        waiting_list_schemas = [
+            QueueTaskInfo(
+                id=task.id,
+                status=str(task.status),
+                percentage=task.percentage,
+                video_path=str(task.video_path),
+                created_at=task.created_at,
+            )
+            for task in page_tasks
+        ]
+
+        if status is None:
+            total = sum(status_counts.values())
+        else:
+            total = status_counts.get(status, 0)
+        if current_running is not None and status in (None, Status.PROCESSING):
+            total = max(total - 1, 0)
+
+        real_queue_length = status_counts.get(Status.QUEUED, 0)
         is_busy = current_running is not None
 
         summary = QueueSummary(
@@ -235,6 +571,9 @@ class WMRemoveTaskWorker:
             summary=summary,
             current_task_id=current_running,
             waiting_queue=waiting_list_schemas,
+            total=total,
+            page=page,
+            page_size=page_size,
         )
 
 
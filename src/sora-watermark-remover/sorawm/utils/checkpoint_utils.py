@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+import ffmpeg
+
+CHECKPOINT_VERSION = 2
+STATE_FILENAME = "state.json"
+
+BBox = Tuple[int, int, int, int]
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class SegmentCheckpoint:
+    """
+    Persists the progress of one `SoraWM.run` call in `checkpoint_dir`:
+
+    - `state.json`: the bbox track (detection result after imputation) and the segment
+      boundaries used for cleaning,
+    - `segment_XXXXX.mp4`: each cleaned segment, encoded on its own and renamed into
+      place only once complete.
+
+    A run that is interrupted can then skip detection and every completed segment. The
+    checkpoint is discarded when it was made for a different input (compared by content
+    hash, so a re-exported video with the same name and size is not mixed in), cleaner,
+    frame rate or segment length.
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        input_video_path: Path,
+        cleaner_type: str,
+        fps: float,
+        segment_frames: int,
+    ):
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = {
+            "version": CHECKPOINT_VERSION,
+            "input_size": input_video_path.stat().st_size,
+            "input_sha256": file_sha256(input_video_path),
+            "cleaner_type": str(cleaner_type),
+            "fps": float(fps),
+            "segment_frames": int(segment_frames),
+        }
+        self.state = self._load_state()
+
+    @property
+    def state_path(self) -> Path:
+        return self.checkpoint_dir / STATE_FILENAME
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except FileNotFoundError:
+            return dict(self.fingerprint)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.state_path}: {e}")
+            state = {}
+        if any(state.get(key) != value for key, value in self.fingerprint.items()):
+            logger.warning(f"Discarding stale checkpoint in {self.checkpoint_dir}")
+            self.clear(keep_dir=True)
+            return dict(self.fingerprint)
+        return state
+
+    def _save_state(self):
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.state))
+        os.replace(tmp_path, self.state_path)
+
+    def load_bboxes(
+        self,
+    ) -> Optional[Tuple[Dict[int, Dict[str, Optional[BBox]]], List[int]]]:
+        """Returns (frame_bboxes, bkps_full) saved by a previous run, if any."""
+        if "frame_bboxes" not in self.state:
+            return None
+        frame_bboxes = {
+            idx: {"bbox": tuple(bbox) if bbox is not None else None}
+            for idx, bbox in enumerate(self.state["frame_bboxes"])
+        }
+        return frame_bboxes, self.state["bkps_full"]
+
+    def save_bboxes(
+        self, frame_bboxes: Dict[int, Dict[str, Optional[BBox]]], bkps_full: List[int]
+    ):
+        self.state["frame_bboxes"] = [
+            list(map(int, frame_bboxes[idx]["bbox"]))
+            if frame_bboxes[idx]["bbox"] is not None
+            else None
+            for idx in range(len(frame_bboxes))
+        ]
+        self.state["bkps_full"] = [int(bkp) for bkp in bkps_full]
+        self._save_state()
+
+    def segments(self, compute: Callable[[], List[int]]) -> List[int]:
+        """
+        Segment boundaries of the cleaning pass. They are computed once and then reused,
+        since completed segments are only valid for the boundaries they were made with.
+        """
+        if "segments" not in self.state:
+            self.state["segments"] = [int(bkp) for bkp in compute()]
+            self._save_state()
+        return self.state["segments"]
+
+    def segment_path(self, segment_idx: int) -> Path:
+        return self.checkpoint_dir / f"segment_{segment_idx:05d}.mp4"
+
+    def partial_segment_path(self, segment_idx: int) -> Path:
+        return self.checkpoint_dir / f"segment_{segment_idx:05d}.part.mp4"
+
+    def is_segment_done(self, segment_idx: int) -> bool:
+        return self.segment_path(segment_idx).exists()
+
+    def commit_segment(self, segment_idx: int):
+        os.replace(
+            self.partial_segment_path(segment_idx), self.segment_path(segment_idx)
+        )
+
+    def concat_segments(self, num_segments: int, output_path: Path):
+        """Join the encoded segments into `output_path` without re-encoding."""
+        list_path = self.checkpoint_dir / "segments.txt"
+        list_path.write_text(
+            "".join(
+                f"file '{self.segment_path(idx).name}'\n" for idx in range(num_segments)
+            )
+        )
+        (
+            ffmpeg.input(str(list_path), format="concat", safe=0)
+            .output(str(output_path), c="copy")
+            .overwrite_output()
+            .global_args("-loglevel", "error")
+            .run()
+        )
+
+    def clear(self, keep_dir: bool = False):
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+        if keep_dir:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
@@ -109,9 +109,17 @@ class VideoLoader:
         return frames
 
     def __iter__(self):
+        return self.iter_frames()
+
+    def iter_frames(self, start: int = 0, end: Optional[int] = None):
+        """Stream frames [start, end) without holding them in memory."""
+        if end is not None and end <= start:
+            return
+        input_kwargs = {"ss": start / self.fps} if start > 0 else {}
+        output_kwargs = {"frames": end - start} if end is not None else {}
         process_in = (
-            ffmpeg.input(self.video_path)
-            .output("pipe:", format="rawvideo", pix_fmt="bgr24")
+            ffmpeg.input(self.video_path, **input_kwargs)
+            .output("pipe:", format="rawvideo", pix_fmt="bgr24", **output_kwargs)
             .global_args("-loglevel", "error")
             .run_async(pipe_stdout=True)
         )
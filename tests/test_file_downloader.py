@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Tests for the resumable downloader against a local HTTP server.
+
+Run with: python -m pytest tests/test_file_downloader.py
+"""
+
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from file_downloader import DownloadError, FileDownloader
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 123)
+CHUNK_SIZE = 64 * 1024
+
+
+class VideoHandler(BaseHTTPRequestHandler):
+    """Serves CONTENT at /video.mp4 with Range support, and can cut connections short"""
+
+    protocol_version = "HTTP/1.1"
+    # Number of upcoming GET responses to cut after `cut_after` bytes
+    cut_responses = 0
+    cut_after = 0
+    range_support = True
+    etag = '"v1"'
+    requests_log = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, send_body):
+        cls = type(self)
+        cls.requests_log.append((self.command, self.headers.get("Range")))
+        if self.path == "/missing.mp4":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/flaky.mp4" and self.command == "GET" and cls.cut_responses == -1:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            cls.cut_responses = 0
+            return
+
+        start, end, status = 0, len(CONTENT) - 1, 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if cls.range_support and range_header and (if_range is None or if_range == cls.etag):
+            match = re.match(r"bytes=(\d+)-(\d*)", range_header)
+            start = int(match.group(1))
+            if match.group(2):
+                end = min(int(match.group(2)), len(CONTENT) - 1)
+            if start >= len(CONTENT):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(CONTENT)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        body = CONTENT[start:end + 1]
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", cls.etag)
+        if cls.range_support:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+        self.end_headers()
+        if not send_body:
+            return
+        if self.command == "GET" and cls.cut_responses > 0:
+            cls.cut_responses -= 1
+            self.wfile.write(body[:cls.cut_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    VideoHandler.cut_responses = 0
+    VideoHandler.cut_after = 0
+    VideoHandler.range_support = True
+    VideoHandler.etag = '"v1"'
+    VideoHandler.requests_log = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), VideoHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_downloader(**kwargs):
+    kwargs.setdefault("chunk_size", CHUNK_SIZE)
+    kwargs.setdefault("backoff", 0)
+    kwargs.setdefault("segment_threshold", None)
+    return FileDownloader(**kwargs)
+
+
+def test_downloads_to_final_path_without_leftovers(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    progress = []
+
+    size = make_downloader().download(
+        f"{server}/video.mp4", output, progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert size == len(CONTENT)
+    assert output.read_bytes() == CONTENT
+    assert sorted(os.listdir(tmp_path)) == ["video.mp4"]
+    assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+
+def test_resumes_partial_file_with_range(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    part = tmp_path / "video.mp4.part"
+    part.write_bytes(CONTENT[:1000000])
+
+    make_downloader().download(f"{server}/video.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+    assert VideoHandler.requests_log == [("GET", "bytes=1000000-")]
+
+
+def test_retries_and_resumes_after_connection_drop(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    # Cut on a chunk boundary: a chunk interrupted halfway is not written.
+    VideoHandler.cut_responses = 2
+    VideoHandler.cut_after = 8 * CHUNK_SIZE
+
+    make_downloader().download(f"{server}/video.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+    ranges = [header for _, header in VideoHandler.requests_log]
+    assert ranges == [None, f"bytes={8 * CHUNK_SIZE}-", f"bytes={16 * CHUNK_SIZE}-"]
+
+
+def test_retries_server_errors(server, tmp_path):
+    output = tmp_path / "flaky.mp4"
+    VideoHandler.cut_responses = -1
+
+    make_downloader().download(f"{server}/flaky.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+    assert len(VideoHandler.requests_log) == 2
+
+
+def test_restarts_when_remote_file_changed(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    downloader = make_downloader(max_retries=0)
+    VideoHandler.cut_responses = 1
+    VideoHandler.cut_after = 10 * CHUNK_SIZE
+    with pytest.raises(DownloadError):
+        downloader.download(f"{server}/video.mp4", output)
+    assert (tmp_path / "video.mp4.part").stat().st_size == 10 * CHUNK_SIZE
+
+    # If-Range no longer matches: the server sends the whole file again.
+    VideoHandler.etag = '"v2"'
+    downloader.download(f"{server}/video.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+
+
+def test_server_without_range_support_restarts_from_zero(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    (tmp_path / "video.mp4.part").write_bytes(b"stale bytes")
+    VideoHandler.range_support = False
+
+    make_downloader().download(f"{server}/video.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+
+
+def test_client_errors_are_not_retried(server, tmp_path):
+    with pytest.raises(DownloadError):
+        make_downloader().download(f"{server}/missing.mp4", tmp_path / "missing.mp4")
+
+    assert len(VideoHandler.requests_log) == 1
+    assert not (tmp_path / "missing.mp4").exists()
+
+
+def test_parallel_segments(server, tmp_path):
+    output = tmp_path / "video.mp4"
+
+    make_downloader(segment_threshold=1024 * 1024, max_segments=4).download(
+        f"{server}/video.mp4", output
+    )
+
+    assert output.read_bytes() == CONTENT
+    ranged_gets = [header for method, header in VideoHandler.requests_log if method == "GET"]
+    assert len(ranged_gets) == 4
+    assert all(header.startswith("bytes=") for header in ranged_gets)
+    assert sorted(os.listdir(tmp_path)) == ["video.mp4"]
+
+
+def test_parallel_segments_resume_after_failure(server, tmp_path):
+    output = tmp_path / "video.mp4"
+    downloader = make_downloader(segment_threshold=1024 * 1024, max_segments=4, max_retries=0)
+    VideoHandler.cut_responses = 4
+    VideoHandler.cut_after = 2 * CHUNK_SIZE
+    with pytest.raises(DownloadError):
+        downloader.download(f"{server}/video.mp4", output)
+    assert (tmp_path / "video.mp4.part.json").exists()
+
+    VideoHandler.requests_log = []
+    downloader.download(f"{server}/video.mp4", output)
+
+    assert output.read_bytes() == CONTENT
+    # Every segment picked up where it stopped instead of starting over.
+    resumed_starts = sorted(
+        int(re.match(r"bytes=(\d+)-", header).group(1))
+        for method, header in VideoHandler.requests_log
+        if method == "GET"
+    )
+    segment_size = -(-len(CONTENT) // 4)
+    assert resumed_starts == [i * segment_size + 2 * CHUNK_SIZE for i in range(4)]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTML backends of the backup video URL extraction.
+
+Run with: python -m pytest tests/test_html_video_urls.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from html_video_urls import available_backends, benchmark, extract_video_urls, resolve_backend
+
+BASE = "https://sora.chatgpt.com/explore"
+
+PAGE = """
+<html><head>
+<style>.card { background: url("/bg.mp4"); }</style>
+<script>window.__data = {"video": "https://cdn.example.com/not-markup.mp4"};</script>
+</head><body>
+<!-- <video src="https://cdn.example.com/commented.mp4"></video> -->
+<video src="https://videos.openai.com/vg-assets/a.mp4?se=2025&amp;sig=x" autoplay muted></video>
+<video><source src='/assets/b.webm' type="video/webm"></video>
+<a href="/download/c.MOV">Download</a>
+<a href="/p/s_123">Post</a>
+<div class="card clip.mp4" data-preview=https://cdn.example.com/d.mp4 data-id="42"></div>
+<img src="/thumb.jpg" alt="> not a video">
+</body></html>
+"""
+
+EXPECTED = {
+    "https://videos.openai.com/vg-assets/a.mp4?se=2025&sig=x",
+    "https://sora.chatgpt.com/assets/b.webm",
+    "https://sora.chatgpt.com/download/c.MOV",
+    "https://cdn.example.com/d.mp4",
+}
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_find_the_same_urls(backend):
+    assert extract_video_urls(PAGE, BASE, backend) == EXPECTED
+
+
+def test_empty_page():
+    assert extract_video_urls("", BASE, "regex") == set()
+    assert extract_video_urls("<html></html>", BASE) == set()
+
+
+def test_unknown_or_missing_backend():
+    with pytest.raises(ValueError):
+        resolve_backend("html5lib")
+    missing = [backend for backend in ("lxml", "selectolax", "bs4") if backend not in available_backends()]
+    for backend in missing:
+        with pytest.raises(RuntimeError):
+            resolve_backend(backend)
+
+
+def test_benchmark_on_snapshot(tmp_path):
+    snapshot = tmp_path / "page_backup.html"
+    snapshot.write_text(PAGE, encoding='utf-8')
+
+    results = benchmark([snapshot], BASE, repeat=2, backends=["regex"])
+    assert results["regex"]["urls"] == len(EXPECTED)
+    assert results["regex"]["seconds"] >= 0
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming JSONL metadata sink and its compaction tool.
+
+Run with: python -m pytest tests/test_metadata_sink.py
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from metadata_sink import MetadataSink, compact, iter_records, write_combined_json, write_sqlite
+
+
+def page(url, **fields):
+    return {"url": url, "title": "Sora", "likes": 3, "comments": [], "downloaded_file": None, **fields}
+
+
+def test_records_are_readable_before_close(tmp_path):
+    sink = MetadataSink(tmp_path / "stream.jsonl", fsync_every=100)
+    sink.write(page("https://sora.chatgpt.com/p/s_1", description="Un chat qui surfe"))
+
+    # Flushed on write: a reader tailing the stream sees it right away
+    records = list(iter_records(sink.path))
+    assert records[0]["description"] == "Un chat qui surfe"
+    sink.close()
+
+
+def test_last_record_of_a_burst_is_fsynced_by_the_timer(tmp_path):
+    sink = MetadataSink(tmp_path / "stream.jsonl", fsync_every=100, fsync_interval=0.1)
+    sink.write(page("https://sora.chatgpt.com/p/s_1"))
+    assert sink.unsynced == 1
+
+    # No further write: the timer fsyncs it anyway
+    deadline = time.monotonic() + 2
+    while sink.unsynced and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert sink.unsynced == 0
+    sink.close()
+
+
+def test_partial_last_line_is_skipped(tmp_path):
+    path = tmp_path / "stream.jsonl"
+    sink = MetadataSink(path)
+    sink.write(page("https://sora.chatgpt.com/p/s_1"))
+    sink.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"url": "https://sora.chatgpt.com/p/s_2", "ti')
+
+    assert [record["url"] for record in iter_records(path)] == ["https://sora.chatgpt.com/p/s_1"]
+
+
+def test_compact_keeps_latest_record_per_page(tmp_path):
+    sink = MetadataSink(tmp_path / "stream.jsonl")
+    sink.write(page("https://sora.chatgpt.com/p/s_1"))
+    sink.write(page("https://sora.chatgpt.com/p/s_2"))
+    sink.write(page("https://sora.chatgpt.com/p/s_1", downloaded_file="remix_0001.mp4"))
+    sink.close()
+
+    records = compact(sink.path)
+    assert [record["url"] for record in records] == ["https://sora.chatgpt.com/p/s_1", "https://sora.chatgpt.com/p/s_2"]
+    assert records[0]["downloaded_file"] == "remix_0001.mp4"
+
+    combined = tmp_path / "all_remixes_metadata.json"
+    write_combined_json(records, combined, successful_downloads=1)
+    data = json.loads(combined.read_text(encoding='utf-8'))
+    assert data["total_remixes"] == 2
+    assert data["successful_downloads"] == 1
+
+
+def test_sqlite_table(tmp_path):
+    comments = [{"username": "fan", "comment_text": "Incroyable !"}]
+    records = [page("https://sora.chatgpt.com/p/s_1", comments=comments, already_scraped=True)]
+    db = tmp_path / "remixes.db"
+    write_sqlite(records, db)
+    write_sqlite(records, db)  # Replaces the table
+
+    conn = sqlite3.connect(str(db))
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("SELECT * FROM remixes").fetchall()
+    conn.close()
+    assert len(rows) == 1
+    assert rows[0]["comment_count"] == 1
+    assert json.loads(rows[0]["comments"]) == comments
+    assert rows[0]["already_scraped"] == 1
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the network capture mode, fed from a recorded HAR file and a fake driver.
+
+Run with: python -m pytest tests/test_network_capture.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from network_capture import CapturedFeed, NetworkCapture
+
+HAR_PATH = Path(__file__).parent / "fixtures" / "sora_remix_feed.har"
+
+
+def load_feed():
+    feed = CapturedFeed()
+    feed.load_har(HAR_PATH)
+    return feed
+
+
+def test_har_builds_remix_list_in_feed_order():
+    feed = load_feed()
+
+    assert feed.remixes_of("s_root01") == ["s_remix01", "s_remix02", "s_remix03"]
+    assert feed.post_url("s_remix02") == "https://sora.chatgpt.com/p/s_remix02"
+    # Comments are not remixes, and other JSON responses are ignored
+    assert "s_cmt01" not in feed.posts
+    assert feed.remixes_of("s_remix01") == []
+
+
+def test_metadata_matches_extractor_format():
+    feed = load_feed()
+
+    metadata = feed.metadata("s_root01", "https://sora.chatgpt.com/p/s_root01")
+
+    assert metadata["url"] == "https://sora.chatgpt.com/p/s_root01"
+    assert metadata["description"] == "A cat surfing a tidal wave"
+    assert metadata["creator"] == "Dark Lex"
+    assert metadata["creator_profile_url"] == "https://sora.chatgpt.com/profile/dark.lex"
+    assert metadata["creator_avatar_url"] == "https://videos.openai.com/az/avatars/dark.lex.webp"
+    assert metadata["likes"] == 270
+    assert metadata["remixes"] == 3
+    assert metadata["video_url"].startswith("https://videos.openai.com/az/files/s_root01/download.mp4")
+    assert metadata["downloaded_file"] is None
+
+
+def test_comments_and_creator_fallback():
+    feed = load_feed()
+
+    comments = feed.metadata("s_remix01")["comments"]
+    assert [c["comment_text"] for c in comments] == ["This is amazing!", "How did you do this?"]
+    assert comments[0]["username"] == "Fan One"
+    assert comments[0]["likes"] == 3
+    # No display name: the username is used
+    assert feed.metadata("s_remix02")["creator"] == "doglover"
+
+
+def test_later_payloads_complete_posts():
+    feed = load_feed()
+
+    # The remix feed had no attachment for s_remix03; its own page payload did
+    assert feed.has_post("s_remix03", need_video=True)
+    assert feed.metadata("s_remix03")["likes"] == 4
+    assert feed.metadata("s_unknown") is None
+
+
+def test_comments_must_be_captured_to_skip_the_page():
+    feed = load_feed()
+
+    # s_remix01's comment list was recorded; s_remix03's was not (feeds never carry comments)
+    assert feed.has_post("s_remix01", need_comments=True)
+    assert feed.has_post("s_remix03", need_video=True)
+    assert not feed.has_post("s_remix03", need_video=True, need_comments=True)
+
+    # A post that says it has no comments needs no comment list
+    feed.add_payload({"items": [{"id": "s_quiet01", "text": "Calm sea", "reply_count": 0}]})
+    assert feed.has_post("s_quiet01", need_comments=True)
+
+
+class FakeDriver:
+    """Replays HAR responses as Chrome performance log entries"""
+
+    def __init__(self, har_path):
+        with open(har_path, "r", encoding="utf-8") as f:
+            self.entries = json.load(f)["log"]["entries"]
+        self.bodies = {}
+        self.log = []
+        for index, entry in enumerate(self.entries):
+            request_id = f"req-{index}"
+            content = entry["response"]["content"]
+            self.bodies[request_id] = {
+                "body": content.get("text", ""),
+                "base64Encoded": content.get("encoding") == "base64",
+            }
+            self._log("Network.responseReceived", {
+                "requestId": request_id,
+                "type": "XHR" if "json" in content["mimeType"] else "Document",
+                "response": {"url": entry["request"]["url"], "status": 200,
+                             "mimeType": content["mimeType"]},
+            })
+            self._log("Network.loadingFinished", {"requestId": request_id})
+
+    def _log(self, method, params):
+        self.log.append({"message": json.dumps({"message": {"method": method, "params": params}})})
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.getResponseBody":
+            return self.bodies[params["requestId"]]
+        return {}
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        entries, self.log = self.log, []
+        return entries
+
+
+def test_capture_reads_performance_log():
+    capture = NetworkCapture(FakeDriver(HAR_PATH))
+    assert capture.enable()
+
+    # Every JSON XHR body is read once (the broken one is skipped)
+    assert capture.poll() == 6
+    assert capture.poll() == 0
+    assert capture.feed.remixes_of("s_root01") == ["s_remix01", "s_remix02", "s_remix03"]
+    assert capture.pending == {}
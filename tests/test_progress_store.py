@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite progress store (batch progress, checkpoints, per-remix state).
+
+Run with: python -m pytest tests/test_progress_store.py
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from progress_store import ProgressStore
+
+URL = "https://sora.chatgpt.com/p/s_root01"
+
+
+def test_url_lifecycle(tmp_path):
+    store = ProgressStore(tmp_path / "progress.db")
+    store.add_urls([URL, "https://sora.chatgpt.com/p/s_root02"])
+
+    store.start_url(URL, tmp_path / "url-1")
+    store.fail_url(URL, "invalid session id")
+    assert not store.is_completed(URL)
+    assert [row["url"] for row in store.urls(status="failed")] == [URL]
+    assert store.urls(status="failed")[0]["attempts"] == 1
+
+    store.start_url(URL, tmp_path / "url-1")
+    store.complete_url(URL)
+    assert store.is_completed(URL)
+    assert store.completed_count() == 1
+    row = store.urls(status="completed")[0]
+    assert row["attempts"] == 2
+    assert row["last_error"] is None
+    assert store.summary()["urls"] == {"completed": 1, "pending": 1}
+
+
+def test_checkpoint_and_remix_urls_survive_reopen(tmp_path):
+    store = ProgressStore(tmp_path / "progress.db")
+    assert store.last_completed_index(URL) == -1
+    assert store.load_remix_urls(URL) == (None, False)
+
+    store.save_checkpoint(URL, 4)
+    store.save_remix_urls(URL, ["https://sora.chatgpt.com/p/s_remix01", None], all_loaded=True)
+    store.close()
+
+    store = ProgressStore(tmp_path / "progress.db")
+    assert store.last_completed_index(URL) == 4
+    assert store.load_remix_urls(URL) == (["https://sora.chatgpt.com/p/s_remix01", None], True)
+
+    # Completing the URL clears its checkpoint
+    store.complete_url(URL)
+    assert store.last_completed_index(URL) == -1
+
+
+def test_remix_state_counts_attempts(tmp_path):
+    store = ProgressStore(tmp_path / "progress.db")
+    store.record_remix(URL, 0, "failed", error="Video download failed")
+    store.record_remix(URL, 0, "completed", remix_url="https://sora.chatgpt.com/p/s_remix01")
+    store.record_remix(URL, 1, "skipped")
+
+    assert store.remixes(status="failed") == []
+    first = store.remixes(url=URL)[0]
+    assert first["attempts"] == 2
+    assert first["remix_url"] == "https://sora.chatgpt.com/p/s_remix01"
+    assert first["last_error"] is None
+    assert [row["remix_index"] for row in store.remixes(status="skipped")] == [1]
+
+
+def test_imports_legacy_json_progress(tmp_path):
+    legacy = tmp_path / ".batch_progress.json"
+    legacy.write_text(json.dumps({"completed_urls": [URL]}))
+    store = ProgressStore(tmp_path / "progress.db")
+
+    assert store.import_json_progress(legacy) == 1
+    assert store.is_completed(URL)
+    assert not legacy.exists()
+    assert store.import_json_progress(legacy) == 0
+
+
+def test_concurrent_writers(tmp_path):
+    # Parallel batch workers each open their own connection on the same file
+    stores = [ProgressStore(tmp_path / "progress.db") for _ in range(4)]
+
+    def work(worker, store):
+        for index in range(25):
+            store.record_remix(URL, worker * 100 + index, "completed")
+            store.save_checkpoint(URL, index)
+
+    threads = [threading.Thread(target=work, args=(worker, store)) for worker, store in enumerate(stores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stores[0].remixes(status="completed")) == 100
+
+
+def test_imports_legacy_checkpoints_and_remix_urls(tmp_path):
+    store = ProgressStore(tmp_path / "progress.db")
+    (tmp_path / ".scrape_checkpoint.json").write_text(json.dumps({
+        URL: {"last_completed_index": 7, "timestamp": "2025-10-01T12:00:00"}
+    }))
+    (tmp_path / ".remix_urls.json").write_text(json.dumps({
+        URL: {"urls": ["https://sora.chatgpt.com/p/s_remix01"], "all_loaded": True}
+    }))
+
+    assert store.import_legacy_files(tmp_path) == {"completed_urls": 0, "checkpoints": 1, "remix_urls": 1}
+    # An interrupted run resumes where the JSON files left it
+    assert store.last_completed_index(URL) == 7
+    assert store.load_remix_urls(URL) == (["https://sora.chatgpt.com/p/s_remix01"], True)
+    assert store.import_legacy_files(tmp_path) == {"completed_urls": 0, "checkpoints": 0, "remix_urls": 0}
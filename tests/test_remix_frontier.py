@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent remix crawl frontier.
+
+Run with: python -m pytest tests/test_remix_frontier.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "scraper"))
+
+from remix_frontier import RemixFrontier
+
+BASE = "https://sora.chatgpt.com/p/"
+
+
+def test_posts_are_only_queued_once(tmp_path):
+    frontier = RemixFrontier(tmp_path / "frontier.db")
+
+    assert frontier.add(BASE + "s_root", 0)
+    root = frontier.claim()
+    frontier.complete(root["post_id"], likes=10, remixes=2)
+
+    assert frontier.add(BASE + "s_a", 1, "s_root")
+    # Same post reached through another branch, or the root found again
+    assert not frontier.add(BASE + "s_a/", 2, "s_b")
+    assert not frontier.add(BASE + "s_root", 1)
+    assert frontier.counts() == {"queued": 1, "claimed": 0, "done": 1, "failed": 0}
+
+
+def test_claim_order_depth_then_popularity(tmp_path):
+    frontier = RemixFrontier(tmp_path / "frontier.db")
+    frontier.add(BASE + "s_deep", 2, popularity=1000)
+    frontier.add(BASE + "s_quiet", 1, popularity=3)
+    frontier.add(BASE + "s_popular", 1, popularity=250)
+
+    assert frontier.claim()["post_id"] == "s_popular"
+    assert frontier.claim()["post_id"] == "s_quiet"
+    # Deeper posts stay queued when over max_depth
+    assert frontier.claim(max_depth=1) is None
+    assert frontier.claim()["post_id"] == "s_deep"
+    assert frontier.claim() is None
+
+
+def test_interrupted_crawl_resumes(tmp_path):
+    frontier = RemixFrontier(tmp_path / "frontier.db")
+    frontier.add(BASE + "s_root", 0)
+    frontier.add(BASE + "s_a", 1, "s_root")
+    frontier.claim()
+    frontier.close()
+
+    frontier = RemixFrontier(tmp_path / "frontier.db")
+    assert frontier.release_claimed() == 1
+    node = frontier.claim()
+    assert node["post_id"] == "s_root"
+    assert node["attempts"] == 1
+
+    # A failing post is retried once, then given up
+    frontier.fail(node["post_id"], "timeout")
+    assert frontier.claim()["post_id"] == "s_root"
+    frontier.fail("s_root", "timeout")
+    assert frontier.counts()["failed"] == 1
+    assert frontier.urls(("failed",)) == [BASE + "s_root"]
@@ -7,6 +7,7 @@ import sys
 import time
 from selenium.webdriver.common.by import By
 from scraper_sora_advanced import SoraScraper
+from remix_navigator import RemixNavigator
 
 def test_remix_extraction(test_url, use_existing=False):
     """Test remix extraction on a sample Sora video page"""
@@ -49,7 +50,9 @@ def test_remix_extraction(test_url, use_existing=False):
         initial_url = scraper.driver.current_url
         
         # Extract remix URLs
-        remix_urls = scraper._find_remix_links(max_load_more_clicks=5)
+        navigator = RemixNavigator(scraper.driver)
+        navigator.load_all_remixes()
+        remix_urls = [url for url in navigator.collect_remix_urls() if url]
         
         # Safety check: verify we're back on the original page
         final_url = scraper.driver.current_url
@@ -11,6 +11,7 @@ import time
 sys.path.insert(0, '/Users/ethan/Desktop/scrapper_sora2')
 
 from scraper_sora_advanced import SoraScraper
+from remix_navigator import RemixNavigator
 
 def test_with_existing_chrome(video_url):
     """Test remix extraction using existing Chrome session"""
@@ -47,7 +48,9 @@ def test_with_existing_chrome(video_url):
         # Extract remixes
         print("📋 Extraction des remixes...")
         print()
-        remix_urls = scraper._find_remix_links(max_load_more_clicks=5)
+        navigator = RemixNavigator(scraper.driver)
+        navigator.load_all_remixes()
+        remix_urls = [url for url in navigator.collect_remix_urls() if url]
         
         print()
         print("=" * 70)